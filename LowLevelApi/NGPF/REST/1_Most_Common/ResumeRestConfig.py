@@ -25,6 +25,11 @@ import json
 import os
 import time
 
+# Reuse the connections to the API server and retry on connection resets.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../RestApi/Python/Modules'))
+from IxNetRestApiTransport import Transport
+restSession = Transport.getSharedSession()
+
 class TestFailedError(Exception): pass
 class Py: pass
 
@@ -53,7 +58,7 @@ def waitForComplete(response, sessionUrl, timeout=90):
         if timeout == 0:
             return 1
         time.sleep(1)
-        response = requests.get(sessionUrl)
+        response = restSession.get(sessionUrl)
         state = response.json()["state"]
         print "\t\tState:", state
         timeout = timeout - 1
@@ -82,7 +87,7 @@ def assignPorts(sessionUrl, portList):
     # Returns 0 if success
     # Returns 1 if failed
     
-    response = requests.get(sessionUrl+'/vport')
+    response = restSession.get(sessionUrl+'/vport')
     if response.status_code != 200:
         return 1
 
@@ -93,7 +98,7 @@ def assignPorts(sessionUrl, portList):
 
     data = {"arg1": [], "arg2": [], "arg3": vportList, "arg4": "true"}
     [data["arg1"].append({"arg1":str(chassis), "arg2":str(card), "arg3":str(port)}) for chassis,card,port in portList] 
-    response = requests.post(sessionUrl+'/operations/assignports',
+    response = restSession.post(sessionUrl+'/operations/assignports',
                              data=json.dumps(data),
                              headers={'content-type': 'application/json'})
     if waitForComplete(response, sessionUrl+'/operations/assignports/'+response.json()['id']) == 1:
@@ -107,11 +112,11 @@ def verifyPortState(sessionUrl):
     # Returns 0 if all ports are up.
     # Returns 1 if any port is down.
 
-    response = requests.get(sessionUrl+'/vport')
+    response = restSession.get(sessionUrl+'/vport')
     vportList = ["%s/vport/%s" % (sessionUrl, str(i["id"])) for i in response.json()]
     for eachVport in vportList:
         for counter in range(0,61):
-            response = requests.get(eachVport)
+            response = restSession.get(eachVport)
             print '\n', eachVport
             print '\t\tVerify Port State:', response.json()['state']
             if counter < 60 and response.json()['state'] == 'down':
@@ -134,7 +139,7 @@ def startAllProtocols(sessionUrl):
     # Returns 1 if failed
 
     print '\nstartAllProtocols'
-    response = requests.post(sessionUrl+'/operations/startallprotocols', data={}, headers={})
+    response = restSession.post(sessionUrl+'/operations/startallprotocols', data={}, headers={})
     if response.status_code == 202:
         return 0
     else:
@@ -147,7 +152,7 @@ def stopAllProtocols(session):
     # Returns 1 if failed
 
     print '\nstopAllProtocols'
-    response = requests.post(sessionUrl+'/operations/stopallprotocols', data={}, headers={})
+    response = restSession.post(sessionUrl+'/operations/stopallprotocols', data={}, headers={})
     if response.status_code == 202:
         return 0
     else:
@@ -181,7 +186,7 @@ def verifyProtocolSessions(protocolObjList, timeout=90):
         print '\nVerifyProtocolSessions: %s\n' % eachProtocol
         for timer in range(1,timerStop+1):
             #response = requests.get(sessionUrl+eachProtocol)
-            response = requests.get(eachProtocol)
+            response = restSession.get(eachProtocol)
             if response.status_code != 200:
                 print 'Failed to get response'
                 continue
@@ -256,29 +261,29 @@ def verifyAllProtocolSessionsNgpf(sessionUrl, timeout=120):
     startCounter = 1
     import time
 
-    response = requests.get(sessionUrl+'/topology')
+    response = restSession.get(sessionUrl+'/topology')
     topologyList = ['%s/%s/%s' % (sessionUrl, 'topology', str(i["id"])) for i in response.json()]
     for topology in topologyList:
-        response = requests.get(topology+'/deviceGroup')
+        response = restSession.get(topology+'/deviceGroup')
         deviceGroupList = ['%s/%s/%s' % (topology, 'deviceGroup', str(i["id"])) for i in response.json()]
         for deviceGroup in deviceGroupList:
-            response = requests.get(deviceGroup+'/ethernet')
+            response = restSession.get(deviceGroup+'/ethernet')
             ethernetList = ['%s/%s/%s' % (deviceGroup, 'ethernet', str(i["id"])) for i in response.json()]
             for ethernet in ethernetList:
-                response = requests.get(ethernet+'/ipv4')
+                response = restSession.get(ethernet+'/ipv4')
                 ipv4List = ['%s/%s/%s' % (ethernet, 'ipv4', str(i["id"])) for i in response.json()]
-                response = requests.get(ethernet+'/ipv6')
+                response = restSession.get(ethernet+'/ipv6')
                 ipv6List = ['%s/%s/%s' % (ethernet, 'ipv6', str(i["id"])) for i in response.json()]
                 for ipv4 in ipv4List+ipv6List:
                     for protocol in protocolList:
-                        response = requests.get(ipv4+'/'+protocol)
+                        response = restSession.get(ipv4+'/'+protocol)
                         if response.json() == [] or 'errors' in response.json():
                             continue
 
                         currentProtocolList = ['%s/%s/%s' % (ipv4, protocol, str(i["id"])) for i in response.json()]
                         for currentProtocol in currentProtocolList:
                             for timer in range(startCounter, timeout+1):
-                                response = requests.get(currentProtocol)
+                                response = restSession.get(currentProtocol)
                                 currentStatus = response.json()['sessionStatus']
                                 print '\n%s' % currentProtocol
                                 print '\tTotal sessions: %d' % len(currentStatus)
@@ -313,7 +318,7 @@ def applyTraffic(sessionUrl):
     # Returns 1 if failed
     
     print '\napplyTraffic:', sessionUrl
-    response = requests.post(sessionUrl+'/traffic/operations/apply',
+    response = restSession.post(sessionUrl+'/traffic/operations/apply',
                              data=json.dumps({'arg1': sessionUrl+'/traffic'}),
                              headers={'content-type': 'application/json'})
     if response.status_code == 202:
@@ -335,16 +340,16 @@ def regenerateAllTrafficItems(sessionUrl):
     # Returns 1 if failed
 
     serverUrl = sessionUrl.split('/api')[0]
-    response = requests.get(sessionUrl + "/traffic/trafficItem")
+    response = restSession.get(sessionUrl + "/traffic/trafficItem")
     trafficItemList = ["%s%s" % (serverUrl, str(i["links"][0]["href"])) for i in response.json()]
     for trafficItem in trafficItemList:
-        response = requests.get(trafficItem)
+        response = restSession.get(trafficItem)
         if response.status_code != 200:
             return 1
 
         if response.json()['enabled'] == True:
             print '\nRegenerating:', trafficItem
-            response = requests.post(trafficItem+"/operations/generate",
+            response = restSession.post(trafficItem+"/operations/generate",
                                      data=json.dumps({"arg1": trafficItem}),
                                      headers={"content-type": "application/json"})
             if response.status_code != 202:
@@ -366,7 +371,7 @@ def startTraffic(sessionUrl):
     # Returns 1 if failed
 
     print '\nstartTraffic:', sessionUrl+'/traffic/operations/start'
-    response = requests.post(sessionUrl+'/traffic/operations/start',
+    response = restSession.post(sessionUrl+'/traffic/operations/start',
                              data=json.dumps({'arg1': sessionUrl+'/traffic'}),
                              headers={'content-type': 'application/json'})
     print response.json()
@@ -382,7 +387,7 @@ def stopTraffic(sessionUrl):
     # Returns 1 if failed
     
     print '\nstopTraffic:', sessionUrl+'/traffic/operations/stop'
-    response = requests.post(sessionUrl+'/traffic/operations/stop',
+    response = restSession.post(sessionUrl+'/traffic/operations/stop',
                              data=json.dumps({'arg1': sessionUrl+'/traffic'}),
                              headers={'content-type': 'application/json'})
     print response.json()
@@ -432,12 +437,12 @@ def getStats(sessionUrl, csvFile=None, csvEnableFileTimestamp=False, viewName='F
     #   Get stats on row 2 for 'Tx Frames' = statDict[2]['Tx Frames']
 
     urlHeadersJson = {'content-type': 'application/json'}
-    viewList = requests.get('%s/%s/%s' % (sessionUrl, 'statistics', 'view'), headers=urlHeadersJson)
+    viewList = restSession.get('%s/%s/%s' % (sessionUrl, 'statistics', 'view'), headers=urlHeadersJson)
     views = ['%s/%s/%s/%s' % (sessionUrl, 'statistics', 'view', str(i['id'])) for i in viewList.json()]
 
     for view in views:
         # GetAttribute
-        response = requests.get('%s' % view, headers=urlHeadersJson)
+        response = restSession.get('%s' % view, headers=urlHeadersJson)
         if response.status_code != 200:
             print '\ngetStats: Failed:', response.text
             return 1
@@ -451,12 +456,12 @@ def getStats(sessionUrl, csvFile=None, csvEnableFileTimestamp=False, viewName='F
             break
 
     try:
-        response = requests.patch(viewObj, data=json.dumps({'enabled': 'true'}), headers=urlHeadersJson)
+        response = restSession.patch(viewObj, data=json.dumps({'enabled': 'true'}), headers=urlHeadersJson)
     except:
         print '\ngetStats error: No stats available'
         return 0
 
-    response = requests.get(viewObj+'/page')
+    response = restSession.get(viewObj+'/page')
     if response.status_code != 200:
         print '\ngetStats: Failed to get total pages'
         return 1
@@ -472,7 +477,7 @@ def getStats(sessionUrl, csvFile=None, csvEnableFileTimestamp=False, viewName='F
             print '\ngetStats failed: Getting total pages'
             return 1
 
-    response = requests.get(viewObj+'/page', '-columnCaptions')
+    response = restSession.get(viewObj+'/page', '-columnCaptions')
     if response.status_code != 200:
         print '\ngetStats: Failed to get statistic column names'
         return 1
@@ -499,7 +504,7 @@ def getStats(sessionUrl, csvFile=None, csvEnableFileTimestamp=False, viewName='F
         csvWriteObj.writerow(columnList)
 
     # Get the stat values
-    response = requests.get(viewObj+'/page')
+    response = restSession.get(viewObj+'/page')
     statValueList = response.json()['pageValues']
 
     statDict = {}
@@ -601,7 +606,7 @@ def enableDisableBgpFlapNgpf(sessionUrl, action='true', upTimeInSec=0, downTimeI
     urlHeadersJson = {'content-type': 'application/json'}
     httpHeader = sessionUrl.split('/api')[0]
     print '\nenableBgpRouteFlapNgpf: Please wait a moment while I query for datas...'
-    response = requests.get(sessionUrl)
+    response = restSession.get(sessionUrl)
     if response.status_code != 200:
         return 1
 
@@ -613,21 +618,21 @@ def enableDisableBgpFlapNgpf(sessionUrl, action='true', upTimeInSec=0, downTimeI
     downTimeInSecsMultivalue = response.json()['downtimeInSec']
 
     print '\nenableDisableBgpFlapNgpf:', action
-    response = requests.patch(httpHeader+flapMultivalue+'/singleValue',
+    response = restSession.patch(httpHeader+flapMultivalue+'/singleValue',
                               data=json.dumps({'value': action}),
                               headers=urlHeadersJson)
     if response.status_code != 200:
         return 1
 
     print 'enableDisableBgpFlapNgpf upTimeInSec:', upTimeInSec
-    response = requests.patch(httpHeader+upTimeInSecsMultivalue+'/singleValue',
+    response = restSession.patch(httpHeader+upTimeInSecsMultivalue+'/singleValue',
                               data=json.dumps({'value': str(upTimeInSec)}),
                               headers=urlHeadersJson)
     if response.status_code != 200:
         return 1
 
     print 'enableDisableBgpFlapNgpf downTimeInSec:', downTimeInSec
-    response = requests.patch(httpHeader+downTimeInSecsMultivalue+'/singleValue',
+    response = restSession.patch(httpHeader+downTimeInSecsMultivalue+'/singleValue',
                               data=json.dumps({'value': str(downTimeInSec)}),
                               headers=urlHeadersJson)
     if response.status_code != 200:
@@ -645,7 +650,7 @@ def startStopIgmpHostNgpf(protocolSessionUrl, action='start'):
     data = {'arg1': [dataUrl]}
     urlHeadersJson = {'content-type': 'application/json'}
     print '\nstartStopIgmpHostNgpf: %s: %s' % (action, protocolSessionUrl)
-    response = requests.post(url, data=json.dumps(data), headers=urlHeadersJson)
+    response = restSession.post(url, data=json.dumps(data), headers=urlHeadersJson)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -664,7 +669,7 @@ def startStopPimV4InterfaceNgpf(protocolSessionUrl, action='start'):
     data = {'arg1': [dataUrl]}
     urlHeadersJson = {'content-type': 'application/json'}
     print '\nstartStopPimV4InterfaceNgpf: %s: %s' % (action, protocolSessionUrl)
-    response = requests.post(url, data=json.dumps(data), headers=urlHeadersJson)
+    response = restSession.post(url, data=json.dumps(data), headers=urlHeadersJson)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -685,7 +690,7 @@ def startStopMldHostNgpf(protocolSessionUrl, action='start'):
     data = {'arg1': [dataUrl]}
     urlHeadersJson = {'content-type': 'application/json'}
     print '\nstartStopMldHostNgpf: %s: %s' % (action, protocolSessionUrl)
-    response = requests.post(url, data=json.dumps(data), headers=urlHeadersJson)
+    response = restSession.post(url, data=json.dumps(data), headers=urlHeadersJson)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -725,7 +730,7 @@ def enableDisableIgmpGroupNgpf(protocolSessionUrl, groupRangeList, action='disab
     urlHeadersJson = {'content-type': 'application/json'}
 
     url = protocolSessionUrl+'/igmpMcastIPv4GroupList'
-    response = requests.get(url)
+    response = restSession.get(url)
     if response.status_code != 200:
         return 1
     # /api/v1/sessions/1/ixnetwork/multivalue/59
@@ -736,7 +741,7 @@ def enableDisableIgmpGroupNgpf(protocolSessionUrl, groupRangeList, action='disab
     activeMultivalue = response.json()['active']
 
     # Getting the list of Group Range IP addresses.
-    response = requests.get(httpHeader+groupRangeAddressMultivalue)
+    response = restSession.get(httpHeader+groupRangeAddressMultivalue)
     if response.status_code != 200:
         return 1
 
@@ -760,7 +765,7 @@ def enableDisableIgmpGroupNgpf(protocolSessionUrl, groupRangeList, action='disab
         # http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/multivalue/5/overlay
         # NOTE:  Index IS NOT zero based.
         print 'enableDisableIgmpGroupNgpf: %s: %s' % (action, groupRangeValues[index]) 
-        response = requests.post(currentOverlayUrl, 
+        response = restSession.post(currentOverlayUrl, 
                                  data=json.dumps({'index': index+1, 'value': enableDisable}),
                                  headers=urlHeadersJson)
         if response.status_code != 201:
@@ -803,7 +808,7 @@ def enableDisableMldGroupNgpf(protocolSessionUrl, groupRangeList, action='disabl
 
     #url = protocolSessionUrl+'/igmpMcastIPv4GroupList'
     url = protocolSessionUrl+'/mldMcastIPv6GroupList'
-    response = requests.get(url)
+    response = restSession.get(url)
     if response.status_code != 200:
         return 1
     # /api/v1/sessions/1/ixnetwork/multivalue/59
@@ -814,7 +819,7 @@ def enableDisableMldGroupNgpf(protocolSessionUrl, groupRangeList, action='disabl
     activeMultivalue = response.json()['active']
 
     # Getting the list of Group Range IP addresses.
-    response = requests.get(httpHeader+groupRangeAddressMultivalue)
+    response = restSession.get(httpHeader+groupRangeAddressMultivalue)
     if response.status_code != 200:
         return 1
 
@@ -838,7 +843,7 @@ def enableDisableMldGroupNgpf(protocolSessionUrl, groupRangeList, action='disabl
         # http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/multivalue/5/overlay
         # NOTE:  Index IS NOT zero based.
         print 'enableDisableMldGroupNgpf: %s: %s' % (action, groupRangeValues[index]) 
-        response = requests.post(currentOverlayUrl, 
+        response = restSession.post(currentOverlayUrl, 
                                  data=json.dumps({'index': index+1, 'value': enableDisable}),
                                  headers=urlHeadersJson)
         if response.status_code != 201:
@@ -859,12 +864,12 @@ def sendIgmpJoinNgpf_backup(sessionUrl, multicastIpAddress):
     jsonHeader = {'content-type': 'application/json'}
     
     # 1> Based on the list of multicastIpAddress, get all their indexes.
-    response = requests.get(sessionUrl+'/igmpMcastIPv4GroupList')
+    response = restSession.get(sessionUrl+'/igmpMcastIPv4GroupList')
     if response.status_code != 200:
         return 1
     startMcastAddrMultivalue = response.json()['startMcastAddr']
     
-    response = requests.get(httpHeader+startMcastAddrMultivalue)
+    response = restSession.get(httpHeader+startMcastAddrMultivalue)
     if response.status_code != 200:
         return 1
     listOfConfiguredMcastIpAddresses = response.json()['values']
@@ -889,7 +894,7 @@ def sendIgmpJoinNgpf_backup(sessionUrl, multicastIpAddress):
 
     print '\nsendIgmpJoinNgpf:', url
     print '\t', multicastIpAddress
-    response = requests.post(url, data=json.dumps(data), headers=jsonHeader)
+    response = restSession.post(url, data=json.dumps(data), headers=jsonHeader)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1020,10 +1025,10 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
     #        Get a list of igmpHost objects (This becomes the current sessionUrl).
 
     if 'portName' in kwargs or 'hostIp' in kwargs:
-        response = requests.get(kwargs['sessionUrl']+'/topology')
+        response = restSession.get(kwargs['sessionUrl']+'/topology')
         topologyList = ['%s/%s/%s' % (kwargs['sessionUrl'], 'topology', str(i["id"])) for i in response.json()]
         for topology in topologyList:
-            response = requests.get(topology)
+            response = restSession.get(topology)
             if response.status_code != 200:
                 return 1
             vportList = response.json()['vports']
@@ -1031,30 +1036,30 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
                 print 'Error: No vport is created'
                 return 1
             for vport in vportList:
-                response = requests.get(httpHeader+vport)
+                response = restSession.get(httpHeader+vport)
                 if response.status_code != 200:
                     print 'Error: Get vport status code:', response.status_code
                     return 1
                 currentVportName = response.json()['name']
-                response = requests.get(topology+'/deviceGroup')
+                response = restSession.get(topology+'/deviceGroup')
                 deviceGroupList = ['%s/%s/%s' % (topology, 'deviceGroup', str(i["id"])) for i in response.json()]
                 for deviceGroup in deviceGroupList:
-                    response = requests.get(deviceGroup+'/ethernet')
+                    response = restSession.get(deviceGroup+'/ethernet')
                     ethernetList = ['%s/%s/%s' % (deviceGroup, 'ethernet', str(i["id"])) for i in response.json()]
                     for ethernet in ethernetList:
-                        response = requests.get(ethernet+'/ipv4')
+                        response = restSession.get(ethernet+'/ipv4')
                         configuredIpv4ObjList = ['%s/%s/%s' % (ethernet, 'ipv4', str(i["id"])) for i in response.json()]
-                        response = requests.get(ethernet+'/ipv6')
+                        response = restSession.get(ethernet+'/ipv6')
                         configuredIpv6ObjList = ['%s/%s/%s' % (ethernet, 'ipv6', str(i["id"])) for i in response.json()]
 
                         for layer3IpObj in (configuredIpv4ObjList + configuredIpv6ObjList):
-                            response = requests.get(layer3IpObj)
+                            response = restSession.get(layer3IpObj)
                             if response.status_code != 200:
                                 print 'Error: GET:', layer3IpObj
                                 print 'Error: Status code failed', response.status_code
                                 return 1
                             currentIpAddrMultivalue = response.json()['address']
-                            response = requests.get(httpHeader + currentIpAddrMultivalue)
+                            response = restSession.get(httpHeader + currentIpAddrMultivalue)
                             if response.status_code != 200:
                                 print 'Error: GET:', layer3IpObj
                                 print 'Error: Status code failed:', response.status_code
@@ -1062,7 +1067,7 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
                             configuredIpAddresses = response.json()['values']
                             if 'hostIp' in kwargs and kwargs['hostIp'] not in configuredIpAddresses:
                                 continue
-                            response = requests.get(layer3IpObj+'/igmpHost')
+                            response = restSession.get(layer3IpObj+'/igmpHost')
                             if response.status_code != 200:
                                 # Ignore status code failures here because it is expected that
                                 # not all layer3 objects have igmpHost configured.
@@ -1106,7 +1111,7 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
     #       to get all the indexes.
     #     - Send join|leave using igmpHost object with list of indexes.
 
-    response = requests.get(protocolHostObj)
+    response = restSession.get(protocolHostObj)
     if response.status_code != 200:
         return 1
     if response.json()['sessionStatus'][0] == 'notStarted':
@@ -1115,7 +1120,7 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
 
     # 1> Based on the list of groupRangeList, get all their indexes.
     if 'groupRangeList' in kwargs:
-        response = requests.get(protocolHostObj+'/igmpMcastIPv4GroupList')
+        response = restSession.get(protocolHostObj+'/igmpMcastIPv4GroupList')
         if response.status_code != 200:
             return 1
         startAddrMultivalue = response.json()['startMcastAddr']
@@ -1123,14 +1128,14 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
         addrCntMultivalue = response.json()['mcastAddrCnt']
 
     if 'sourceRangeList' in kwargs:
-        response = requests.get(protocolHostObj+'/igmpMcastIPv4GroupList/igmpUcastIPv4SourceList')
+        response = restSession.get(protocolHostObj+'/igmpMcastIPv4GroupList/igmpUcastIPv4SourceList')
         if response.status_code != 200:
             return 1
         startAddrMultivalue = response.json()['startUcastAddr']
         incrAddrMultivalue = response.json()['ucastAddrIncr']
         addrCntMultivalue = response.json()['ucastSrcAddrCnt']
 
-    response = requests.get(httpHeader + startAddrMultivalue)
+    response = restSession.get(httpHeader + startAddrMultivalue)
     if response.status_code != 200:
         return 1
 
@@ -1167,13 +1172,13 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
             return 1
 
     # Get the multicast group increment
-    response = requests.get(httpHeader + incrAddrMultivalue)
+    response = restSession.get(httpHeader + incrAddrMultivalue)
     if response.status_code != 200:
         return 1
     mcastIncrValueList = response.json()['values']
 
     # Get the multicast group total count
-    response = requests.get(httpHeader + addrCntMultivalue)
+    response = restSession.get(httpHeader + addrCntMultivalue)
     if response.status_code != 200:
         return 1
     mcastGroupCountValueList = response.json()['values']
@@ -1217,7 +1222,7 @@ def sendIgmpJoinOrLeaveNgpf(**kwargs):
         data = {'arg1': [protocolHostObj+'/igmpMcastIPv4GroupList'], 'arg2': indexListToSend}
         print '\nURL:', url
         print '\nDATA:', data
-        response = requests.post(url, data=json.dumps(data), headers=jsonHeader)
+        response = restSession.post(url, data=json.dumps(data), headers=jsonHeader)
         if response.status_code != 202:
             return 1
         if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1240,12 +1245,12 @@ def sendIgmpJoinNgpf_backup(sessionUrl, multicastIpAddress):
     jsonHeader = {'content-type': 'application/json'}
     
     # 1> Based on the list of multicastIpAddress, get all their indexes.
-    response = requests.get(sessionUrl+'/igmpMcastIPv4GroupList')
+    response = restSession.get(sessionUrl+'/igmpMcastIPv4GroupList')
     if response.status_code != 200:
         return 1
     startMcastAddrMultivalue = response.json()['startMcastAddr']
     
-    response = requests.get(httpHeader+startMcastAddrMultivalue)
+    response = restSession.get(httpHeader+startMcastAddrMultivalue)
     if response.status_code != 200:
         return 1
     listOfConfiguredMcastIpAddresses = response.json()['values']
@@ -1270,7 +1275,7 @@ def sendIgmpJoinNgpf_backup(sessionUrl, multicastIpAddress):
 
     print '\nsendIgmpJoinNgpf:', url
     print '\t', multicastIpAddress
-    response = requests.post(url, data=json.dumps(data), headers=jsonHeader)
+    response = restSession.post(url, data=json.dumps(data), headers=jsonHeader)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1291,12 +1296,12 @@ def sendIgmpLeaveNgpf(sessionUrl, multicastIpAddress):
     jsonHeader = {'content-type': 'application/json'}
     
     # 1> Based on the list of multicastIpAddress, get all their indexes.
-    response = requests.get(sessionUrl+'/igmpMcastIPv4GroupList')
+    response = restSession.get(sessionUrl+'/igmpMcastIPv4GroupList')
     if response.status_code != 200:
         return 1
     startMcastAddrMultivalue = response.json()['startMcastAddr']
     
-    response = requests.get(httpHeader+startMcastAddrMultivalue)
+    response = restSession.get(httpHeader+startMcastAddrMultivalue)
     if response.status_code != 200:
         return 1
     listOfConfiguredMcastIpAddresses = response.json()['values']
@@ -1321,7 +1326,7 @@ def sendIgmpLeaveNgpf(sessionUrl, multicastIpAddress):
 
     print '\nsendIgmpLeaveNgpf:', url
     print '\t', multicastIpAddress
-    response = requests.post(url, data=json.dumps(data), headers=jsonHeader)
+    response = restSession.post(url, data=json.dumps(data), headers=jsonHeader)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1342,7 +1347,7 @@ def sendPimV4JoinNgpf(sessionUrl):
     urlHeadersJson = {'content-type': 'application/json'}
 
     print '\nsendPimV4JoinNgpf:', url
-    response = requests.post(url, data=json.dumps(data), headers=urlHeadersJson)
+    response = restSession.post(url, data=json.dumps(data), headers=urlHeadersJson)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1363,7 +1368,7 @@ def sendPimV4LeaveNgpf(sessionUrl):
     urlHeadersJson = {'content-type': 'application/json'}
 
     print '\nsendPimV4LeaveNgpf:', url
-    response = requests.post(url, data=json.dumps(data), headers=urlHeadersJson)
+    response = restSession.post(url, data=json.dumps(data), headers=urlHeadersJson)
     if response.status_code != 202:
         return 1
     if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1385,7 +1390,7 @@ def sendMldJoinNgpf(sessionUrl, ipv6AddressList):
 
     # Loop all port objects to get user specified IPv6 address to send the join.
     portObjectList = sessionUrl+'/mldMcastIPv6GroupList/port'
-    response = requests.get(portObjectList)
+    response = restSession.get(portObjectList)
     if response.status_code != 200:
         return
 
@@ -1395,7 +1400,7 @@ def sendMldJoinNgpf(sessionUrl, ipv6AddressList):
         startMcastAddrMultivalue = eachPortIdDetails['startMcastAddr']
 
         # Go to the multivalue and get the 'values'
-        response = requests.get(httpHeader+startMcastAddrMultivalue)
+        response = restSession.get(httpHeader+startMcastAddrMultivalue)
         if response.status_code != 200:
             return 1
 
@@ -1413,7 +1418,7 @@ def sendMldJoinNgpf(sessionUrl, ipv6AddressList):
                 url = sessionUrl+'/mldMcastIPv6GroupList/port/%s/operations/mldjoingroup' % currentPortId
                 portIdObj = sessionUrl+'/mldMcastIPv6GroupList/port/%s' % currentPortId
                 # portIdObj = http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1/ethernet/1/ipv6/2/mldHost/1/mldMcastIPv6GroupList/port/1
-                response = requests.post(url, data=json.dumps({'arg1': [portIdObj]}), headers=jsonHeader)
+                response = restSession.post(url, data=json.dumps({'arg1': [portIdObj]}), headers=jsonHeader)
                 if response.status_code != 202:
                     return 1
                 if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1437,7 +1442,7 @@ def sendMldLeaveNgpf(sessionUrl, ipv6AddressList):
 
     # Loop all port objects to get user specified IPv6 address to send the leave.
     portObjectList = sessionUrl+'/mldMcastIPv6GroupList/port'
-    response = requests.get(portObjectList)
+    response = restSession.get(portObjectList)
     if response.status_code != 200:
         return
 
@@ -1447,7 +1452,7 @@ def sendMldLeaveNgpf(sessionUrl, ipv6AddressList):
         startMcastAddrMultivalue = eachPortIdDetails['startMcastAddr']
 
         # Go to the multivalue and get the 'values'
-        response = requests.get(httpHeader+startMcastAddrMultivalue)
+        response = restSession.get(httpHeader+startMcastAddrMultivalue)
         if response.status_code != 200:
             return 1
 
@@ -1465,7 +1470,7 @@ def sendMldLeaveNgpf(sessionUrl, ipv6AddressList):
                 url = sessionUrl+'/mldMcastIPv6GroupList/port/%s/operations/mldleavegroup' % currentPortId
                 portIdObj = sessionUrl+'/mldMcastIPv6GroupList/port/%s' % currentPortId
                 # portIdObj = http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1/ethernet/1/ipv6/2/mldHost/1/mldMcastIPv6GroupList/port/1
-                response = requests.post(url, data=json.dumps({'arg1': [portIdObj]}), headers=jsonHeader)
+                response = restSession.post(url, data=json.dumps({'arg1': [portIdObj]}), headers=jsonHeader)
                 if response.status_code != 202:
                     return 1
                 if waitForComplete(response, url+response.json()['id']) == 1:
@@ -1480,7 +1485,7 @@ def prettyPrintAllOperations(sessionUrl, searchPath='/operations'):
     #    http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/operations
 
     #response = requests.get(sessionUrl+'/operations')
-    response = requests.get(sessionUrl+searchPath)
+    response = restSession.get(sessionUrl+searchPath)
     for item in response.json():
         if 'operation' in item.keys():
             print '\n', item['operation']
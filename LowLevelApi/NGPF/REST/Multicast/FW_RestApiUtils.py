@@ -54,12 +54,17 @@
 import time
 #import requests
 import json
-import httplib2
 from urllib import urlencode
 
+import os
 import sys
 import zipfile
 
+# Reuse the connections to the API server and retry on connection resets.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../RestApi/Python/Modules'))
+from IxNetRestApiTransport import Transport
+restSession = Transport.getSharedSession()
+
 class TestFailedError(Exception): pass
 
 #######################################################
@@ -71,7 +76,7 @@ def getIxNetSessionsList(ixnetUrl):
         sessionsUrl = ixnetUrl+"sessions"
         print "GET: " + sessionsUrl
         urlHeadersJson = {'content-type': 'application/json'}
-        response = requests.get(sessionsUrl, headers=urlHeadersJson)
+        response = restSession.get(sessionsUrl, headers=urlHeadersJson)
         responseList = response.json()
     except Exception, e:
         raise Exception('Got an error code: ', e)
@@ -89,15 +94,15 @@ def getIxNetSessions(ixnetUrl):
     print "[getIxNetSessions] + " + ixnetUrl
         
     try:
-        h = httplib2.Http()
         sessionsUrl = ixnetUrl+"sessions"
         print "GET: " + sessionsUrl
         urlHeadersJson = {'content-type': 'application/json'}
         #response = requests.get(sessionsUrl, headers=urlHeadersJson)
-        response, content = h.request(sessionsUrl,'GET','',urlHeadersJson)
+        response = restSession.get(sessionsUrl, headers=urlHeadersJson)
+        content = response.content
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(content.json()['errors'])
     return json.loads(content)
     
@@ -111,7 +116,7 @@ def addIxNetObjectFromSession(sessionUrl, obj, waitComplete=False):
         addPortUrl = sessionUrl + obj
         print "POST: " + addPortUrl
         urlHeadersJson = {'content-type': 'application/json'}
-        response = requests.post(addPortUrl, headers=urlHeadersJson)
+        response = restSession.post(addPortUrl, headers=urlHeadersJson)
         if waitComplete:
             waitForComplete(sessionUrl, response)
     except Exception, e:
@@ -130,17 +135,18 @@ def addIxNetObjectFromSession(sessionUrl, obj, waitComplete=False):
 #######################################################
 def addIxNetObject(inputUrl, obj, payload=None):
     try:
-        h = httplib2.Http()
         rawUrl = inputUrl + "/" + obj
         print "POST: " + rawUrl
         urlHeadersJson = {'content-type': 'application/json'}
         if payload == None:
-            response, content = h.request(rawUrl,'POST','',urlHeadersJson)
+            response = restSession.post(rawUrl, headers=urlHeadersJson)
+            content = response.content
         else:
-            response, content = h.request(rawUrl,'POST',json.dumps(payload),urlHeadersJson)
+            response = restSession.post(rawUrl, data=json.dumps(payload), headers=urlHeadersJson)
+            content = response.content
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
         
     objLists = json.loads(content)
@@ -153,13 +159,13 @@ def addIxNetObject(inputUrl, obj, payload=None):
 #######################################################
 def removeIxNetObject(deleteUrl):
     try:
-        h = httplib2.Http()
         #response = requests.delete(deleteUrl)
-        response, content = h.request(deleteUrl,'DELETE')
+        response = restSession.delete(deleteUrl)
+        content = response.content
         print "DELETE: " + deleteUrl
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     return content
 
@@ -169,14 +175,14 @@ def removeIxNetObject(deleteUrl):
 #######################################################
 def getIxNetPorts(sessionUrl):
     try:
-        h = httplib2.Http()
         getPortsUrl = sessionUrl + "/vport"
         print "GET: " + getPortsUrl
         # response = requests.get(getPortsUrl)
-        response, content = h.request(getPortsUrl,'GET')
+        response = restSession.get(getPortsUrl)
+        content = response.content
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     return content
 
@@ -189,7 +195,7 @@ def ixNetAddNewPort(sessionUrl):
         addPortUrl = sessionUrl+ "/vport"
         print "POST: " + addPortUrl
         urlHeadersJson = {'content-type': 'application/json'}
-        response = requests.post(addPortUrl, headers=urlHeadersJson)
+        response = restSession.post(addPortUrl, headers=urlHeadersJson)
     except Exception, e:
         raise Exception('Got an error code: ', e)
     if not response.ok:
@@ -204,7 +210,7 @@ def ixNetAddNewPort(sessionUrl):
 #######################################################
 def getIxNetHelp(ixnetUrl, sessionId, urlObj):
     try:
-        response = requests.options(ixnetUrl+"sessions/"+str(sessionId)+"/ixnetwork" + urlObj)
+        response = restSession.options(ixnetUrl+"sessions/"+str(sessionId)+"/ixnetwork" + urlObj)
     except Exception, e:
         raise Exception('Got an error code: ', e)
     if not response.ok:
@@ -220,21 +226,22 @@ def getIxNetHelp(ixnetUrl, sessionId, urlObj):
 #######################################################
 def ixNetDirectExec(objUrl, execName, payload=None):
     try:
-        h = httplib2.Http()
         urlString = objUrl + "/"+execName
         urlHeadersJson = {'content-type': 'application/json'}
         if payload == None:
             print "POST: " + urlString
             #response = requests.post(url=urlString, headers=urlHeadersJson)
-            response, content = h.request(urlString,'POST','',urlHeadersJson)
+            response = restSession.post(urlString, headers=urlHeadersJson)
+            content = response.content
         else:
             print "POST: " + urlString + "  <-- Payload: " + str(payload)
             # response = requests.post(url=urlString, headers=urlHeadersJson, data=json.dumps(payload))
-            response, content = h.request(urlString,'POST',json.dumps(payload),urlHeadersJson)
+            response = restSession.post(urlString, data=json.dumps(payload), headers=urlHeadersJson)
+            content = response.content
         waitForComplete(objUrl, content)
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     return content
 
@@ -244,21 +251,22 @@ def ixNetDirectExec(objUrl, execName, payload=None):
 #######################################################
 def ixNetExec(objUrl, execName, payload=None):
     try:
-        h = httplib2.Http()
         urlString = objUrl + "/operations/"+execName
         urlHeadersJson = {'content-type': 'application/json'}
         if payload == None:
             print "POST: " + urlString
             #response = requests.post(url=urlString, headers=urlHeadersJson)
-            response, content = h.request(urlString,'POST','',urlHeadersJson)
+            response = restSession.post(urlString, headers=urlHeadersJson)
+            content = response.content
         else:
             print "POST: " + urlString + "  <-- Payload: " + str(payload)
             #response = requests.post(url=urlString, headers=urlHeadersJson, data=json.dumps(payload))
-            response, content = h.request(urlString,'POST',json.dumps(payload),urlHeadersJson)
+            response = restSession.post(urlString, data=json.dumps(payload), headers=urlHeadersJson)
+            content = response.content
         waitForComplete(objUrl, content)
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(response.json()['errors'])
     return content
     
@@ -299,7 +307,6 @@ def waitForComplete(sessionUrl, requestSess, timeout=180):
 # py.ports        = [('10.205.11.22', '3', '15'), ('10.205.11.22', '3', '16')]
 def ixNetAssignPorts(sessionUrl, realPorts):
     try:
-        h = httplib2.Http()
         print "Assign Multiple Ports at once"
         urlString = sessionUrl+ "/operations/assignports"
         urlHeadersJson = {'content-type': 'application/json'}
@@ -329,13 +336,14 @@ def ixNetAssignPorts(sessionUrl, realPorts):
         print "POST: " + urlString + " <--- DATA: " + str(datas)
         # response = requests.post(url=urlString, data=json.dumps(datas), headers=urlHeadersJson)
         
-        response, content = h.request(urlString,'POST',json.dumps(datas),urlHeadersJson)
+        response = restSession.post(urlString, data=json.dumps(datas), headers=urlHeadersJson)
+        content = response.content
         # wait for COMPLETE
         waitForComplete(sessionUrl, content)
         print ""
     except Exception, e:
         raise TestFailedError (str(e))
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     print "Ports Assign Complete"
 
@@ -356,7 +364,7 @@ def ixNetAssignPort(sessionUrl, vportId, realPort):
                         "arg3": ["/api/v1/sessions/"+str(sessionId)+"/ixnetwork/vport/" + str(vportId)], \
                         "arg4": "true"}
         print "POST: " + urlString + " <--- DATA: " + str(dataJson)
-        response = requests.post(url=urlString, data=json.dumps(dataJson), headers=urlHeadersJson)
+        response = restSession.post(url=urlString, data=json.dumps(dataJson), headers=urlHeadersJson)
         waitForComplete(sessionUrl, response)
         return response
     except Exception, e:
@@ -374,14 +382,14 @@ def ixNetAssignPort(sessionUrl, vportId, realPort):
 #######################################################
 def ixNetSetAttFromSession(sessionUrl, obj, att):
     try:
-        h = httplib2.Http()
         urlString = sessionUrl + obj
         print "POST: " + urlString + " <-- Attribute: " + str(att)
         urlHeadersJson = {'content-type': 'application/json'}
-        response, content = h.request(urlString,'PATCH',json.dumps(att),urlHeadersJson)
+        response = restSession.patch(urlString, data=json.dumps(att), headers=urlHeadersJson)
+        content = response.content
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     return response
 
@@ -394,13 +402,13 @@ def ixNetSetAttFromSession(sessionUrl, obj, att):
 #######################################################
 def ixNetSetAtt(urlString, att):
     try:
-        h = httplib2.Http()
         print "PATCH: " + urlString + " <-- Attribute: " + str(att)
         urlHeadersJson = {'content-type': 'application/json'}
-        response, content = h.request(urlString,'PATCH',json.dumps(att),urlHeadersJson)
+        response = restSession.patch(urlString, data=json.dumps(att), headers=urlHeadersJson)
+        content = response.content
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     return response
 
@@ -412,14 +420,14 @@ def ixNetSetAtt(urlString, att):
 #######################################################
 def ixNetCheckAtt(urlString, atts):
     try:
-        h = httplib2.Http()
         print "GET: " + urlString + " <-- Attributes to check: " + str(atts)
         urlHeadersJson = {'content-type': 'application/json'}
         # response = requests.get(url=urlString, headers=urlHeadersJson)
-        response, content = h.request(urlString,'GET','',urlHeadersJson)
+        response = restSession.get(urlString, headers=urlHeadersJson)
+        content = response.content
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     reqAtt = json.loads(content)
     
@@ -434,15 +442,15 @@ def ixNetCheckAtt(urlString, atts):
 #######################################################
 def ixNetGetAttFromSession(sessionUrl, obj, att ):
     try:
-        h = httplib2.Http()
         getAttUrl = sessionUrl + obj
         print "GET: " + getAttUrl
-        response, content = h.request(getAttUrl,'GET')
+        response = restSession.get(getAttUrl)
+        content = response.content
         res = json.loads(content)
         return res[att]
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     return res[att]
 
@@ -452,16 +460,16 @@ def ixNetGetAttFromSession(sessionUrl, obj, att ):
 #######################################################
 def ixNetGetAtt(getAttUrl, att, logging=True ):
     try:
-        h = httplib2.Http()
         if logging:
             print "GET: " + getAttUrl
         #response = requests.get(getAttUrl)
-        response, content = h.request(getAttUrl,'GET')
+        response = restSession.get(getAttUrl)
+        content = response.content
         res = json.loads(content)
         # return res[att]
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     attUrl = res[att]
     return attUrl
@@ -475,7 +483,7 @@ def ixNetGetList(ixNetSessionUrl, list):
     try:
         listUrl = ixNetSessionUrl + "/" + list
         print "GET: " + listUrl
-        response = requests.get(listUrl)
+        response = restSession.get(listUrl)
     except Exception, e:
         raise Exception('Got an error code: ', e)
     if not response.ok:
@@ -505,7 +513,7 @@ def getVports(ixNetSessionUrl):
     try:
         portsUrl = ixNetSessionUrl + "/vport"
         print "GET: " + portsUrl
-        response = requests.get(portsUrl)
+        response = restSession.get(portsUrl)
         res = response.json()
         # return res[att]
     except Exception, e:
@@ -522,15 +530,15 @@ def getVports(ixNetSessionUrl):
 #######################################################
 def ixNetGetAttUrl(getAttUrl, att ):
     try:
-        h = httplib2.Http()
         print "GET: " + getAttUrl
         # response = requests.get(getAttUrl)
-        response, content = h.request(getAttUrl,'GET')
+        response = restSession.get(getAttUrl)
+        content = response.content
         res = json.loads(content)
         # return res[att]
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     attUrl = getAttUrl.split("/api/v1/")[0] + res[att]
     return attUrl
@@ -541,14 +549,14 @@ def ixNetGetAttUrl(getAttUrl, att ):
 #######################################################
 def getMultiValueFromUrl(baseUrl, pattern):
     try:
-        h = httplib2.Http()
         print "GET: " + baseUrl
         ixnetUrl = baseUrl.split("/api/v1/")[0]
         # response = requests.get(baseUrl)
-        response, content = h.request(baseUrl,'GET')
+        response = restSession.get(baseUrl)
+        content = response.content
     except Exception, e:
         raise Exception('Got an error code: ', e)
-    if response.status != 200 :
+    if response.status_code != 200 :
         raise TestFailedError(json.loads(content)['errors'])
     links = json.loads(content)
     for link in links["links"]:
@@ -606,13 +614,13 @@ def ixNetLoadConfig(ixNetSessionUrl, configName):
     urlHeadersData = {'content-type': 'application/octet-stream','content-length': len(configContent)}
 
     # send the config to server files location
-    r = requests.post(uploadUrl, headers=urlHeadersData, data=configContent)
+    r = restSession.post(uploadUrl, headers=urlHeadersData, data=configContent)
 
     if configName in r.text:
         print "IxNetwork config uploaded Correctly, now loading the config"
         dataJson = {'filename': configName}
         loadConfigUrl = ixNetSessionUrl + '/operations/loadConfig'
-        r = requests.post(url=loadConfigUrl, data=json.dumps(dataJson), headers=urlHeadersJson)
+        r = restSession.post(url=loadConfigUrl, data=json.dumps(dataJson), headers=urlHeadersJson)
         responseCode = str(r)
         if "Response [200]" not in responseCode:
             print r.text
@@ -11,7 +11,8 @@
 #
 
 from __future__ import absolute_import, print_function, division
-import os, re, sys, requests, json, time, subprocess, traceback, time, datetime, platform
+import os, re, sys, requests, json, time, subprocess, traceback, time, datetime, platform, logging, logging.handlers, atexit
+from IxNetRestApiTransport import Transport
 
 class IxNetRestApiException(Exception):
     def __init__(self, msg=None):
@@ -26,20 +27,284 @@ class IxNetRestApiException(Exception):
 
         showErrorMsg = '\nIxNetRestApiException error: {0}\n\n'.format(msg)
         print(showErrorMsg)
-        if Connect.enableDebugLogFile:
-            with open(Connect.debugLogFile, 'a') as restLogFile:
-                restLogFile.write(showErrorMsg)
+        if Connect.debugLogger is not None:
+            # Through the log file writer so that the lines stay in order.
+            Connect.debugLogger.error(showErrorMsg, extra={'logFileOnly': True})
+
+class OperationWaiter(object):
+    def __init__(self, ixnObj=None, initialInterval=0.01, maxInterval=1, backoffFactor=2):
+        """
+        Description
+           Wait for /operations to complete and for conditions to become true by polling
+           with an adaptive schedule.
+           Polling starts in milliseconds so that fast operations such as query and getValues
+           return right away, then backs off exponentially up to maxInterval so that slow
+           operations don't hammer the API server.
+
+        Parameters
+           ixnObj: (Object): The main Connect object.
+           initialInterval: (float): The first poll interval in seconds.
+           maxInterval: (float): The maximum poll interval in seconds.
+           backoffFactor: (float): Each poll interval is multiplied by this factor.
+        """
+        self.ixnObj = ixnObj
+        self.initialInterval = initialInterval
+        self.maxInterval = maxInterval
+        self.backoffFactor = backoffFactor
+
+        # The time spent in each waitFor condition: {description: {'count':, 'ready':, 'totalTime':, 'maxTime':, 'polls':}}
+        self.waitMetrics = {}
+
+    def pollIntervals(self, timeout, initialInterval=None, maxInterval=None):
+        """
+        Description
+           A generator that sleeps the next poll interval and yields the elapsed time in seconds.
+           It stops when the deadline is reached.
+
+        Parameters
+           timeout: (int): The deadline in seconds.
+           initialInterval: (float): The first poll interval. Defaults to self.initialInterval.
+           maxInterval: (float): The maximum poll interval. Defaults to self.maxInterval.
+        """
+        if initialInterval is None:
+            initialInterval = self.initialInterval
+        if maxInterval is None:
+            maxInterval = self.maxInterval
+
+        startTime = time.time()
+        deadline = startTime + timeout
+        interval = initialInterval
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoffFactor, maxInterval)
+            yield time.time() - startTime
+
+    def waitFor(self, predicate, timeout=90, description=None, initialInterval=0.1, maxInterval=None,
+                cancelEvent=None, ignoreException=False):
+        """
+        Description
+           Wait for a condition to become true.
+           The predicate is called right away, then on each adaptive poll interval until it returns
+           a true value or the deadline is reached.
+
+        Parameters
+           predicate: (function): A function without parameters that returns a true value when ready.
+                                  It may raise IxNetRestApiException to fail the wait right away.
+           timeout: (int): The deadline in seconds.
+           description: (str): The condition name in the timeout error and in the wait metrics.
+           initialInterval: (float): The first poll interval in seconds.
+           maxInterval: (float): The maximum poll interval in seconds. Defaults to self.maxInterval.
+           cancelEvent: (threading.Event): Stop waiting with an exception when the event is set.
+           ignoreException: (bool): True: Return None on timeout instead of raising an exception.
+
+        Return
+           The true value returned by the predicate.
+
+        Example
+           mainObj.waitFor(lambda: mainObj.get(url, silentMode=True).json()['state'] == 'up',
+                           timeout=60, description='Port up')
+        """
+        return self.waitForAll([(description, predicate)], timeout=timeout, initialInterval=initialInterval,
+                               maxInterval=maxInterval, cancelEvent=cancelEvent, ignoreException=ignoreException)[0]
+
+    def waitForAll(self, conditionList, timeout=90, initialInterval=0.1, maxInterval=None, cancelEvent=None,
+                   ignoreException=False):
+        """
+        Description
+           Wait for many conditions at once. The pending conditions are all polled on each
+           interval and share the same deadline, so the total wait is the slowest condition
+           instead of the sum of all of them.
+
+        Parameters
+           conditionList: (list): [(description, predicate), ...]. See waitFor.
+           timeout: (int): The deadline in seconds shared by all the conditions.
+           initialInterval: (float): The first poll interval in seconds.
+           maxInterval: (float): The maximum poll interval in seconds. Defaults to self.maxInterval.
+           cancelEvent: (threading.Event): Stop waiting with an exception when the event is set.
+           ignoreException: (bool): True: Return None for the conditions that timed out instead of raising an exception.
+
+        Return
+           A list of the predicate values in the same order as the conditionList.
+        """
+        startTime = time.time()
+        results = [None] * len(conditionList)
+        pending = list(range(len(conditionList)))
+        polls = [0]
+
+        def pollPending():
+            polls[0] += 1
+            for index in list(pending):
+                value = conditionList[index][1]()
+                if value:
+                    results[index] = value
+                    pending.remove(index)
+                    self._addWaitMetric(conditionList[index][0], time.time() - startTime, polls[0], True)
+
+        pollPending()
+        if pending:
+            for elapsed in self.pollIntervals(timeout, initialInterval=initialInterval, maxInterval=maxInterval):
+                if cancelEvent is not None and cancelEvent.is_set():
+                    raise IxNetRestApiException('waitFor: Cancelled after {0:.2f} seconds waiting for: {1}'.format(
+                        elapsed, [conditionList[index][0] for index in pending]))
+
+                pollPending()
+                if pending == []:
+                    break
+
+        if pending == []:
+            return results
+
+        for index in pending:
+            self._addWaitMetric(conditionList[index][0], time.time() - startTime, polls[0], False)
+
+        if ignoreException:
+            return results
+
+        raise IxNetRestApiException('waitFor: Timed out after {0} seconds waiting for: {1}'.format(
+            timeout, [conditionList[index][0] for index in pending]))
+
+    def _addWaitMetric(self, description, elapsed, polls, ready):
+        metric = self.waitMetrics.setdefault(str(description), {'count': 0, 'ready': 0, 'totalTime': 0,
+                                                                'maxTime': 0, 'polls': 0})
+        metric['count'] += 1
+        metric['ready'] += int(ready)
+        metric['totalTime'] += elapsed
+        metric['maxTime'] = max(metric['maxTime'], elapsed)
+        metric['polls'] += polls
+
+    def wait(self, operationList, timeout=90, silentMode=True, ignoreException=False):
+        """
+        Description
+           Wait for one or more operations to complete.  All pending operations are polled
+           on each tick, concurrently when there are more than one.
+
+        Parameters
+           operationList: (list): A list of (response, url) tuples.
+                                  response: The POST /operations response.
+                                  url: The operation's URL to poll: url+'/'+response.json()['id']
+           timeout: (int): The deadline in seconds shared by all the operations.
+           silentMode: (bool): True: Don't display the state on stdout.
+           ignoreException: (bool): True: Return the ERROR|EXCEPTION responses instead of raising an exception.
+
+        Return
+           A list of the last responses in the same order as the operationList.
+        """
+        results = [None] * len(operationList)
+        pending = {}
+        for index, (response, url) in enumerate(operationList):
+            state = self._getState(response, ignoreException)
+            if state in [None, 'SUCCESS']:
+                results[index] = response
+            else:
+                pending[index] = url
+
+        if pending == {}:
+            return results
+
+        for elapsed in self.pollIntervals(timeout):
+            indexList = list(pending.keys())
+            responseList = self._getResponses([pending[index] for index in indexList])
+
+            for index, response in zip(indexList, responseList):
+                state = self._getState(response, ignoreException)
+                if silentMode == False:
+                    self.ixnObj.logInfo('\tState: {0}: Wait {1:.2f}/{2} seconds'.format(state, elapsed, timeout), timestamp=False)
+
+                if state in ['IN_PROGRESS', 'down']:
+                    continue
+
+                # SUCCESS, or ERROR|EXCEPTION with ignoreException
+                results[index] = response
+                del pending[index]
+
+            if pending == {}:
+                return results
+
+        if ignoreException:
+            for index in pending:
+                results[index] = self.ixnObj.get(pending[index], silentMode=True)
+            return results
+
+        raise IxNetRestApiException('waitForComplete failed: Timed out after {0} seconds waiting for: {1}'.format(
+            timeout, list(pending.values())))
+
+    def _getState(self, response, ignoreException):
+        """
+        Description
+           Get the operation state from the response and raise on errors.
+           Returns None if the response has no state to wait on.
+        """
+        if response.json() == []:
+            raise IxNetRestApiException('waitForComplete: response is empty.')
+
+        if response.json() == '' or 'state' not in response.json():
+            return None
+
+        if 'errors' in response.json() and ignoreException == False:
+            raise IxNetRestApiException(response.json()["errors"][0])
+
+        state = response.json()['state']
+        if state in ['ERROR', 'EXCEPTION'] and ignoreException == False:
+            raise IxNetRestApiException('WaitForComplete: STATE=%s: %s' % (state, response.text))
+
+        return state
+
+    def _getResponses(self, urlList):
+        """
+        Description
+           GET the operation URLs. More than one URL is sent concurrently.
+        """
+        if len(urlList) > 1 and sys.version_info[0] >= 3:
+            return self.ixnObj.getAsyncConnect().getMany(urlList, silentMode=True)
+
+        return [self.ixnObj.get(url, silentMode=True) for url in urlList]
+
+class LogFileFormatter(logging.Formatter):
+    """
+    Description
+       Prefix the warnings and errors in the log file like the log file always had.
+    """
+    def format(self, record):
+        msg = record.getMessage()
+        if getattr(record, 'logFileOnly', False):
+            return msg
+
+        if record.levelno == logging.WARNING:
+            return 'Warning: '+msg
+
+        if record.levelno >= logging.ERROR:
+            return 'Error: '+msg
+
+        return msg
+
+class StdoutFilter(logging.Filter):
+    """
+    Description
+       Don't print the log records that are only meant for the log file.
+    """
+    def filter(self, record):
+        return not getattr(record, 'logFileOnly', False)
 
 class Connect:
     # For IxNetRestApiException
     debugLogFile = None
     enableDebugLogFile = False
+    debugLogger = None
     robotStdout = None
+    # The log files already truncated by this process. The other Connects append to them.
+    truncatedLogFiles = set()
+    # The loggers of the Connects that write a log file. debugLogger is the most recent one.
+    fileLoggers = []
 
     def __init__(self, apiServerIp=None, serverIpPort=None, serverOs='windows', connectToLinuxChassisIp=None, manageSessionMode=False,
                  webQuickTest=False, username=None, password='admin', licenseServerIp=None, licenseMode=None, licenseTier=None,
                  deleteSessionAfterTest=True, verifySslCert=False, includeDebugTraceback=True, sessionId=None, httpsSecured=False,
-                 apiKey=None, generateLogFile=True, robotFrameworkStdout=False):
+                 apiKey=None, generateLogFile=True, robotFrameworkStdout=False, transport=None, logLevel='info',
+                 logMaxDataLength=2048):
         """
         Description
            Initializing default parameters and making a connection to the API server
@@ -84,6 +349,14 @@ class Connect:
                                 False = Disable generating a log file.
                                 <log file name> = The full path + file name of the log file to create.
            robotFrameworkStdout: (bool):  True = Print to stdout.
+           logLevel: (str): debug|info|warning|error. The messages below this level are not formatted,
+                            printed or written to the log file.
+                            Use warning to stop logging every GET/POST/PATCH at info level.
+           logMaxDataLength: (int): Truncate the logged request data payloads to this many characters.
+                                    None = Log the complete payloads.
+           transport: (Transport): The HTTP connection pool, keep-alive and retry settings.
+                                   Defaults to Transport(): 10 connections per host, 3 retries with backoff.
+                                   Example: transport=Transport(poolMaxSize=50, maxRetries=5)
            httpInsecure: (bool): This parameter is only for Windows connections.
                                      True: Using http.  False: Using https.
                                      Starting 8.50: IxNetwork defaults to use https.
@@ -92,7 +365,7 @@ class Connect:
 
         Notes
             Class attributes
-               self._session: The requests initial Session().
+               self._session: The requests Session() created by the transport.
                self.serverOs: windows|windowsConnectionMgr|linux
 
                self.httpHeader: http://{apiServerIp}:{port}
@@ -152,7 +425,14 @@ class Connect:
         from requests.packages.urllib3.exceptions import InsecureRequestWarning
         requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
-        self._session = requests.Session()
+        if transport is None:
+            transport = Transport()
+        self.transport = transport
+        self._session = self.transport.createSession()
+        self.operationWaiter = OperationWaiter(self)
+
+        # Objects with an invalidate(method, url) method to be notified of configuration changes.
+        self.configChangeListeners = []
 
         self.httpScheme = 'http' ;# This will change to https in createWindowsSession and connectToLinuxApiServer
         if httpsSecured:
@@ -175,19 +455,23 @@ class Connect:
         self.robotFrameworkStdout = robotFrameworkStdout
         self.connectToLinuxChassisIp = connectToLinuxChassisIp
 
+        self.logMaxDataLength = logMaxDataLength
         if generateLogFile:
             if generateLogFile == True:
                 # Default the log file name
                 self.restLogFile = 'ixNetRestApi_debugLog.txt'
-                Connect.enableDebugLogFile = True
-                Connect.debugLogFile = self.restLogFile
 
             if type(generateLogFile) != bool:
                 self.restLogFile = generateLogFile
 
-            # Instantiate a new log file here.
-            with open(self.restLogFile, 'w') as restLogFile:
-                restLogFile.write('Date: {0}\nTime: {1}\n\n'.format(self.getDate, self.getTime))
+            Connect.enableDebugLogFile = True
+            Connect.debugLogFile = self.restLogFile
+
+        self.logger = self.createLogger(logLevel)
+        if generateLogFile:
+            Connect.fileLoggers.append(self.logger)
+            Connect.debugLogger = self.logger
+            self.logger.info('Date: {0}\nTime: {1}\n\n'.format(self.getDate(), self.getTime()), extra={'logFileOnly': True})
 
         # Make Robot print to stdout
         if self.robotFrameworkStdout:
@@ -313,7 +597,7 @@ class Connect:
             /api/v1/sessions/1/ixnetwork/operations
         """
         if silentMode is False:
-            self.logInfo('\n\tGET: {0}\n\tHEADERS: {1}'.format(restApi, self.jsonHeader))
+            self.logRequest('GET', restApi, headers=self.jsonHeader)
 
         try:
             # For binary file
@@ -367,7 +651,7 @@ class Connect:
             data = json.dumps(data)
 
         if silentMode == False:
-            self.logInfo('\n\tPOST: {0}\n\tDATA: {1}\n\tHEADERS: {2}'.format(restApi, data, self.jsonHeader))
+            self.logRequest('POST', restApi, data=data, headers=self.jsonHeader)
 
         try:
             if self.connectToLinuxChassisIp and json.loads(data) == {}:
@@ -397,6 +681,7 @@ class Connect:
             if headers != None:
                 self.jsonHeader = originalJsonHeader
 
+            self.notifyConfigChange('POST', restApi, response)
             return response
 
         except requests.exceptions.RequestException as errMsg:
@@ -414,7 +699,7 @@ class Connect:
            silentMode: (bool):  To display on stdout: URL, data and header info.
         """
         if silentMode == False:
-            self.logInfo('\n\tPATCH: {0}\n\tDATA: {1}\n\tHEADERS: {2}'.format(restApi, data, self.jsonHeader))
+            self.logRequest('PATCH', restApi, data=data, headers=self.jsonHeader)
 
         try:
             response = self._session.request('PATCH', restApi, data=json.dumps(data), headers=self.jsonHeader, allow_redirects=True, 
@@ -433,6 +718,7 @@ class Connect:
                             errMsg = 'PATCH Exception error: {0}\n'.format(response.json()['errors'])
                             raise IxNetRestApiException('PATCH error: {0}\n'.format(errMsg))
 
+            self.notifyConfigChange('PATCH', restApi, response)
             return response
 
         except requests.exceptions.RequestException as errMsg:
@@ -451,7 +737,7 @@ class Connect:
 
         """
         if silentMode is False:
-            self.logInfo('\n\tOPTIONS: {0}\n\tHEADERS: {1}'.format(restApi, self.jsonHeader))
+            self.logRequest('OPTIONS', restApi, headers=self.jsonHeader)
 
         try:
             # For binary file
@@ -491,7 +777,7 @@ class Connect:
         if headers != None:
             self.jsonHeader = headers
 
-        self.logInfo('\n\tDELETE: {0}\n\tDATA: {1}\n\tHEADERS: {2}'.format(restApi, data, self.jsonHeader))
+        self.logRequest('DELETE', restApi, data=data, headers=self.jsonHeader)
 
         try:
             response = self._session.request('DELETE', restApi, data=json.dumps(data), headers=self.jsonHeader, allow_redirects=True, 
@@ -507,6 +793,8 @@ class Connect:
                 errMsg = 'DELETE Exception error: {0}\n'.format(response.text)
                 self.logError(errMsg)
                 raise IxNetRestApiException(errMsg)
+
+            self.notifyConfigChange('DELETE', restApi, response)
             return response
 
         except requests.exceptions.RequestException as errMsg:
@@ -532,6 +820,78 @@ class Connect:
         """
         return self
 
+    def getAsyncConnect(self, maxConcurrent=10):
+        """
+        Description
+           Get the asyncio twin of this object for sending independent requests in parallel.
+           The AsyncConnect object is created once and shared by all the module classes.
+
+        Parameter
+           maxConcurrent: (int): The maximum amount of requests in flight at the same time.
+                                 Only used when the AsyncConnect object is created.
+
+        Requirement
+           Python 3.5+
+
+        Return
+           The AsyncConnect object.
+        """
+        if getattr(self, 'asyncObj', None) is None:
+            from IxNetRestApiAsync import AsyncConnect
+            self.asyncObj = AsyncConnect(self, maxConcurrent=maxConcurrent)
+
+        return self.asyncObj
+
+    def notifyConfigChange(self, method, restApi, response):
+        """
+        Description
+           Notify the configChangeListeners that a POST, PATCH or DELETE was successful.
+
+        Parameters
+           method: (str): POST|PATCH|DELETE
+           restApi: (str): The REST API URL.
+           response: (Object): The response of the request. Failed requests are not notified.
+        """
+        if str(response.status_code).startswith('2') == False:
+            return
+
+        for listener in self.configChangeListeners:
+            listener.invalidate(method, restApi)
+
+    def getTopologyIndex(self):
+        """
+        Description
+           Get the client-side index of the NGPF object tree.
+           The TopologyIndex object is created once, shared by all the module classes and
+           invalidated by the post, patch and delete functions.
+
+        Return
+           The TopologyIndex object.
+        """
+        if getattr(self, 'topologyIndex', None) is None:
+            from IxNetRestApiTopologyIndex import TopologyIndex
+            self.topologyIndex = TopologyIndex(self)
+            self.configChangeListeners.append(self.topologyIndex)
+
+        return self.topologyIndex
+
+    def getJsonConfigCache(self):
+        """
+        Description
+           Get the local cache of the exported JSON config with its xpath and name index.
+           The JsonConfigCache object is created once, shared by all the module classes and
+           invalidated by the post, patch and delete functions.
+
+        Return
+           The JsonConfigCache object.
+        """
+        if getattr(self, 'jsonConfigCache', None) is None:
+            from IxNetRestApiJsonConfig import JsonConfigCache
+            self.jsonConfigCache = JsonConfigCache(self)
+            self.configChangeListeners.append(self.jsonConfigCache)
+
+        return self.jsonConfigCache
+
     def createWindowsSession(self, ixNetRestServerIp, ixNetRestServerPort='11009'):
         """
         Description
@@ -579,27 +939,29 @@ class Connect:
                 port=ixNetRestServerPort,
                 id=sessionIdNumber)
 
-            counterStop = 10
-            for counter in range(1, counterStop+1):
-                response = self.get(self.sessionId)
+            def isSessionActive():
+                response = self.get(self.sessionId, silentMode=True)
                 if type(response.json()) == list:
                     currentState = response.json()[0]['state']
                 else:
                     currentState = response.json()['state']
 
-                self.logInfo('\n\tNew Windows session current state: {0}'.format(currentState), timestamp=False)
-                if currentState != 'ACTIVE' and counter < counterStop:
-                    self.logInfo('\tWaiting {0}/{1} seconds'.format(counter, counterStop), timestamp=False)
-                    time.sleep(1)
+                self.logInfo('\tNew Windows session current state: {0}'.format(currentState), timestamp=False)
+                return currentState == 'ACTIVE'
 
-                if currentState != 'ACTIVE' and counter == counterStop:
-                    raise IxNetRestApiException('New Windows session state failed to become ACTVIE state')
+            if self.waitFor(isSessionActive, timeout=10, description='Windows session ACTIVE', ignoreException=True) is None:
+                raise IxNetRestApiException('New Windows session state failed to become ACTVIE state')
 
-                if currentState == 'ACTIVE' and counter < counterStop:
-                    break
+            # Version < 8.50 needs more time after ACTIVE before the IxNetwork API responds.
+            # Wait until it does instead of a fixed sleep.
+            def isSessionReady():
+                try:
+                    response = self._session.request('GET', self.sessionUrl, verify=self.verifySslCert, allow_redirects=True)
+                except requests.exceptions.RequestException:
+                    return False
+                return str(response.status_code).startswith('2')
 
-            # Version < 8.50 requires more waiting time. And we cannot verify the version number at this point.
-            time.sleep(25)
+            self.waitFor(isSessionReady, timeout=60, description='Windows session ready', initialInterval=0.5)
 
         if self.serverOs == 'windows':
             # windows sessionId is always 1 because it only supports one session.
@@ -635,6 +997,155 @@ class Connect:
         if self.deleteSessionAfterTest:
             self.delete(self.sessionId)
 
+            from IxNetRestApiFileMgmt import FileMgmt
+            FileMgmt.clearSessionUploadCache(self.sessionId)
+
+        self.closeLogger()
+
+    def createLogger(self, logLevel='info'):
+        """
+        Description
+           Create the logger used by logInfo, logWarning and logError.
+           Messages are printed to stdout.  If generateLogFile is enabled, they are also written
+           to the log file by a background thread (Python 3) or in batches (Python 2) instead of
+           opening the log file for every line.
+
+        Parameter
+           logLevel: (str): debug|info|warning|error
+
+        Return
+           The logging.Logger object.
+        """
+        logger = logging.getLogger('IxNetRestApi.{0}'.format(id(self)))
+        logger.setLevel(getattr(logging, logLevel.upper()))
+        logger.propagate = False
+        logger.handlers = []
+
+        logger.addHandler(self.createStdoutHandler())
+
+        self.logListener = None
+        self.logFileHandler = None
+        if self.generateLogFile:
+            # Start a new log file once per process. The other Connects of the same process (session pools,
+            # orchestrators) append to it. The append mode writes at the end of the file even if
+            # more than one handler has it open.
+            logFilePath = os.path.abspath(self.restLogFile)
+            if logFilePath not in Connect.truncatedLogFiles:
+                Connect.truncatedLogFiles.add(logFilePath)
+                open(logFilePath, 'w').close()
+
+            self.logFileHandler = logging.FileHandler(self.restLogFile, mode='a')
+            self.logFileHandler.terminator = ''
+            self.logFileHandler.setFormatter(LogFileFormatter())
+
+            if sys.version_info[0] >= 3:
+                import queue
+                logQueue = queue.Queue(-1)
+                logger.addHandler(logging.handlers.QueueHandler(logQueue))
+                self.logListener = logging.handlers.QueueListener(logQueue, self.logFileHandler)
+                self.logListener.start()
+                # Flush the log file when the script exits
+                atexit.register(self.closeLogger)
+            else:
+                logger.addHandler(logging.handlers.MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=self.logFileHandler))
+
+        return logger
+
+    def createStdoutHandler(self):
+        stdoutHandler = logging.StreamHandler(sys.stdout)
+        stdoutHandler.terminator = ''
+        stdoutHandler.addFilter(StdoutFilter())
+        return stdoutHandler
+
+    def closeLogger(self):
+        """
+        Description
+           Flush and release the logger of this Connect object: stop the log file writer thread,
+           close the log file and remove the logger from the logging module.
+           Called by deleteSession. Call it when a Connect object is no longer used in a process
+           that creates many of them.
+        """
+        logger = getattr(self, 'logger', None)
+        if logger is None or logger.name not in logging.Logger.manager.loggerDict:
+            return
+
+        if self.logListener is not None:
+            # Writes the queued records before stopping.
+            self.logListener.stop()
+            self.logListener = None
+            if sys.version_info[0] >= 3:
+                atexit.unregister(self.closeLogger)
+
+        for handler in logger.handlers:
+            handler.flush()
+            handler.close()
+
+        if self.logFileHandler is not None:
+            self.logFileHandler.close()
+            self.logFileHandler = None
+
+        logging.Logger.manager.loggerDict.pop(logger.name, None)
+        if logger in Connect.fileLoggers:
+            Connect.fileLoggers.remove(logger)
+        if Connect.debugLogger is logger:
+            # IxNetRestApiException writes to the log file of a Connect that is still open.
+            Connect.debugLogger = Connect.fileLoggers[-1] if Connect.fileLoggers else None
+
+        # The logger is no longer registered in the logging module. Keep it to print to stdout only.
+        logger.handlers = [self.createStdoutHandler()]
+        self.generateLogFile = False
+
+    def _log(self, level, msg, end):
+        if sys.version_info[0] < 3 and end.endswith('\n'):
+            # Python 2 logging handlers always add a newline.
+            end = end[:-1]
+
+        self.logger.log(level, msg+end)
+        if self.robotFrameworkStdout:
+            self.robotStdout.log_to_console(msg)
+
+    def logRequest(self, method, restApi, data=None, headers=None):
+        """
+        Description
+           An internal function to log a HTTP request at info level.
+           Nothing is formatted if the log level is above info and
+           the data payload is truncated to logMaxDataLength characters.
+
+        Parameters
+           method: (str): GET|POST|PATCH|DELETE|OPTIONS
+           restApi: (str): The REST API URL.
+           data: (str|dict): The data payload.
+           headers: (dict): The request headers.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        msg = '\n\t{0}: {1}'.format(method, restApi)
+        if data is not None:
+            data = str(data)
+            if self.logMaxDataLength and len(data) > self.logMaxDataLength:
+                data = '{0}... <{1} more characters>'.format(data[:self.logMaxDataLength], len(data) - self.logMaxDataLength)
+            msg += '\n\tDATA: {0}'.format(data)
+
+        msg += '\n\tHEADERS: {0}'.format(headers)
+        self.logInfo(msg)
+
+    def logDebug(self, msg, end='\n', timestamp=False):
+        """
+        Description
+           An internal function for debug details. Only shown with logLevel='debug'.
+
+        Parameters
+           msg: (str): The message to print.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        if timestamp:
+            msg = '\n' + self.getTime() + ': ' + msg
+
+        self._log(logging.DEBUG, msg, end)
+
     def logInfo(self, msg, end='\n', timestamp=True):
         """
         Description
@@ -643,21 +1154,13 @@ class Connect:
         Parameters
            msg: (str): The message to print.
         """
-        currentTime = self.getTime()
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
 
         if timestamp:
-            msg = '\n' + currentTime + ': ' + msg
-        else:
-            # No timestamp and no newline are mainly for verifying states and status
-            msg = msg
+            msg = '\n' + self.getTime() + ': ' + msg
 
-        print('{0}'.format(msg), end=end)
-        if self.generateLogFile:
-            with open(self.restLogFile, 'a') as restLogFile:
-                restLogFile.write(msg+end)
-
-        if self.robotFrameworkStdout:
-            self.robotStdout.log_to_console(msg)
+        self._log(logging.INFO, msg, end)
 
     def logWarning(self, msg, end='\n', timestamp=True):
         """
@@ -667,21 +1170,13 @@ class Connect:
         Parameter
            msg: (str): The message to print.
         """
-        currentTime = self.getTime()
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
 
         if timestamp:
-            msg = '\n{0}: Warning: {1}'.format(currentTime, msg)
-        else:
-            # No timestamp and no newline are mainly for verifying states and status
-            msg = msg
+            msg = '\n{0}: Warning: {1}'.format(self.getTime(), msg)
 
-        print('{0}'.format(msg), end=end)
-        if self.generateLogFile:
-            with open(self.restLogFile, 'a') as restLogFile:
-                restLogFile.write('Warning: '+msg+end)
-
-        if self.robotFrameworkStdout:
-            self.robotStdout.log_to_console(msg)
+        self._log(logging.WARNING, msg, end)
 
     def logError(self, msg, end='\n', timestamp=True):
         """
@@ -691,21 +1186,13 @@ class Connect:
         Parameter
            msg: (str): The message to print.
         """
-        currentTime = self.getTime()
-
         if timestamp:
-            msg = '\n{0}: Error: {1}'.format(currentTime, msg)
+            msg = '\n{0}: Error: {1}'.format(self.getTime(), msg)
         else:
             # No timestamp and no newline are mainly for verifying states and status
             msg = '\nError: {0}'.format(msg)
 
-        print('{0}'.format(msg), end=end)
-        if self.generateLogFile:
-            with open(self.restLogFile, 'a') as restLogFile:
-                restLogFile.write('Error: '+msg+end)
-
-        if self.robotFrameworkStdout:
-            self.robotStdout.log_to_console(msg)
+        self._log(logging.ERROR, msg, end)
 
     def getIxNetworkVersion(self):
         """
@@ -789,6 +1276,10 @@ class Connect:
                             Verify port connectionStatus for: License Failed and Version Mismatch to report problem immediately.
 
            timeout: (int): The time allowed to wait for success completion in seconds.
+
+        Notes
+           The state is polled with an adaptive interval by self.operationWaiter: starting in milliseconds
+           and backing off up to one second.
         """
         if silentMode == False:
             self.logInfo('\nwaitForComplete:', timestamp=False)
@@ -797,42 +1288,71 @@ class Connect:
         if response.json() == []:
             raise IxNetRestApiException('waitForComplete: response is empty.')
 
-        if response.json() == '' or response.json()['state'] == 'SUCCESS':
-            return response
+        response = self.operationWaiter.wait([(response, url)], timeout=timeout, silentMode=silentMode,
+                                             ignoreException=ignoreException)[0]
+        return response
 
-        if 'errors' in response.json():
-            raise IxNetRestApiException(response.json()["errors"][0])
+    def waitForOperations(self, operationList, silentMode=True, ignoreException=False, timeout=90):
+        """
+        Description
+           Wait for many operations to complete at once.  All pending operations are
+           polled together with an adaptive interval and share the same deadline.
 
-        if response.json()['state'] in ["ERROR", "EXCEPTION"]:
-            raise IxNetRestApiException('WaitForComplete: STATE=%s: %s' % (response.json()['state'], response.text))
+        Parameters
+           operationList: (list): A list of (response, url) tuples.
+                                  response: The POST /operations response.
+                                  url: The operation URL to verify. Ex: url+'/'+response.json()['id']
+           silentMode: (bool):  If False, display the state on stdout.
+           ignoreException: (bool): True: Return ERROR|EXCEPTION responses instead of raising an exception.
+           timeout: (int): The time allowed to wait for all operations to complete in seconds.
 
-        for counter in range(1,timeout+1):
-            response = self.get(url, silentMode=True)
-            state = response.json()["state"]
-            if silentMode == False:
-                if state != 'SUCCESS':
-                    self.logInfo("\tState: {0}: Wait {1}/{2} seconds".format(state, counter, timeout), timestamp=False)
-                if state == 'SUCCESS':
-                    self.logInfo("\tState: {0}".format(state), timestamp=False)
-
-            if counter < timeout and state in ["IN_PROGRESS", "down"]:
-                time.sleep(1)
-                continue
-
-            if counter < timeout and state in ["ERROR", "EXCEPTION"]:
-                # ignoreException is for assignPorts.  Don't want to exit test.
-                # Verify port connectionStatus for: License Failed and Version Mismatch to report problem immediately.
-                if ignoreException:
-                    return response
-                raise IxNetRestApiException(response.text)
-
-            if counter < timeout and state == 'SUCCESS':
-                return response
-
-            if counter == timeout and state != 'SUCCESS':
-                if ignoreException:
-                    return response
-                raise IxNetRestApiException('waitForComplete failed: %s' % response.json())
+        Return
+           A list of the completed responses in the same order as the operationList.
+        """
+        return self.operationWaiter.wait(operationList, timeout=timeout, silentMode=silentMode,
+                                         ignoreException=ignoreException)
+
+    def waitFor(self, predicate, timeout=90, description=None, **kwargs):
+        """
+        Description
+           Wait for a condition to become true with an adaptive poll interval.
+           Use this instead of a "for counter in range(timeout): ... time.sleep(1)" loop.
+
+        Parameters
+           predicate: (function): A function without parameters that returns a true value when ready.
+           timeout: (int): The deadline in seconds.
+           description: (str): The condition name in the timeout error and in getWaitMetrics().
+           kwargs: initialInterval, maxInterval, cancelEvent and ignoreException. See OperationWaiter.waitFor.
+
+        Return
+           The true value returned by the predicate.
+        """
+        return self.operationWaiter.waitFor(predicate, timeout=timeout, description=description, **kwargs)
+
+    def waitForAll(self, conditionList, timeout=90, **kwargs):
+        """
+        Description
+           Wait for many conditions at once sharing the same deadline.
+
+        Parameters
+           conditionList: (list): [(description, predicate), ...]
+           timeout: (int): The deadline in seconds.
+           kwargs: initialInterval, maxInterval, cancelEvent and ignoreException. See OperationWaiter.waitFor.
+
+        Return
+           A list of the predicate values in the same order as the conditionList.
+        """
+        return self.operationWaiter.waitForAll(conditionList, timeout=timeout, **kwargs)
+
+    def getWaitMetrics(self):
+        """
+        Description
+           The time spent waiting for each waitFor condition description.
+
+        Return
+           {description: {'count':, 'ready':, 'totalTime':, 'maxTime':, 'polls':}}
+        """
+        return self.operationWaiter.waitMetrics
 
     def connectToLinuxIxosChassis(self, chassisIp, username, password):
         url = 'https://{0}/platform/api/v1/auth/session'.format(chassisIp)
@@ -1023,6 +1543,7 @@ class Connect:
         if self.serverOs == 'linux' and self.deleteSessionAfterTest==True:
             self.linuxServerStopOperations()
             self.linuxServerDeleteSession()
+            self.closeLogger()
 
     def linuxServerStopOperations(self, sessionId=None):
         """
@@ -1065,6 +1586,9 @@ class Connect:
 
         response = self.delete(sessionId)
 
+        from IxNetRestApiFileMgmt import FileMgmt
+        FileMgmt.clearSessionUploadCache(sessionId)
+
     def linuxServerWaitForSuccess(self, url, timeout=120):
         """
         Description
@@ -1075,19 +1599,20 @@ class Connect:
            timeout: (int): The timeout value.
         """
         data = {'applicationType': 'ixnrest'}
-        jsonHeader = {'content-type': 'application/json', 'x-api-key': self.apiKey}
         self.logInfo('linuxServerWaitForSuccess')
-        for counter in range(1,timeout+1):
+        response = self.get(url, data=data, silentMode=True)
+        if response.json()['message'] == 'Operation successfully completed':
+            return 0
+
+        for elapsed in self.operationWaiter.pollIntervals(timeout):
             response = self.get(url, data=data, silentMode=True)
             currentStatus = response.json()['message']
-            self.logInfo('\tCurrentStatus: {0}:  {1}/{2} seconds'.format(currentStatus, counter, timeout), timestamp=False)
-            if counter < timeout+1 and currentStatus != 'Operation successfully completed':
-                time.sleep(1)
-            if counter == timeout+1 and currentStatus != 'Operation successfully completed':
-                return 1
-            if counter < timeout+1 and currentStatus == 'Operation successfully completed':
+            self.logInfo('\tCurrentStatus: {0}:  {1:.2f}/{2} seconds'.format(currentStatus, elapsed, timeout), timestamp=False)
+            if currentStatus == 'Operation successfully completed':
                 return 0
 
+        return 1
+
     def newBlankConfig(self):
         """
         Description
@@ -1196,7 +1721,7 @@ class Connect:
             # data={'values': ['item1', 'item2']}
             self.patch(self.httpHeader+multivalueUrl+'/valueList', data=data)
 
-    def getMultivalueValues(self, multivalueObj, silentMode=False):
+    def getMultivalueValues(self, multivalueObj, silentMode=False, localExpansion=True):
         """
         Description
            Get the multivalue values.
@@ -1204,12 +1729,26 @@ class Connect:
         Parameters
            multivalueObj: (str): The multivalue object: /api/v1/sessions/{1}/ixnetwork/multivalue/208
            silentMode: (bool): True=Display the GET and status code. False=Don't display.
+           localExpansion: (bool): True=Read the singleValue, counter or valueList pattern and calculate
+                                   the values locally. Other patterns are still expanded by the API server.
+                                   False=Always get the values from the API server.
 
         Requirements
            self.waitForComplete()
         """
-        response = self.get(self.httpHeader+multivalueObj+'?includes=count', silentMode=silentMode)
-        count = response.json()['count']
+        if localExpansion:
+            from IxNetRestApiMultivalue import MultivalueModel
+            multivalueModel = MultivalueModel.fromServer(self, multivalueObj)
+            count = multivalueModel.count
+            if multivalueModel.isSupported():
+                if silentMode == False:
+                    self.logInfo('getMultivalueValues: {0} Count={1} Pattern={2}: Expanded locally'.format(
+                        multivalueObj, count, multivalueModel.pattern))
+                return multivalueModel.getValues()
+        else:
+            response = self.get(self.httpHeader+multivalueObj+'?includes=count', silentMode=silentMode)
+            count = response.json()['count']
+
         if silentMode == False:
             self.logInfo('getMultivalueValues: {0} Count={1}'.format(multivalueObj, count))
         data = {'arg1': multivalueObj,
@@ -1220,6 +1759,75 @@ class Connect:
         self.waitForComplete(response, self.sessionUrl+'/operations/multivalue/getValues'+response.json()['id'])
         return response.json()['result']
 
+    def getMultivalueValuesBulk(self, multivalueObjList, silentMode=True, timeout=90, localExpansion=True):
+        """
+        Description
+           Get the values of many multivalues with the minimum amount of round trips.
+           Instead of a GET, a POST and a waitForComplete for each multivalue one at a time,
+           all the counts are fetched concurrently, then all the getValues operations are sent
+           concurrently, then the operations that did not complete right away are waited on together.
+
+        Parameters
+           multivalueObjList: (list): A list of multivalue objects: ['/api/v1/sessions/{1}/ixnetwork/multivalue/208', ...]
+           silentMode: (bool): True=Don't display the REST APIs on stdout.
+           timeout: (int): The time allowed for all getValues operations to complete.
+           localExpansion: (bool): True=Calculate the values of the singleValue, counter and valueList patterns
+                                   locally and send getValues only for the other multivalues.
+                                   False=Get all the values from the API server.
+
+        Return
+           A dict: {multivalueObj: [values]}
+        """
+        # Remove duplicates and preserve the order
+        multivalueObjList = list(dict.fromkeys(multivalueObjList))
+        if multivalueObjList == []:
+            return {}
+
+        multivalueValues = {}
+        countList = None
+        if localExpansion:
+            from IxNetRestApiMultivalue import MultivalueModel
+            models = MultivalueModel.fromServerBulk(self, multivalueObjList)
+            for multivalueObj, multivalueModel in models.items():
+                if multivalueModel.isSupported():
+                    multivalueValues[multivalueObj] = multivalueModel.getValues()
+
+            if silentMode == False:
+                self.logInfo('getMultivalueValuesBulk: {0} multivalues expanded locally'.format(len(multivalueValues)))
+
+            # The counts are already known for the multivalues that the API server has to expand.
+            multivalueObjList = [multivalueObj for multivalueObj in multivalueObjList if multivalueObj not in multivalueValues]
+            countList = [models[multivalueObj].count for multivalueObj in multivalueObjList]
+            if multivalueObjList == []:
+                return multivalueValues
+
+        countUrlList = [self.httpHeader+multivalueObj+'?includes=count' for multivalueObj in multivalueObjList]
+        getValuesUrl = self.sessionUrl+'/multivalue/operations/getValues'
+
+        if sys.version_info[0] >= 3:
+            asyncObj = self.getAsyncConnect()
+            if countList is None:
+                countList = [response.json()['count'] for response in asyncObj.getMany(countUrlList, silentMode=silentMode)]
+            requestList = [(getValuesUrl, {'arg1': multivalueObj, 'arg2': 0, 'arg3': count})
+                           for multivalueObj, count in zip(multivalueObjList, countList)]
+            responseList = asyncObj.postMany(requestList, silentMode=silentMode)
+        else:
+            if countList is None:
+                countList = [self.get(url, silentMode=silentMode).json()['count'] for url in countUrlList]
+            responseList = [self.post(getValuesUrl, data={'arg1': multivalueObj, 'arg2': 0, 'arg3': count}, silentMode=silentMode)
+                            for multivalueObj, count in zip(multivalueObjList, countList)]
+
+        if silentMode == False:
+            self.logInfo('getMultivalueValuesBulk: {0} multivalues'.format(len(multivalueObjList)))
+
+        responseList = self.waitForOperations([(response, getValuesUrl+'/'+response.json()['id']) for response in responseList],
+                                              silentMode=silentMode, timeout=timeout)
+
+        for multivalueObj, response in zip(multivalueObjList, responseList):
+            multivalueValues[multivalueObj] = response.json()['result']
+
+        return multivalueValues
+
     def getObjAttributeValue(self, obj, attribute):
         """
         Description
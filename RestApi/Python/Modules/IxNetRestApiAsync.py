@@ -0,0 +1,317 @@
+
+# PLEASE READ DISCLAIMER
+#
+#    This class demonstrates sample IxNetwork REST API usage for
+#    demo and reference purpose only.
+#    It is subject to change for updates without warning.
+#
+# REQUIREMENTS
+#    - Python 3.5+ (asyncio)
+#    - Python modules: requests
+#
+
+import asyncio, functools, json
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from IxNetRestApi import IxNetRestApiException
+from IxNetRestApiTransport import Transport
+
+class AsyncConnect(object):
+    def __init__(self, ixnObj=None, maxConcurrent=10):
+        """
+        Description
+           An asyncio twin of the Connect class.  The HTTP verbs are awaitable so that
+           independent requests could be sent to the API server in parallel.
+
+           The session URL, headers, apiKey and SSL settings are always taken from the
+           main Connect object. Nothing needs to be configured twice.
+
+        Parameters
+           ixnObj: (Object): The main Connect object.
+           maxConcurrent: (int): The maximum amount of requests in flight at the same time.
+
+        Notes
+           Each request is sent from a thread pool through its own requests.Session
+           created with the main object's Transport settings.
+           The requests module is blocking, so this keeps the dependencies the same as Connect.
+
+        Examples
+           asyncObj = AsyncConnect(mainObj, maxConcurrent=20)
+
+           # From synchronous code
+           responses = asyncObj.getMany([mainObj.sessionUrl+'/topology/1', mainObj.sessionUrl+'/topology/2'])
+
+           # From asyncio code
+           async def main():
+               return await asyncObj.gather(asyncObj.get(url1), asyncObj.patch(url2, data={'name': 'Port1'}))
+           asyncObj.run(main())
+        """
+        self.ixnObj = ixnObj
+        self.maxConcurrent = maxConcurrent
+
+        # Same retry and keep-alive settings as the main object with a pool sized for maxConcurrent.
+        settings = self.ixnObj.transport.getSettings()
+        settings['poolMaxSize'] = max(maxConcurrent, settings['poolMaxSize'])
+        self._session = Transport(**settings).createSession()
+        self._executor = ThreadPoolExecutor(max_workers=maxConcurrent)
+
+    def setMainObject(self, mainObject):
+        """
+        Description
+            For Python Robot Framework support.
+        """
+        self.ixnObj = mainObject
+
+    async def _request(self, method, restApi, data=None, headers=None, stream=False):
+        """
+        Description
+           Send one HTTP request in the thread pool and await its response.
+
+        Parameters
+           method: (str): GET|POST|PATCH|DELETE|OPTIONS
+           restApi: (str): The REST API URL.
+           data: (str|bytes|file object): The data payload already serialized.
+           headers: (dict): Defaults to the main object's jsonHeader.
+        """
+        if headers is None:
+            headers = self.ixnObj.jsonHeader
+
+        request = functools.partial(self._session.request, method, restApi, data=data, headers=headers, stream=stream,
+                                    allow_redirects=True, verify=self.ixnObj.verifySslCert)
+        loop = asyncio.get_event_loop()
+        try:
+            return await loop.run_in_executor(self._executor, request)
+        except requests.exceptions.RequestException as errMsg:
+            raise IxNetRestApiException('{0} Exception error: {1}'.format(method, errMsg))
+
+    def _verifyResponse(self, method, response, silentMode, ignoreError):
+        """
+        Description
+           Verify the status code the same way Connect does.
+        """
+        if silentMode is False:
+            self.ixnObj.logInfo('\t{0}: {1}: STATUS CODE: {2}'.format(method, response.url, response.status_code), timestamp=False)
+
+        if not str(response.status_code).startswith('2') and ignoreError == False:
+            try:
+                if 'errors' in response.json():
+                    raise IxNetRestApiException('{0} Exception error: {1}\n'.format(method, response.json()['errors']))
+            except ValueError:
+                pass
+
+            raise IxNetRestApiException('{0} Exception error: {1}'.format(method, response.text))
+
+        return response
+
+    async def get(self, restApi, stream=False, silentMode=False, ignoreError=False):
+        """
+        Description
+            An awaitable HTTP GET.
+
+        Parameters
+           restApi: (str): The REST API URL.
+           silentMode: (bool):  To display on stdout: URL, data and header info.
+           ignoreError: (bool): True: Don't raise an exception.  False: The response will be returned.
+        """
+        if silentMode is False:
+            self.ixnObj.logRequest('GET', restApi, headers=self.ixnObj.jsonHeader)
+
+        response = await self._request('GET', restApi, stream=stream)
+        return self._verifyResponse('GET', response, silentMode, ignoreError)
+
+    async def post(self, restApi, data={}, headers=None, silentMode=False, noDataJsonDumps=False, ignoreError=False):
+        """
+        Description
+           An awaitable HTTP POST to create and start operations.
+
+        Parameters
+           restApi: (str): The REST API URL.
+           data: (dict): The data payload for the URL.
+           headers: (str): The special header to use for the URL.
+           silentMode: (bool):  To display on stdout: URL, data and header info.
+           noDataJsonDumps: (bool): True: Accept the data as-is. False: Use json dumps.
+           ignoreError: (bool): True: Don't raise an exception.  False: The response will be returned.
+        """
+        if noDataJsonDumps == False:
+            data = json.dumps(data)
+
+        if silentMode == False:
+            self.ixnObj.logRequest('POST', restApi, data=data, headers=headers or self.ixnObj.jsonHeader)
+
+        if self.ixnObj.connectToLinuxChassisIp and data == '{}':
+            # Interacting with LinuxOS chassis doesn't like empty data payload. So excluding it here.
+            data = None
+
+        response = await self._request('POST', restApi, data=data, headers=headers)
+        self._verifyResponse('POST', response, silentMode, ignoreError)
+        self.ixnObj.notifyConfigChange('POST', restApi, response)
+        return response
+
+    async def patch(self, restApi, data={}, silentMode=False, ignoreError=False):
+        """
+        Description
+           An awaitable HTTP PATCH to modify configurations.
+
+        Parameters
+           restApi: (str): The REST API URL.
+           data: (dict): The data payload for the URL.
+           silentMode: (bool):  To display on stdout: URL, data and header info.
+           ignoreError: (bool): True: Don't raise an exception.  False: The response will be returned.
+        """
+        if silentMode == False:
+            self.ixnObj.logRequest('PATCH', restApi, data=data, headers=self.ixnObj.jsonHeader)
+
+        response = await self._request('PATCH', restApi, data=json.dumps(data))
+        self._verifyResponse('PATCH', response, silentMode, ignoreError)
+        self.ixnObj.notifyConfigChange('PATCH', restApi, response)
+        return response
+
+    async def delete(self, restApi, data={}, headers=None, silentMode=False, ignoreError=False):
+        """
+        Description
+           An awaitable HTTP DELETE.
+
+        Parameters
+           restApi: (str): The REST API URL.
+           data: (dict): The data payload for the URL.
+           headers: (str): The headers to use for the URL.
+        """
+        if silentMode == False:
+            self.ixnObj.logRequest('DELETE', restApi, data=data, headers=headers or self.ixnObj.jsonHeader)
+
+        response = await self._request('DELETE', restApi, data=json.dumps(data), headers=headers)
+        self._verifyResponse('DELETE', response, silentMode, ignoreError)
+        self.ixnObj.notifyConfigChange('DELETE', restApi, response)
+        return response
+
+    async def gather(self, *coroutines, maxConcurrent=None, returnExceptions=False):
+        """
+        Description
+           Await all the coroutines with at most maxConcurrent of them running at the same time.
+
+        Parameters
+           coroutines: Awaitables such as self.get(url) or self.post(url, data).
+           maxConcurrent: (int): Defaults to the maxConcurrent set at instantiation.
+                                 It can only lower that limit. The thread pool and the connection pool
+                                 are sized for the instance maxConcurrent.
+           returnExceptions: (bool): True: Exceptions are returned in place of the results.
+                                     False: The first exception is raised.
+
+        Return
+           A list of results in the same order as the coroutines.
+        """
+        if maxConcurrent is None or maxConcurrent > self.maxConcurrent:
+            maxConcurrent = self.maxConcurrent
+
+        semaphore = asyncio.Semaphore(maxConcurrent)
+
+        async def bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*[bounded(coroutine) for coroutine in coroutines], return_exceptions=returnExceptions)
+
+    @staticmethod
+    def isEventLoopRunning():
+        """
+        Description
+           Check if the calling thread is running an event loop. For example in Jupyter or in a coroutine.
+        """
+        if hasattr(asyncio, 'get_running_loop'):
+            try:
+                asyncio.get_running_loop()
+                return True
+            except RuntimeError:
+                return False
+
+        # Python < 3.7
+        return asyncio.get_event_loop().is_running()
+
+    def run(self, coroutine):
+        """
+        Description
+           Run a coroutine to completion from synchronous code.
+
+        Parameter
+           coroutine: The awaitable to run. For example: self.gather(...)
+
+        Notes
+           An event loop can't run inside a running event loop. When the caller is already running
+           one, the coroutine runs on a private event loop in another thread and the caller is
+           blocked until it completes. From asyncio code, await the coroutine instead:
+              responses = await asyncObj.gather(asyncObj.get(url1), asyncObj.get(url2))
+        """
+        if self.isEventLoopRunning():
+            with ThreadPoolExecutor(max_workers=1) as loopExecutor:
+                return loopExecutor.submit(self._runEventLoop, coroutine).result()
+
+        return self._runEventLoop(coroutine)
+
+    def _runEventLoop(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def getMany(self, urlList, silentMode=True, ignoreError=False):
+        """
+        Description
+           Concurrently GET a list of URLs from synchronous code.
+
+        Parameters
+           urlList: (list): A list of full URLs.
+
+        Return
+           A list of responses in the same order as the urlList.
+        """
+        return self.run(self.gather(*[self.get(url, silentMode=silentMode, ignoreError=ignoreError) for url in urlList]))
+
+    def postMany(self, requestList, silentMode=True, ignoreError=False):
+        """
+        Description
+           Concurrently POST from synchronous code.
+
+        Parameters
+           requestList: (list): A list of (url, data) tuples.
+
+        Return
+           A list of responses in the same order as the requestList.
+        """
+        return self.run(self.gather(*[self.post(url, data=data, silentMode=silentMode, ignoreError=ignoreError)
+                                      for url, data in requestList]))
+
+    def patchMany(self, requestList, silentMode=True, ignoreError=False):
+        """
+        Description
+           Concurrently PATCH from synchronous code.
+
+        Parameters
+           requestList: (list): A list of (url, data) tuples.
+
+        Return
+           A list of responses in the same order as the requestList.
+        """
+        return self.run(self.gather(*[self.patch(url, data=data, silentMode=silentMode, ignoreError=ignoreError)
+                                      for url, data in requestList]))
+
+    def deleteMany(self, urlList, silentMode=True, ignoreError=False):
+        """
+        Description
+           Concurrently DELETE a list of URLs from synchronous code.
+
+        Parameters
+           urlList: (list): A list of full URLs.
+
+        Return
+           A list of responses in the same order as the urlList.
+        """
+        return self.run(self.gather(*[self.delete(url, silentMode=silentMode, ignoreError=ignoreError) for url in urlList]))
+
+    def close(self):
+        """
+        Description
+           Shut down the thread pool and close the HTTP connections.
+        """
+        self._executor.shutdown(wait=True)
+        self._session.close()
@@ -8,7 +8,7 @@
 #    A class object for IxNetwork Classic Framework.
 
 from IxNetRestApi import IxNetRestApiException
-import requests, json, os, re, sys, time, datetime, ast
+import requests, json, os, re, sys, datetime, ast
 
 class ClassicProtocol(object):
     def __init__(self, ixnObj=None):
@@ -194,7 +194,6 @@ class ClassicProtocol(object):
             A list or one or more congfigured protocols eg: "['ospf','bgp']"
             return [] if no protocol is configured
         """
-        time.sleep(5)
         configuredProtocolList = []
         protocolList = ['bfd', 'bgp', 'eigrp', 'isis', 'ldp', 'lisp',
                         'mplsOam', 'mplsTp', 'ospf', 'ospfV3', 'pimsm',
@@ -567,15 +566,17 @@ class ClassicProtocol(object):
             verifyProtocolSessionsUp(protcolViewName='ospf Aggregated Statistics')
             verifyProtocolSessionsUp(protcolViewName='ospf Aggregated Statistics',timeout=90)
         """
-        totalSessionsDetectedUp = 0
-        totalSessionsDetectedDown = 0
-        totalPortsUpFlag = 0
         self.ixnObj.logInfo('Protocol view name %s' % protocolViewName)
-        time.sleep(10)
-        for counter in range(1, timeout + 1):
-            stats = self.statObj.getStats(viewName=protocolViewName, displayStats=False)
-            totalPorts = len(stats.keys())  # Length stats.keys() represents total ports.
+
+        def isProtocolSessionsUp():
+            try:
+                stats = self.statObj.getStats(viewName=protocolViewName, displayStats=False)
+            except IxNetRestApiException:
+                # The protocol view is created a few seconds after the protocols start
+                return False
+
             self.ixnObj.logInfo('ProtocolName: {0}'.format(protocolViewName))
+            totalPortsUp = 0
             for session in stats.keys():
                 if re.search('OSPF', protocolViewName, re.I):
                     sessionsUp = int(stats[session]['Full Nbrs.'])
@@ -604,27 +605,26 @@ class ClassicProtocol(object):
                 elif re.search('PIM', protocolViewName, re.I):
                     sessionsUp = int(stats[session]['Rtrs. Running'])
                     totalSessions = int(stats[session]['Rtrs. Configured'])
-                # totalSessionsNotStarted = int(stats[session]['Sessions Not Started'])
                 totalExpectedSessionsUp = totalSessions
 
                 if totalExpectedSessionsUp != 0:
                     self.ixnObj.logInfo(
                         '\n\tPortName: {0}\n\t   TotalSessionsUp: {1}\n\t   ExpectedTotalSessionsup: {2}'.format(
                             stats[session]['Port Name'], sessionsUp, totalExpectedSessionsUp), timestamp=False)
-                    if counter < timeout and sessionsUp != totalExpectedSessionsUp:
+                    if sessionsUp != totalExpectedSessionsUp:
                         self.ixnObj.logInfo('\t   Protocol Session is still down', timestamp=False)
+                        continue
+
+                totalPortsUp += 1
 
-                    if counter < timeout and sessionsUp == totalExpectedSessionsUp:
-                        totalPortsUpFlag += 1
-                        if totalPortsUpFlag == totalPorts:
-                            self.ixnObj.logInfo('All protocol sessions are up!')
-                            return
+            # Length stats.keys() represents total ports.
+            return stats != {} and totalPortsUp == len(stats.keys())
 
-            if counter == timeout and sessionsUp != totalExpectedSessionsUp:
-                raise IxNetRestApiException('Protocol Sessions failed to come up')
+        if self.ixnObj.waitFor(isProtocolSessionsUp, timeout=timeout, description=protocolViewName+' sessions up',
+                               ignoreException=True) is None:
+            raise IxNetRestApiException('Protocol Sessions failed to come up')
 
-            self.ixnObj.logInfo('\n\tWait {0}/{1} seconds\n'.format(counter, timeout), timestamp=False)
-            time.sleep(1)
+        self.ixnObj.logInfo('All protocol sessions are up!')
 
     def verifyAllConfiguredProtocolSessions(self, duration):
         """
@@ -1,7 +1,14 @@
-import sys, re, os, json, platform, io
+import sys, re, os, json, platform, hashlib
 from IxNetRestApi import IxNetRestApiException
 
 class FileMgmt(object):
+    # The files uploaded to each session: {sessionUrl: {serverFileName: {'size':, 'checksum':}}}
+    # Shared by all the FileMgmt objects so that reloading a config in the same session skips the upload.
+    uploadCache = {}
+
+    # The local file checksums: {absolutePath: (size, modifiedTime, checksum)}
+    localChecksumCache = {}
+
     def __init__(self, ixnObj=None):
         """
         Description
@@ -22,7 +29,7 @@ class FileMgmt(object):
         """
         self.ixnObj = mainObject
 
-    def loadConfigFile(self, configFile, localFile=True):
+    def loadConfigFile(self, configFile, localFile=True, useUploadCache=True):
         """
         Description
             Load a saved config file.
@@ -35,6 +42,9 @@ class FileMgmt(object):
 
             localFile: (bool): For Windows API server and Connection Mgr running on a Windows server only.
                                Set to False if the config file is in the Windows API server filesystem.
+
+            useUploadCache: (bool): True: Don't upload the local config file if the identical file was already
+                                    uploaded to this session and the server still has it. See uploadFileCached.
         """
         # Verify if the config file is a letter drive: c:\\path\\
         # If it is, get the config file from Windows path to the IxNetwork API server common path.
@@ -62,16 +72,11 @@ class FileMgmt(object):
 
             fileName = configFile.split('/')[-1]
 
-            # Read the config file
-            self.ixnObj.logInfo('\nReading saved config file')
-            with open(configFile, mode='rb') as file:
-                configContents = file.read()
-                configContents = io.BytesIO(configContents)
-
-                # Upload it to the server and give it any name you want for the filename
-                uploadFile = self.ixnObj.sessionUrl+'/files?filename='+fileName
-                self.ixnObj.logInfo('\nUploading file to server: %s' % uploadFile)
-                response = self.ixnObj.post(uploadFile, data=configContents, noDataJsonDumps=True, headers=octetStreamHeader, silentMode=False)
+            # Stream the config file to the server and give it any name you want for the filename
+            if useUploadCache:
+                self.uploadFileCached(configFile, serverFileName=fileName)
+            else:
+                self.uploadFile(configFile, serverFileName=fileName)
 
         loadConfigUrl = self.ixnObj.sessionUrl+'/operations/loadconfig'
 
@@ -87,6 +92,373 @@ class FileMgmt(object):
 
         self.ixnObj.waitForComplete(response, loadConfigUrl+'/'+response.json()['id'], silentMode=False, timeout=140)
 
+    def getFileChecksum(self, fileName, checksumAlgorithm='md5', chunkSize=1048576):
+        """
+        Description
+           Get the checksum of a local file without reading the whole file into memory.
+
+        Parameters
+           fileName: (str): The local file.
+           checksumAlgorithm: (str): Any hashlib algorithm: md5|sha1|sha256
+           chunkSize: (int): The amount of bytes to read at a time.
+
+        Return
+           The hex digest.
+        """
+        checksum = hashlib.new(checksumAlgorithm)
+        with open(fileName, mode='rb') as fileObj:
+            for chunk in iter(lambda: fileObj.read(chunkSize), b''):
+                checksum.update(chunk)
+        return checksum.hexdigest()
+
+    def getProgressLogger(self, description, percentStep=10):
+        """
+        Description
+           The default progress callback for uploadFile and downloadFile.
+           Logs the progress every percentStep percent.
+
+        Parameters
+           description: (str): Shown in the progress log.
+           percentStep: (int): Log every percentStep percent.
+
+        Return
+           A callback function: progressCallback(bytesTransferred, totalBytes)
+        """
+        nextPercent = [0]
+        def progressCallback(bytesTransferred, totalBytes):
+            if totalBytes is None:
+                return
+
+            percent = 100 if totalBytes == 0 else int(bytesTransferred * 100 / totalBytes)
+            if percent >= nextPercent[0]:
+                self.ixnObj.logInfo('{0}: {1}% {2}/{3} bytes'.format(description, percent, bytesTransferred, totalBytes),
+                                    timestamp=False)
+                nextPercent[0] = (percent // percentStep + 1) * percentStep
+
+        return progressCallback
+
+    def uploadFile(self, localFile, serverFileName=None, chunkSize=1048576, progressCallback=None, checksumAlgorithm='md5'):
+        """
+        Description
+           Stream a local file to the API server files folder.
+           The file is read in chunks while it is sent, so large .ixncfg, .json and capture files
+           don't have to fit in memory and the upload starts right away.
+
+        Parameters
+           localFile: (str): The local file to upload.
+           serverFileName: (str): The file name on the API server. Defaults to the localFile name.
+           chunkSize: (int): The amount of bytes to read at a time.
+           progressCallback: (function): progressCallback(bytesTransferred, totalBytes).
+                                         Defaults to logging the progress every 10%.
+           checksumAlgorithm: (str): Any hashlib algorithm to calculate the checksum of the sent bytes.
+                                     None = No checksum.
+
+        Syntax
+           POST: /api/v1/sessions/{id}/ixnetwork/files?filename={serverFileName}
+                 headers={'content-type': 'application/octet-stream'}
+
+        Return
+           {'fileName': serverFileName, 'size': bytesSent, 'checksum': hexDigest|None}
+        """
+        if os.path.exists(localFile) is False:
+            raise IxNetRestApiException("File doesn't exists: %s" % localFile)
+
+        if serverFileName is None:
+            serverFileName = os.path.basename(localFile)
+
+        if self.ixnObj.serverOs == 'linux':
+            octetStreamHeader = {'content-type': 'application/octet-stream', 'x-api-key': self.ixnObj.apiKey}
+        else:
+            octetStreamHeader = {'content-type': 'application/octet-stream'}
+
+        if progressCallback is None:
+            progressCallback = self.getProgressLogger('uploadFile {0}'.format(serverFileName))
+
+        # The server file is overwritten. Forget what uploadFileCached knew about it in case the upload fails halfway.
+        sessionCache = FileMgmt.uploadCache.setdefault(self.ixnObj.sessionUrl, {})
+        sessionCache.pop(serverFileName, None)
+
+        uploadUrl = self.ixnObj.sessionUrl+'/files?filename='+serverFileName
+        self.ixnObj.logInfo('\nUploading file to server: %s' % uploadUrl)
+        with open(localFile, mode='rb') as fileObj:
+            fileReader = UploadFileReader(fileObj, os.path.getsize(localFile), chunkSize=chunkSize,
+                                          progressCallback=progressCallback, checksumAlgorithm=checksumAlgorithm)
+            self.ixnObj.post(uploadUrl, data=fileReader, noDataJsonDumps=True, headers=octetStreamHeader, silentMode=False)
+
+        if fileReader.bytesRead != fileReader.totalSize:
+            raise IxNetRestApiException('uploadFile: Sent {0} of {1} bytes: {2}'.format(fileReader.bytesRead, fileReader.totalSize, localFile))
+
+        checksum = fileReader.getChecksum()
+        if checksum:
+            sessionCache[serverFileName] = {'size': fileReader.bytesRead, 'checksum': checksum,
+                                            'checksumAlgorithm': checksumAlgorithm}
+
+        return {'fileName': serverFileName, 'size': fileReader.bytesRead, 'checksum': checksum}
+
+    def getCachedFileChecksum(self, fileName, checksumAlgorithm='md5'):
+        """
+        Description
+           Get the checksum of a local file. The checksum is only calculated again
+           if the file size or modified time changed.
+
+        Parameters
+           fileName: (str): The local file.
+           checksumAlgorithm: (str): Any hashlib algorithm.
+        """
+        absolutePath = os.path.abspath(fileName)
+        fileStat = os.stat(absolutePath)
+        key = (absolutePath, checksumAlgorithm)
+        cached = FileMgmt.localChecksumCache.get(key)
+        if cached and cached[0] == fileStat.st_size and cached[1] == fileStat.st_mtime:
+            return cached[2]
+
+        checksum = self.getFileChecksum(absolutePath, checksumAlgorithm=checksumAlgorithm)
+        FileMgmt.localChecksumCache[key] = (fileStat.st_size, fileStat.st_mtime, checksum)
+        return checksum
+
+    def getServerFileSize(self, serverFileName):
+        """
+        Description
+           Get the size of a file in the API server files folder from the response headers.
+           The response is closed before its content is read, so the file is not downloaded.
+
+        Parameter
+           serverFileName: (str): The file name in the API server files folder.
+
+        Return
+           The size in bytes. None if the file is not on the server.
+           -1 if the server didn't send the size, for example with a compressed or chunked response.
+        """
+        try:
+            response = self.ixnObj.get(self.ixnObj.sessionUrl+'/files?filename=%s' % (serverFileName),
+                                       stream=True, silentMode=True, ignoreError=True)
+        except IxNetRestApiException:
+            return None
+
+        try:
+            if str(response.status_code).startswith('2') == False:
+                return None
+
+            contentLength = response.headers.get('content-length')
+            if contentLength is None or response.headers.get('content-encoding') is not None:
+                return -1
+
+            return int(contentLength)
+        finally:
+            response.close()
+
+    def getServerFileChecksum(self, serverFileName, checksumAlgorithm='md5', size=None, chunkSize=1048576):
+        """
+        Description
+           Get the checksum of a file in the API server files folder.
+           The file is streamed and hashed one chunk at a time. Nothing is written to disk.
+
+        Parameters
+           serverFileName: (str): The file name in the API server files folder.
+           checksumAlgorithm: (str): Any hashlib algorithm.
+           size: (int): Optional: The expected size. Returns None without reading the content
+                        if the server file has a different size.
+           chunkSize: (int): The amount of bytes to read at a time.
+
+        Return
+           The hex digest. None if the file is not on the server or doesn't have the expected size.
+        """
+        try:
+            response = self.ixnObj.get(self.ixnObj.sessionUrl+'/files?filename=%s' % (serverFileName),
+                                       stream=True, silentMode=True, ignoreError=True)
+        except IxNetRestApiException:
+            return None
+
+        try:
+            if str(response.status_code).startswith('2') == False:
+                return None
+
+            contentLength = response.headers.get('content-length')
+            if size is not None and contentLength is not None and response.headers.get('content-encoding') is None \
+                    and int(contentLength) != size:
+                return None
+
+            checksum = hashlib.new(checksumAlgorithm)
+            bytesRead = 0
+            for chunk in response.iter_content(chunk_size=chunkSize):
+                checksum.update(chunk)
+                bytesRead += len(chunk)
+        finally:
+            response.close()
+
+        if size is not None and bytesRead != size:
+            return None
+
+        return checksum.hexdigest()
+
+    def uploadFileCached(self, localFile, serverFileName=None, checksumAlgorithm='md5', verifyServerChecksum=False, **kwargs):
+        """
+        Description
+           Upload a local file unless the identical file was already uploaded to this session.
+           The file is identified by its name, size and checksum. The upload is skipped if the
+           uploadCache has the same size and checksum for the name and the server file still
+           has that size. The uploadCache is updated by uploadFile and cleared when the session
+           is deleted.
+
+        Parameters
+           localFile: (str): The local file to upload.
+           serverFileName: (str): The file name on the API server. Defaults to the localFile name.
+           checksumAlgorithm: (str): Any hashlib algorithm.
+           verifyServerChecksum: (bool): True: Also download and hash the server file before skipping the upload.
+                                         For files that could be modified on the server by another client.
+           kwargs: The uploadFile parameters: chunkSize, progressCallback
+
+        Return
+           {'fileName': serverFileName, 'size':, 'checksum':, 'uploaded': True|False}
+        """
+        if os.path.exists(localFile) is False:
+            raise IxNetRestApiException("File doesn't exists: %s" % localFile)
+
+        if serverFileName is None:
+            serverFileName = os.path.basename(localFile)
+
+        size = os.path.getsize(localFile)
+        checksum = self.getCachedFileChecksum(localFile, checksumAlgorithm=checksumAlgorithm)
+        cached = FileMgmt.uploadCache.get(self.ixnObj.sessionUrl, {}).get(serverFileName)
+
+        isUploaded = False
+        if cached == {'size': size, 'checksum': checksum, 'checksumAlgorithm': checksumAlgorithm}:
+            if verifyServerChecksum:
+                isUploaded = self.getServerFileChecksum(serverFileName, checksumAlgorithm=checksumAlgorithm, size=size) == checksum
+            else:
+                isUploaded = self.getServerFileSize(serverFileName) in [size, -1]
+
+        if isUploaded:
+            self.ixnObj.logInfo('uploadFileCached: The server already has {0}. Skipping the upload.'.format(serverFileName))
+            return {'fileName': serverFileName, 'size': size, 'checksum': checksum, 'uploaded': False}
+
+        # uploadFile records the uploaded file in the uploadCache.
+        result = self.uploadFile(localFile, serverFileName=serverFileName, checksumAlgorithm=checksumAlgorithm, **kwargs)
+        if result['checksum'] != checksum:
+            FileMgmt.uploadCache.get(self.ixnObj.sessionUrl, {}).pop(serverFileName, None)
+            raise IxNetRestApiException('uploadFileCached: {0} changed while it was uploaded'.format(localFile))
+
+        result['uploaded'] = True
+        return result
+
+    def clearUploadCache(self, allSessions=False):
+        """
+        Description
+           Forget the uploaded files so that the next uploadFileCached uploads them again.
+
+        Parameter
+           allSessions: (bool): True: Clear the cache of all the sessions. False: Only this session.
+        """
+        if allSessions:
+            FileMgmt.uploadCache.clear()
+        else:
+            FileMgmt.uploadCache.pop(self.ixnObj.sessionUrl, None)
+
+    @staticmethod
+    def clearSessionUploadCache(sessionId):
+        """
+        Description
+           Forget the files uploaded to a deleted session. The Linux API server reuses the session IDs,
+           so a new session must not inherit the uploadCache of a deleted one.
+
+        Parameter
+           sessionId: (str): http://{apiServerIp:port}/api/v1/sessions/{id} or /api/v1/sessions/{id}
+        """
+        # Compare the /api/v1/sessions/{id} paths. The sessionId is not always a complete URL.
+        sessionPath = '/api'+sessionId.split('/api', 1)[-1]
+        for sessionUrl in list(FileMgmt.uploadCache.keys()):
+            if ('/api'+sessionUrl.split('/api', 1)[-1]+'/').startswith(sessionPath+'/'):
+                FileMgmt.uploadCache.pop(sessionUrl, None)
+
+    def downloadFile(self, serverFileName, localFile, chunkSize=1048576, progressCallback=None, checksumAlgorithm='md5',
+                     expectedChecksum=None):
+        """
+        Description
+           Stream a file from the API server files folder to a local file.
+
+        Parameters
+           serverFileName: (str): The file name in the API server files folder.
+                                  For example: 'captures/packetCaptureFolder/port2_HW.cap'
+           localFile: (str): The local file to create.
+           chunkSize, progressCallback, checksumAlgorithm, expectedChecksum: See downloadResponseToFile.
+
+        Syntax
+           GET: /api/v1/sessions/{id}/ixnetwork/files?filename={serverFileName}
+
+        Return
+           {'fileName': localFile, 'size': bytesWritten, 'checksum': hexDigest|None}
+        """
+        response = self.ixnObj.get(self.ixnObj.sessionUrl+'/files?filename=%s' % (serverFileName), stream=True)
+        return self.downloadResponseToFile(response, localFile, chunkSize=chunkSize, progressCallback=progressCallback,
+                                           checksumAlgorithm=checksumAlgorithm, expectedChecksum=expectedChecksum)
+
+    def downloadResponseToFile(self, response, localFile, chunkSize=1048576, progressCallback=None, checksumAlgorithm='md5',
+                               expectedChecksum=None):
+        """
+        Description
+           Write a streamed GET response to a local file one chunk at a time.
+           The file is written to localFile.part first and renamed when the download is verified,
+           so an interrupted download never leaves a truncated localFile.
+
+        Parameters
+           response: The response of self.ixnObj.get(url, stream=True).
+           localFile: (str): The local file to create.
+           chunkSize: (int): The amount of bytes to write at a time.
+           progressCallback: (function): progressCallback(bytesTransferred, totalBytes).
+                                         totalBytes is None if the server didn't send the content-length.
+                                         Defaults to logging the progress every 10%.
+           checksumAlgorithm: (str): Any hashlib algorithm. None = No checksum.
+           expectedChecksum: (str): Raise an exception if the checksum of the downloaded file is different.
+
+        Return
+           {'fileName': localFile, 'size': bytesWritten, 'checksum': hexDigest|None}
+        """
+        totalBytes = response.headers.get('content-length')
+        if totalBytes is not None:
+            totalBytes = int(totalBytes)
+
+        if progressCallback is None:
+            progressCallback = self.getProgressLogger('downloadFile {0}'.format(localFile))
+
+        checksum = None
+        if checksumAlgorithm:
+            checksum = hashlib.new(checksumAlgorithm)
+
+        bytesWritten = 0
+        tempFile = localFile+'.part'
+        try:
+            with open(tempFile, 'wb') as fileObj:
+                for chunk in response.iter_content(chunk_size=chunkSize):
+                    fileObj.write(chunk)
+                    if checksum:
+                        checksum.update(chunk)
+
+                    bytesWritten += len(chunk)
+                    progressCallback(bytesWritten, totalBytes)
+        finally:
+            response.close()
+
+        # iter_content decodes a compressed response, so the size is only verified for uncompressed content.
+        if totalBytes is not None and response.headers.get('content-encoding') is None and bytesWritten != totalBytes:
+            os.remove(tempFile)
+            raise IxNetRestApiException('downloadFile: Received {0} of {1} bytes: {2}'.format(bytesWritten, totalBytes, localFile))
+
+        hexDigest = None
+        if checksum:
+            hexDigest = checksum.hexdigest()
+
+        if expectedChecksum and hexDigest != expectedChecksum:
+            os.remove(tempFile)
+            raise IxNetRestApiException('downloadFile: Checksum {0} is not the expected checksum {1}: {2}'.format(
+                hexDigest, expectedChecksum, localFile))
+
+        if os.path.exists(localFile):
+            # Python 2 os.rename doesn't replace an existing file on Windows.
+            os.remove(localFile)
+        os.rename(tempFile, localFile)
+
+        return {'fileName': localFile, 'size': bytesWritten, 'checksum': hexDigest}
+
     def copyFileWindowsToRemoteWindows(self, windowsPathAndFileName, localPath, renameDestinationFile=None, includeTimestamp=False):
         """
         Description
@@ -122,7 +494,6 @@ class FileMgmt(object):
             if renameDestinationFile is not None:
                 fileName = renameDestinationFile
 
-            contents = requestStatus.raw.read()
 
             if includeTimestamp:
                 tempFileName = fileName.split('.')
@@ -136,8 +507,7 @@ class FileMgmt(object):
             else:
                 localPath = localPath+'/'+fileName
 
-            with open(localPath, 'wb') as downloadedFileContents:
-                downloadedFileContents.write(contents)
+            self.downloadResponseToFile(requestStatus, localPath)
 
             response = self.ixnObj.get(self.ixnObj.sessionUrl+'/files')
 
@@ -186,7 +556,6 @@ class FileMgmt(object):
             if renameDestinationFile is not None:
                 fileName = renameDestinationFile
 
-            contents = requestStatus.raw.read()
             if includeTimestamp:
                 tempFileName = fileName.split('.')
                 if len(tempFileName) > 1:
@@ -199,8 +568,7 @@ class FileMgmt(object):
             else:
                 localPath = localPath+'/'+fileName
 
-            with open(localPath, 'wb') as downloadedFileContents:
-                downloadedFileContents.write(contents)
+            self.downloadResponseToFile(requestStatus, localPath)
 
             self.ixnObj.logInfo('\nA copy of your saved file/report is in:\n\t%s' % (windowsPathAndFileName))
             self.ixnObj.logInfo('\ncopyFileWindowsToLocalLinux: %s' % localPath)
@@ -301,7 +669,6 @@ class FileMgmt(object):
                 # This extension means that it has an extended path: captures/<temp folder>/fileToGet
                 fileName = linuxApiServerPathExtension.split('/')[-1]
 
-            contents = response.raw.read()
 
             if includeTimestamp:
                 if linuxApiServerPathAndFileNameAsIs:
@@ -320,8 +687,7 @@ class FileMgmt(object):
 
             # Step 3 of 3:
             self.ixnObj.logInfo('\ncopyFileLinuxToLocalLinux: %s' % localPath)
-            with open(localPath, 'wb') as downloadedFileContents:
-                downloadedFileContents.write(contents)
+            self.downloadResponseToFile(response, localPath)
 
             self.ixnObj.logInfo('\nA copy of your saved file/report is in:\n\t%s' % (linuxApiServerPathAndFileName))
         else:
@@ -382,6 +748,12 @@ class FileMgmt(object):
                            "arg2": json.dumps(dataObj),
                            "arg3": arg3}
 
+        jsonConfigCache = getattr(self.ixnObj, 'jsonConfigCache', None)
+        if jsonConfigCache is not None and option == 'modify':
+            # Only the imported regions of the cached JSON config are invalidated.
+            jsonObjList = dataObj if isinstance(dataObj, list) else [dataObj]
+            jsonConfigCache.importXpathList = [jsonObj.get('xpath', '/') for jsonObj in jsonObjList]
+
         url = self.ixnObj.sessionUrl+'/resourceManager/operations/importconfig'
         response = self.ixnObj.post(url, data=dataReformatted, silentMode=silentMode)
         response = self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'], silentMode=False, timeout=timeout)
@@ -398,7 +770,7 @@ class FileMgmt(object):
             self.ixnObj.logInfo('importJsonConfigObj: No error in JSON import')
 
 
-    def importJsonConfigFile(self, jsonFileName, option='modify'):
+    def importJsonConfigFile(self, jsonFileName, option='modify', useUploadCache=True):
         """
         Description
             To import a JSON config file to IxNetwork.
@@ -411,6 +783,8 @@ class FileMgmt(object):
         Parameters
             jsonFileName: (json object): The JSON config file. Could include absolute path also.
             option: (str): newConfig|modify
+            useUploadCache: (bool): True: Don't upload the file if the identical file was already
+                                    uploaded to this session and the server still has it.
         """
         if option is 'modify':
             arg3 = False
@@ -418,20 +792,12 @@ class FileMgmt(object):
             arg3 = True
 
         fileName = jsonFileName.split('/')[-1]
-        uploadFile = self.ixnObj.sessionUrl+'/files?filename='+fileName
 
-        if self.ixnObj.serverOs == 'linux':
-            headers = {'content-type': 'application/octet-stream', 'x-api-key': self.ixnObj.apiKey}
+        # 1> Stream the config file to the server and give it any name you want for the filename
+        if useUploadCache:
+            self.uploadFileCached(jsonFileName, serverFileName=fileName)
         else:
-            headers = {'content-type': 'application/octet-stream'}
-
-        # 1> Upload the config file to the server and give it any name you want for the filename
-        self.ixnObj.logInfo('Uploading file to server: %s' % uploadFile)
-        with open(jsonFileName, mode='rb') as file:
-            configContents = file.read()
-            configContents = io.BytesIO(configContents)
-            response = self.ixnObj.post(uploadFile, data=configContents, noDataJsonDumps=True,
-                                        headers=headers, silentMode=False)
+            self.uploadFile(jsonFileName, serverFileName=fileName)
 
         # 2> Tell IxNetwork to import the JSON config file
         data = {"arg1": "{0}/ixnetwork/resourceManager".format(self.ixnObj.headlessSessionId),
@@ -556,6 +922,60 @@ class FileMgmt(object):
         response = self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'], silentMode=False)
         return json.loads(response.json()['result'])
 
+    def importJsonConfigDiff(self, desiredConfig, currentConfig=None, xpathList=None, ignoreAttributes=None,
+                             ignoreRemovals=False, timeout=90):
+        """
+        Description
+            Change the current configuration to the desiredConfig by importing only the differences.
+            The xpath level changes are imported with one importJsonConfigObj(option='modify').
+            Switching between test variants of the same config is a small import instead of a loadconfig.
+
+        Parameters
+            desiredConfig: (dict|str): The desired JSON config or a JSON config file.
+            currentConfig: (dict): Optional: The current JSON config if it was already exported.
+                                   Defaults to the cached config of mainObj.getJsonConfigCache() or
+                                   to exportJsonConfigToDict(xpathList) if xpathList is provided.
+            xpathList: (list): The part of the configuration to compare. For example ['/traffic/descendant-or-self::*']
+                               The desiredConfig must be the same part of the configuration.
+            ignoreAttributes: (list): Attribute names to never compare.
+            ignoreRemovals: (bool): A modify import could not delete objects.
+                                    False: Raise an exception if the current config has objects that the
+                                           desiredConfig doesn't have. Nothing is imported.
+                                    True: Import the other changes and leave these objects.
+            timeout: (int): The import timeout.
+
+        Return
+            The IxNetRestApiJsonConfig.diffJsonConfig() result: {'modify': [], 'create': [], 'remove': []}
+
+        Example
+            fileMgmtObj.importJsonConfigDiff('/path/bgpVariant2.json')
+        """
+        from IxNetRestApiJsonConfig import diffJsonConfig, getJsonConfigDiffImportList
+
+        if isinstance(desiredConfig, dict) == False:
+            desiredConfig = self.jsonReadConfig(desiredConfig)
+
+        if currentConfig is None and xpathList is None:
+            currentConfig = self.ixnObj.getJsonConfigCache().getConfig()
+
+        if currentConfig is None:
+            currentConfig = self.exportJsonConfigToDict(xpathList)
+
+        diff = diffJsonConfig(currentConfig, desiredConfig, ignoreAttributes=ignoreAttributes)
+        self.ixnObj.logInfo('importJsonConfigDiff: modify={0} create={1} remove={2}'.format(
+            len(diff['modify']), len(diff['create']), len(diff['remove'])))
+
+        if diff['remove'] and ignoreRemovals == False:
+            raise IxNetRestApiException('importJsonConfigDiff: A modify import could not remove: {0}'.format(diff['remove']))
+
+        importList = getJsonConfigDiffImportList(diff)
+        if importList == []:
+            self.ixnObj.logInfo('importJsonConfigDiff: The configuration is already the desiredConfig')
+            return diff
+
+        self.importJsonConfigObj(importList, option='modify', timeout=timeout)
+        return diff
+
     def getJsonConfigPortList(self, jsonData):
         """
         Description
@@ -634,3 +1054,51 @@ class FileMgmt(object):
 
         if self.ixnObj.serverOs == 'linux':
             self.copyFileLinuxToLocalLinux(linuxApiServerPathAndFileName=absolutePath+'/'+diagZipFilename, localPath=localPath)
+
+
+class UploadFileReader(object):
+    def __init__(self, fileObj, totalSize, chunkSize=1048576, progressCallback=None, checksumAlgorithm='md5'):
+        """
+        Description
+           A file-like request body that reads the file while it is sent.
+           The size is known up front so that the request has a content-length instead of
+           being sent chunked. The checksum and progress are updated on each read.
+
+        Parameters
+           fileObj: The file object opened in binary mode.
+           totalSize: (int): The file size.
+           chunkSize: (int): The amount of bytes for each iteration.
+           progressCallback: (function): progressCallback(bytesTransferred, totalBytes)
+           checksumAlgorithm: (str): Any hashlib algorithm. None = No checksum.
+        """
+        self.fileObj = fileObj
+        self.totalSize = totalSize
+        self.chunkSize = chunkSize
+        self.progressCallback = progressCallback
+        self.bytesRead = 0
+        self.checksum = None
+        if checksumAlgorithm:
+            self.checksum = hashlib.new(checksumAlgorithm)
+
+    def __len__(self):
+        return self.totalSize
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.chunkSize
+
+        chunk = self.fileObj.read(size)
+        if chunk:
+            self.bytesRead += len(chunk)
+            if self.checksum:
+                self.checksum.update(chunk)
+            if self.progressCallback:
+                self.progressCallback(self.bytesRead, self.totalSize)
+        return chunk
+
+    def __iter__(self):
+        return iter(lambda: self.read(self.chunkSize), b'')
+
+    def getChecksum(self):
+        if self.checksum:
+            return self.checksum.hexdigest()
@@ -0,0 +1,494 @@
+
+# PLEASE READ DISCLAIMER
+#
+#    This class demonstrates sample IxNetwork REST API usage for
+#    demo and reference purpose only.
+#    It is subject to change for updates without warning.
+#
+# DESCRIPTION
+#    Compare two JSON configs exported by the resourceManager and get the
+#    xpath level changes to go from one to the other.
+#    The changes could be imported with one FileMgmt.importJsonConfigObj(option='modify')
+#    instead of loading the whole config again.
+#
+#    JsonConfigCache keeps an exported JSON config with an xpath and name index.
+#    Connect notifies the cache whenever post/patch/delete modify the configuration
+#    so only the affected regions are exported again on the next lookup.
+#
+#    jsonConfigCache = mainObj.getJsonConfigCache()
+#    jsonConfigCache.getNode('/traffic/trafficItem[1]')
+#    jsonConfigCache.getXpathByName('trafficItem', 'Topo-BGP')
+#
+# REQUIREMENTS
+#    - Python modules: none
+#
+
+import re
+from collections import OrderedDict
+
+def isJsonConfigObject(value):
+    """
+    Description
+       JSON config objects are dicts with an xpath. For example a vport, a traffic item or a multivalue.
+    """
+    return isinstance(value, dict) and 'xpath' in value
+
+def getJsonConfigChildren(jsonObj):
+    """
+    Description
+       The child objects of a JSON config object in the config order.
+    """
+    childList = []
+    for key, value in jsonObj.items():
+        if isJsonConfigObject(value):
+            childList.append(value)
+
+        if isinstance(value, list):
+            childList.extend([child for child in value if isJsonConfigObject(child)])
+    return childList
+
+def getJsonConfigAttributes(jsonObj):
+    """
+    Description
+       The attributes of a JSON config object without its child objects.
+    """
+    attributes = {}
+    for key, value in jsonObj.items():
+        if key == 'xpath' or isJsonConfigObject(value):
+            continue
+
+        if isinstance(value, list) and value != [] and all([isJsonConfigObject(child) for child in value]):
+            continue
+
+        attributes[key] = value
+    return attributes
+
+def flattenJsonConfig(jsonConfig):
+    """
+    Description
+       Index a JSON config by xpath.
+
+    Parameter
+       jsonConfig: (dict|list): The exportJsonConfigToDict() config or a list of JSON config objects.
+
+    Return
+       An OrderedDict in the config order, parents before children:
+          {xpath: JSON config object}
+    """
+    xpathIndex = OrderedDict()
+    # A stack in reverse order: Depth first so that an object is followed by its children.
+    pending = list(reversed(jsonConfig)) if isinstance(jsonConfig, list) else [jsonConfig]
+    while pending:
+        jsonObj = pending.pop()
+        if isJsonConfigObject(jsonObj) == False:
+            continue
+
+        xpathIndex[jsonObj['xpath']] = jsonObj
+        pending.extend(reversed(getJsonConfigChildren(jsonObj)))
+    return xpathIndex
+
+def diffJsonConfig(currentConfig, desiredConfig, ignoreAttributes=None):
+    """
+    Description
+       Get the changes to go from the currentConfig to the desiredConfig.
+
+    Parameters
+       currentConfig: (dict): The exportJsonConfigToDict() of the current config.
+       desiredConfig: (dict): The desired config in the same format.
+                              For example another test variant exported with exportJsonConfigToDict or exportJsonConfigFile.
+       ignoreAttributes: (list): Attribute names to never compare.
+
+    Return
+       {'modify': [{'xpath': xpath, <only the changed attributes>}, ...],
+        'create': [<the whole desired object of each new xpath including its children>, ...],
+        'remove': [<the xpaths only in the currentConfig>, ...]}
+
+       The modify and create lists are in the config order so that they could be imported as is.
+       Changing a multivalue pattern, for example from singleValue to counter, is a create of
+       the new pattern. The old pattern is replaced by the import and is not listed in remove.
+    """
+    if ignoreAttributes is None:
+        ignoreAttributes = []
+
+    currentIndex = flattenJsonConfig(currentConfig)
+    desiredIndex = flattenJsonConfig(desiredConfig)
+    diff = {'modify': [], 'create': [], 'remove': []}
+
+    def compare(desiredObj):
+        xpath = desiredObj['xpath']
+        if xpath not in currentIndex:
+            # The new object is imported with its children, including its multivalues.
+            diff['create'].append(desiredObj)
+            return
+
+        currentObj = currentIndex[xpath]
+        currentAttributes = getJsonConfigAttributes(currentObj)
+        changes = OrderedDict()
+        for attribute, value in getJsonConfigAttributes(desiredObj).items():
+            if attribute in ignoreAttributes:
+                continue
+
+            if value == [] and attribute not in currentAttributes and attribute in currentObj:
+                # An empty child object list. The current child objects are removals.
+                continue
+
+            if attribute not in currentAttributes or currentAttributes[attribute] != value:
+                changes[attribute] = value
+
+        if changes:
+            modify = OrderedDict([('xpath', xpath)])
+            modify.update(changes)
+            diff['modify'].append(modify)
+
+        for child in getJsonConfigChildren(desiredObj):
+            compare(child)
+
+    def findRemoved(currentObj, parentXpath):
+        xpath = currentObj['xpath']
+        if xpath not in desiredIndex:
+            isMultivaluePattern = parentXpath is not None and parentXpath.startswith('/multivalue[') and \
+                                  parentXpath in desiredIndex
+            if isMultivaluePattern == False:
+                diff['remove'].append(xpath)
+            return
+
+        for child in getJsonConfigChildren(currentObj):
+            findRemoved(child, xpath)
+
+    for desiredObj in (desiredConfig if isinstance(desiredConfig, list) else [desiredConfig]):
+        if isJsonConfigObject(desiredObj):
+            compare(desiredObj)
+
+    for currentObj in (currentConfig if isinstance(currentConfig, list) else [currentConfig]):
+        if isJsonConfigObject(currentObj):
+            findRemoved(currentObj, None)
+
+    return diff
+
+def getJsonConfigDiffImportList(diff):
+    """
+    Description
+       The diffJsonConfig changes as one list for importJsonConfigObj(option='modify').
+       The new objects are created before the existing objects are modified because a
+       modified attribute could reference a new object.
+    """
+    return diff['create'] + diff['modify']
+
+
+class JsonConfigCache(object):
+    # Operations that replace the whole configuration.
+    # importconfig only replaces the imported xpaths when FileMgmt provides them.
+    reloadOperationList = ['loadconfig', 'newconfig', 'importconfigfile', 'importconfig']
+
+    # Operations that don't modify the configuration.
+    readOnlyOperationList = ['query', 'getvalues', 'exportconfig', 'exportconfigfile', 'copyfile', 'collectlogs']
+
+    # Operations that only change the runtime state: sessions, traffic, captures and views.
+    runtimeOperationList = ['start', 'stop', 'restartdown', 'abort', 'startallprotocols', 'stopallprotocols',
+                            'clearstats', 'apply', 'applyonthefly', 'applytraffic',
+                            'startstatelesstraffic', 'startstatelesstrafficblocking',
+                            'stopstatelesstraffic', 'stopstatelesstrafficblocking',
+                            'sendarp', 'sendns', 'sendping', 'sendrs', 'linkupdn',
+                            'igmpjoingroup', 'igmpleavegroup', 'mldjoingroup', 'mldleavegroup',
+                            'startcapture', 'stopcapture', 'savecapturefiles',
+                            'getpacketfromdatacapture', 'getpacketfromcontrolcapture',
+                            'takeviewcsvsnapshot', 'removealltclviews', 'closealltabs', 'generatereport',
+                            'refreshinfo', 'releaseport', 'resetportcpu', 'clearownership', 'connecttochassis', 'run']
+
+    # Root level operations that modify a region of the configuration.
+    # The other root level operations don't modify the configuration.
+    rootOperationRegion = {'assignports': '/vport', 'unassignports': '/vport'}
+
+    # Top level nodes that only hold runtime data.
+    runtimeNodeList = ['statistics', 'availableHardware']
+
+    def __init__(self, ixnObj=None):
+        """
+        Description
+           A local snapshot of the exported JSON config with an xpath index and a name index.
+           The config is exported once. The regions modified afterwards, for example
+           /topology[1], /vport[2] or /traffic, are exported again on the next lookup.
+
+        Parameter
+           ixnObj: (Object): The main Connect object.
+
+        Notes
+           Don't instantiate this class directly. Use mainObj.getJsonConfigCache() so that a single
+           cache is shared and registered to be notified of configuration changes.
+
+           The returned nodes are the cached objects. Don't modify them.
+        """
+        self.ixnObj = ixnObj
+        self.config = None
+        self.xpathIndex = {}
+        self.nameIndex = {}
+        self.nodeIndex = {}
+        self.dirtyRegionList = set()
+        self.importXpathList = None
+
+    def setMainObject(self, mainObject):
+        """
+        Description
+            For Python Robot Framework support.
+        """
+        self.ixnObj = mainObject
+
+    def exportConfig(self, xpathList):
+        from IxNetRestApiFileMgmt import FileMgmt
+        return FileMgmt(self.ixnObj).exportJsonConfigToDict(xpathList)
+
+    def getRegion(self, xpath):
+        """
+        Description
+           The top level region of an xpath. The region is exported again when it is modified.
+
+        Parameter
+           xpath: (str): /topology[1]/deviceGroup[1] | /traffic/trafficItem[2] | /multivalue[@source = '/topology[1]/...']
+
+        Return
+           /topology[1] | /traffic | None for the whole config
+        """
+        # The multivalues are exported inside the object that uses them.
+        match = re.match("/multivalue\\[@source = '(/[a-zA-Z0-9]+(\\[[0-9]+\\])?)", xpath)
+        if match is None:
+            match = re.match('(/[a-zA-Z0-9]+(\\[[0-9]+\\])?)', xpath)
+
+        if match is None:
+            return None
+        return match.group(1)
+
+    def getUrlRegion(self, url):
+        """
+        Description
+           The region modified by a REST API URL.
+
+        Parameter
+           url: (str): https://{apiServerIp}/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1
+
+        Return
+           '' if the URL doesn't modify the configuration, /topology[1] or None for the whole config.
+        """
+        match = re.match('.*/api/v[0-9]+/sessions/[0-9]+/ixnetwork(/[^?]*)?$', url)
+        if match is None:
+            return ''
+
+        path = match.group(1) or '/'
+        match = re.match('(.*)/operations/([^/]+)', path)
+        if match:
+            operation = match.group(2).lower()
+            if operation in self.readOnlyOperationList or operation in self.runtimeOperationList:
+                return ''
+
+            if operation in self.reloadOperationList:
+                return None
+
+            if match.group(1) == '':
+                return self.rootOperationRegion.get(operation, '')
+
+        match = re.match('/([a-zA-Z0-9]+)(/([0-9]+))?', path)
+        if match is None:
+            return None
+
+        if match.group(1) in self.runtimeNodeList:
+            return ''
+
+        if match.group(1) == 'resourceManager':
+            return None
+
+        if match.group(1) == 'multivalue':
+            # The REST multivalue ID doesn't tell which object uses it.
+            return '/topology'
+
+        if match.group(3) is None:
+            return '/'+match.group(1)
+        return '/{0}[{1}]'.format(match.group(1), match.group(3))
+
+    def invalidate(self, method, url):
+        """
+        Description
+           Invalidate the region of the config affected by a configuration change.
+           Connect calls this after each successful POST, PATCH and DELETE.
+
+        Parameters
+           method: (str): POST|PATCH|DELETE
+           url: (str): The REST API URL that was modified.
+        """
+        if self.config is None:
+            return
+
+        if url.split('?')[0].endswith('/operations/importconfig') and self.importXpathList is not None:
+            # FileMgmt.importJsonConfigObj provided the imported xpaths.
+            self.invalidateXpaths(self.importXpathList)
+            self.importXpathList = None
+            return
+
+        region = self.getUrlRegion(url)
+        if region == '':
+            return
+
+        if region is None:
+            self.clear()
+        else:
+            self.dirtyRegionList.add(region)
+
+    def invalidateXpaths(self, xpathList):
+        """
+        Description
+           Invalidate the regions of the xpaths. For example the xpaths of a JSON import.
+
+        Parameter
+           xpathList: (list): ['/traffic/trafficItem[1]', '/vport[2]']
+        """
+        for xpath in xpathList:
+            region = self.getRegion(xpath)
+            if region is None:
+                self.clear()
+                return
+            self.dirtyRegionList.add(region)
+
+    def clear(self):
+        """
+        Description
+           Forget the whole config. It is exported again on the next lookup.
+        """
+        self.config = None
+        self.xpathIndex = {}
+        self.nameIndex = {}
+        self.nodeIndex = {}
+        self.dirtyRegionList = set()
+
+    def refresh(self):
+        """
+        Description
+           Export the whole config the first time and the modified regions afterwards.
+        """
+        if self.config is None:
+            self.config = self.exportConfig(['/descendant-or-self::*'])
+            self.dirtyRegionList = set()
+            self.buildIndex()
+            return
+
+        if self.dirtyRegionList == set():
+            return
+
+        # A list region like /topology replaces its /topology[N] regions.
+        regionList = sorted(self.dirtyRegionList)
+        regionList = [region for region in regionList if '[' not in region or region.split('[')[0] not in regionList]
+        regionConfig = self.exportConfig([region+'/descendant-or-self::*' for region in regionList])
+
+        for region in regionList:
+            self._mergeRegion(region, regionConfig)
+
+        self.dirtyRegionList = set()
+        self.buildIndex()
+
+    def _mergeRegion(self, region, regionConfig):
+        match = re.match('/([a-zA-Z0-9]+)(\\[[0-9]+\\])?', region)
+        key = match.group(1)
+        if match.group(2) is None:
+            if key in regionConfig:
+                self.config[key] = regionConfig[key]
+            else:
+                self.config.pop(key, None)
+            return
+
+        # Replace, add or remove the one object in the list.
+        newObj = None
+        for jsonObj in regionConfig.get(key, []):
+            if isJsonConfigObject(jsonObj) and jsonObj['xpath'] == region:
+                newObj = jsonObj
+
+        objList = [jsonObj for jsonObj in self.config.get(key, []) if jsonObj.get('xpath') != region]
+        if newObj is not None:
+            objList.append(newObj)
+            objList.sort(key=lambda jsonObj: int(re.search('\\[([0-9]+)\\]$', jsonObj['xpath']).group(1)))
+        self.config[key] = objList
+
+    def buildIndex(self):
+        """
+        Description
+           Index the cached config by xpath, by object type and by object name.
+           The type and name indexes are in the config order.
+        """
+        self.xpathIndex = {}
+        self.nameIndex = {}
+        self.nodeIndex = {}
+
+        pending = [(None, self.config)]
+        while pending:
+            nodeName, jsonObj = pending.pop()
+            xpath = jsonObj['xpath']
+            self.xpathIndex[xpath] = jsonObj
+            if nodeName is not None:
+                self.nodeIndex.setdefault(nodeName, []).append(xpath)
+                if jsonObj.get('name') is not None and isinstance(jsonObj['name'], (dict, list)) == False:
+                    self.nameIndex.setdefault((nodeName, jsonObj['name']), []).append(xpath)
+
+            for key, value in jsonObj.items():
+                if isJsonConfigObject(value):
+                    pending.append((key, value))
+
+                if isinstance(value, list):
+                    pending.extend([(key, child) for child in reversed(value) if isJsonConfigObject(child)])
+
+    def getConfig(self):
+        """
+        Description
+           Get the whole cached config in the exportJsonConfigToDict format.
+        """
+        self.refresh()
+        return self.config
+
+    def getNode(self, xpath):
+        """
+        Description
+           Get the JSON config object of an xpath.
+
+        Parameter
+           xpath: (str): /traffic/trafficItem[1]
+
+        Return
+           The JSON config object or None
+        """
+        self.refresh()
+        return self.xpathIndex.get(xpath)
+
+    def getNodes(self, nodeName):
+        """
+        Description
+           Get all the JSON config objects of a type in the config order.
+
+        Parameter
+           nodeName: (str): The JSON config key. For example: trafficItem, deviceGroup, bgpIpv4Peer, vport.
+        """
+        self.refresh()
+        return [self.xpathIndex[xpath] for xpath in self.nodeIndex.get(nodeName, [])]
+
+    def getXpathByName(self, nodeName, name):
+        """
+        Description
+           Get the xpath of an object by its name.
+
+        Parameters
+           nodeName: (str): The JSON config key. For example: topology, trafficItem.
+           name: (str): The object name.
+
+        Return
+           The xpath or None. If several objects have the name, the first one in the config.
+        """
+        self.refresh()
+        xpathList = self.nameIndex.get((nodeName, name))
+        if xpathList:
+            return xpathList[0]
+        return None
+
+    def getNodeByName(self, nodeName, name):
+        """
+        Description
+           Get the JSON config object by its name. See getXpathByName.
+        """
+        xpath = self.getXpathByName(nodeName, name)
+        if xpath is None:
+            return None
+        return self.xpathIndex[xpath]
+
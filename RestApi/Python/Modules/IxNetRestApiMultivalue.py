@@ -0,0 +1,516 @@
+
+# PLEASE READ DISCLAIMER
+#
+#    This class demonstrates sample IxNetwork REST API usage for
+#    demo and reference purpose only.
+#    It is subject to change for updates without warning.
+#
+# DESCRIPTION
+#    A client-side model of a multivalue.
+#    The pattern definition is read once (singleValue, counter, valueList and the overlays)
+#    and the values are calculated in Python when they are needed instead of asking the
+#    API server to send every value with /multivalue/operations/getValues.
+#
+#    Patterns and formats that could not be calculated exactly the way the API server does
+#    are reported as not supported so that the caller gets them from the API server:
+#       - random, repeatableRandom, custom, alternate, distributed, string, ... patterns
+#       - Enabled nest steps (a different counter start for each port or parent device)
+#       - Counters with a format other than ipv4, ipv6, mac and decimal, or that would wrap around
+#       - Overlays with a count other than 1
+#
+#    multivalueObj = MultivalueModel.fromServer(mainObj, '/api/v1/sessions/1/ixnetwork/multivalue/5')
+#    if multivalueObj.isSupported():
+#        multivalueObj[99999]
+#        multivalueObj.getValues()
+#
+#    MultivalueEditor applies sparse changes to a multivalue. A few changes are sent as
+#    overlays. Many changes are sent as one valueList, or as a singleValue when all the values are the same.
+#
+#    editorObj = MultivalueEditor(mainObj, '/api/v1/sessions/1/ixnetwork/multivalue/6')
+#    editorObj.setIndexes([0, 5, 9000], 'false')
+#    editorObj.apply()
+#
+# REQUIREMENTS
+#    - Python modules: requests
+#
+
+import sys
+
+# The bit width of the counter formats. The decimal counters are limited to 32 bits.
+formatBitWidth = {'ipv4': 32, 'ipv6': 128, 'mac': 48, 'decimal': 32}
+
+def parseValue(value, valueFormat):
+    """
+    Description
+       Convert a multivalue value to an integer.
+
+    Parameters
+       value: (str): 1.1.1.1 | 2000::1 | 00:01:01:00:00:01 | 100
+       valueFormat: (str): ipv4|ipv6|mac|decimal
+    """
+    value = str(value).strip()
+    if valueFormat == 'ipv4':
+        octetList = [int(octet) for octet in value.split('.')]
+        if len(octetList) != 4:
+            raise ValueError('Invalid IPv4 address: {0}'.format(value))
+        return (octetList[0] << 24) + (octetList[1] << 16) + (octetList[2] << 8) + octetList[3]
+
+    if valueFormat == 'ipv6':
+        if '::' in value:
+            head, tail = value.split('::')
+            headList = head.split(':') if head else []
+            tailList = tail.split(':') if tail else []
+            groupList = headList + ['0'] * (8 - len(headList) - len(tailList)) + tailList
+        else:
+            groupList = value.split(':')
+
+        if len(groupList) != 8:
+            raise ValueError('Invalid IPv6 address: {0}'.format(value))
+
+        intValue = 0
+        for group in groupList:
+            intValue = (intValue << 16) + int(group, 16)
+        return intValue
+
+    if valueFormat == 'mac':
+        byteList = value.replace('-', ':').split(':')
+        if len(byteList) != 6:
+            raise ValueError('Invalid MAC address: {0}'.format(value))
+        return int(''.join(['%02x' % int(byte, 16) for byte in byteList]), 16)
+
+    if valueFormat == 'decimal':
+        return int(value)
+
+    raise ValueError('Unsupported format: {0}'.format(valueFormat))
+
+def formatValue(intValue, valueFormat):
+    """
+    Description
+       Convert an integer to the multivalue value format the API server uses.
+          ipv4: 1.1.1.1
+          ipv6: 2000:0:0:0:0:0:0:1
+          mac: 00:01:01:00:00:01
+          decimal: 100
+    """
+    if valueFormat == 'ipv4':
+        return '.'.join([str((intValue >> shift) & 0xff) for shift in [24, 16, 8, 0]])
+
+    if valueFormat == 'ipv6':
+        return ':'.join(['%x' % ((intValue >> shift) & 0xffff) for shift in range(112, -1, -16)])
+
+    if valueFormat == 'mac':
+        return ':'.join(['%02x' % ((intValue >> shift) & 0xff) for shift in range(40, -1, -8)])
+
+    return str(intValue)
+
+def toMultivalueValue(value):
+    """
+    Description
+       Convert a Python value to the string value the API server uses. True -> 'true'.
+    """
+    if value is True or value is False:
+        return str(value).lower()
+
+    return str(value)
+
+def getValueIndexMap(valueList):
+    """
+    Description
+       Map each value to the index of its first occurrence. Replaces the repeated
+       valueList.index(value) lookups, which search the whole list every time.
+
+    Parameter
+       valueList: (list): ['10.10.10.1', '10.10.10.2', ...]
+
+    Return
+       A dict: {'10.10.10.1': 0, '10.10.10.2': 1, ...}
+    """
+    indexMap = {}
+    for index, value in enumerate(valueList):
+        indexMap.setdefault(value, index)
+    return indexMap
+
+def getMany(ixnObj, urlList):
+    """
+    Description
+       GET the URLs. More than one URL is sent concurrently.
+    """
+    if len(urlList) > 1 and sys.version_info[0] >= 3:
+        return ixnObj.getAsyncConnect().getMany(urlList, silentMode=True)
+
+    return [ixnObj.get(url, silentMode=True) for url in urlList]
+
+def sendMany(ixnObj, method, requestList):
+    """
+    Description
+       POST or PATCH the (url, data) requests. More than one request is sent concurrently.
+
+    Parameters
+       method: (str): post|patch
+    """
+    if len(requestList) > 1 and sys.version_info[0] >= 3:
+        asyncObj = ixnObj.getAsyncConnect()
+        if method == 'post':
+            return asyncObj.postMany(requestList, silentMode=True)
+        return asyncObj.patchMany(requestList, silentMode=True)
+
+    sendRequest = ixnObj.post if method == 'post' else ixnObj.patch
+    return [sendRequest(url, data=data, silentMode=True) for url, data in requestList]
+
+
+class MultivalueModel(object):
+    supportedPatternList = ['singleValue', 'counter', 'valueList']
+
+    def __init__(self, multivalueObj, multivalue, patternData=None, overlayList=None, nestList=None):
+        """
+        Description
+           A multivalue pattern that calculates its values on demand.
+
+        Parameters
+           multivalueObj: (str): /api/v1/sessions/1/ixnetwork/multivalue/5
+           multivalue: (dict): The GET response of the multivalue: {'count':, 'format':, 'pattern':, ...}
+           patternData: (dict): The GET response of the pattern. For example of multivalue/5/counter.
+           overlayList: (list): The GET response of multivalue/5/overlay.
+           nestList: (list): The GET response of multivalue/5/nest.
+
+        Notes
+           Use fromServer or fromServerBulk to read the multivalue from the API server.
+        """
+        self.multivalueObj = multivalueObj
+        self.count = multivalue.get('count', 0)
+        self.format = multivalue.get('format')
+        self.pattern = multivalue.get('pattern')
+        self.patternData = patternData or {}
+        self.overlays = {}
+        self.overlayHrefs = {}
+        self.unsupportedReason = None
+
+        for overlay in overlayList or []:
+            if int(overlay.get('count', 1)) != 1:
+                self.unsupportedReason = 'An overlay has a count of {0}'.format(overlay.get('count'))
+                continue
+            # The overlay index is based one.
+            index = int(overlay['index']) - 1
+            self.overlays[index] = overlay['value']
+            if 'links' in overlay:
+                self.overlayHrefs[index] = overlay['links'][0]['href']
+
+        if self.pattern not in self.supportedPatternList:
+            self.unsupportedReason = 'The {0} pattern is calculated by the API server'.format(self.pattern)
+            return
+
+        for nest in nestList or []:
+            if nest.get('enabled') in [True, 'true']:
+                self.unsupportedReason = 'The nest steps are enabled'
+                return
+
+        if self.unsupportedReason:
+            return
+
+        if self.pattern == 'counter':
+            self._initCounter()
+
+        if self.pattern == 'valueList' and self.patternData.get('values', []) == [] and self.count > 0:
+            self.unsupportedReason = 'The valueList is empty'
+
+    def _initCounter(self):
+        if self.format not in formatBitWidth:
+            self.unsupportedReason = 'Counters with the {0} format are calculated by the API server'.format(self.format)
+            return
+
+        try:
+            self.counterStart = parseValue(self.patternData['start'], self.format)
+            self.counterStep = parseValue(self.patternData['step'], self.format)
+        except (KeyError, ValueError) as errMsg:
+            self.unsupportedReason = 'Invalid counter: {0}'.format(errMsg)
+            return
+
+        if self.patternData.get('direction') == 'decrement':
+            self.counterStep = -self.counterStep
+
+        # The API server wraps around differently for each attribute. Let the server calculate those.
+        lastValue = self.counterStart + self.counterStep * max(0, self.count - 1)
+        if lastValue < 0 or lastValue >= 2 ** formatBitWidth[self.format]:
+            self.unsupportedReason = 'The counter wraps around'
+
+    @classmethod
+    def fromServer(cls, ixnObj, multivalueObj):
+        """
+        Description
+           Read the multivalue pattern from the API server.
+
+        Parameters
+           ixnObj: The main Connect object.
+           multivalueObj: (str): /api/v1/sessions/1/ixnetwork/multivalue/5
+        """
+        return cls.fromServerBulk(ixnObj, [multivalueObj])[multivalueObj]
+
+    @classmethod
+    def fromServerBulk(cls, ixnObj, multivalueObjList):
+        """
+        Description
+           Read many multivalue patterns from the API server.
+           All the multivalues are read concurrently and then all the pattern, overlay and nest
+           objects are read concurrently.
+
+        Parameters
+           ixnObj: The main Connect object.
+           multivalueObjList: (list): ['/api/v1/sessions/1/ixnetwork/multivalue/5', ...]
+
+        Return
+           A dict: {multivalueObj: MultivalueModel}
+        """
+        multivalueObjList = list(dict.fromkeys(multivalueObjList))
+        responseList = getMany(ixnObj, [ixnObj.httpHeader+multivalueObj+'?includes=count,format,pattern'
+                                        for multivalueObj in multivalueObjList])
+        multivalueList = [response.json() for response in responseList]
+
+        # The overlays are read for all the patterns to know which overlay objects to modify.
+        urlList = []
+        for multivalueObj, multivalue in zip(multivalueObjList, multivalueList):
+            urlList.append(ixnObj.httpHeader+multivalueObj+'/overlay')
+            if multivalue.get('pattern') in cls.supportedPatternList:
+                urlList += [ixnObj.httpHeader+multivalueObj+'/'+multivalue['pattern'],
+                            ixnObj.httpHeader+multivalueObj+'/nest']
+        responseDict = dict(zip(urlList, [response.json() for response in getMany(ixnObj, urlList)]))
+
+        models = {}
+        for multivalueObj, multivalue in zip(multivalueObjList, multivalueList):
+            url = ixnObj.httpHeader+multivalueObj
+            models[multivalueObj] = cls(multivalueObj, multivalue,
+                                        patternData=responseDict.get(url+'/'+str(multivalue.get('pattern'))),
+                                        overlayList=responseDict.get(url+'/overlay'),
+                                        nestList=responseDict.get(url+'/nest'))
+        return models
+
+    def isSupported(self):
+        """
+        Description
+           True if the values could be calculated locally. Otherwise see unsupportedReason.
+        """
+        return self.unsupportedReason is None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        """
+        Description
+           The value of a device. The index is based zero.
+        """
+        if self.unsupportedReason:
+            raise ValueError('{0}: {1}'.format(self.multivalueObj, self.unsupportedReason))
+
+        if index < 0:
+            index += self.count
+
+        if index < 0 or index >= self.count:
+            raise IndexError('{0}: Index {1} is out of range. Count={2}'.format(self.multivalueObj, index, self.count))
+
+        if index in self.overlays:
+            return self.overlays[index]
+
+        if self.pattern == 'singleValue':
+            return self.patternData['value']
+
+        if self.pattern == 'valueList':
+            valueList = self.patternData['values']
+            return valueList[index % len(valueList)]
+
+        return formatValue(self.counterStart + self.counterStep * index, self.format)
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
+
+    def getValues(self, start=0, count=None):
+        """
+        Description
+           The values like the API server getValues operation returns them.
+
+        Parameters
+           start: (int): The first index. Based zero.
+           count: (int): The amount of values. Defaults to the rest of the values.
+        """
+        if count is None:
+            count = self.count - start
+
+        return [self[index] for index in range(start, min(start + count, self.count))]
+
+
+class MultivalueEditor(object):
+    def __init__(self, ixnObj, multivalueObj, multivalueModel=None, maxOverlays=100):
+        """
+        Description
+           Collect sparse changes of a multivalue and send them with the fewest requests.
+
+        Parameters
+           ixnObj: The main Connect object.
+           multivalueObj: (str): /api/v1/sessions/1/ixnetwork/multivalue/5
+           multivalueModel: (MultivalueModel): Optional. A model already read with MultivalueModel.fromServerBulk.
+           maxOverlays: (int): Up to this amount of changes are sent as overlays (concurrent requests).
+                               More changes are sent as one valueList PATCH.
+
+        Notes
+           - Indexes are based zero. The overlays that the API server expects are based one.
+           - The current values are only read when they are needed: for setWhere without
+             referenceValues and for a valueList update.
+        """
+        self.ixnObj = ixnObj
+        self.multivalueObj = multivalueObj
+        self.multivalueModel = multivalueModel
+        self.maxOverlays = maxOverlays
+        self.currentValues = None
+        self.changes = {}
+
+    def getModel(self):
+        if self.multivalueModel is None:
+            self.multivalueModel = MultivalueModel.fromServer(self.ixnObj, self.multivalueObj)
+        return self.multivalueModel
+
+    def getCurrentValues(self):
+        """
+        Description
+           The current values. Calculated locally when the pattern is supported.
+        """
+        if self.currentValues is None:
+            multivalueModel = self.getModel()
+            if multivalueModel.isSupported():
+                self.currentValues = multivalueModel.getValues()
+            else:
+                self.currentValues = self.ixnObj.getMultivalueValues(self.multivalueObj, silentMode=True, localExpansion=False)
+        return self.currentValues
+
+    def setValue(self, index, value):
+        self.changes[index] = toMultivalueValue(value)
+
+    def setValues(self, indexValues):
+        """
+        Parameter
+           indexValues: (dict): {index: value}
+        """
+        for index, value in indexValues.items():
+            self.changes[index] = toMultivalueValue(value)
+
+    def setIndexes(self, indexList, value):
+        """
+        Description
+           Set the same value on all the indexes.
+        """
+        value = toMultivalueValue(value)
+        for index in indexList:
+            self.changes[index] = value
+
+    def setAll(self, value):
+        self.setIndexes(range(self.getModel().count), value)
+
+    def setWhere(self, predicate, value, referenceValues=None):
+        """
+        Description
+           Set the value on every index where predicate(referenceValue) is True.
+
+        Parameters
+           predicate: A function that takes one value and returns True or False.
+           value: The new value.
+           referenceValues: (list): The values passed to the predicate. For example the IP addresses
+                                    of the same devices. Defaults to the current values of this multivalue.
+
+        Return
+           The list of matching indexes.
+
+        Example
+           editorObj.setWhere(lambda ip: ip in ipSet, 'true', referenceValues=ipAddressList)
+        """
+        if referenceValues is None:
+            referenceValues = self.getCurrentValues()
+
+        indexList = [index for index, referenceValue in enumerate(referenceValues) if predicate(referenceValue)]
+        self.setIndexes(indexList, value)
+        return indexList
+
+    def apply(self):
+        """
+        Description
+           Send the changes to the API server.
+              - All the values are the same: PATCH the singleValue.
+              - Up to maxOverlays changes: POST an overlay for each index.
+              - Otherwise: PATCH the complete valueList.
+           Existing overlays on a changed index are modified because they take precedence over the pattern.
+
+        Return
+           singleValue|overlay|valueList. None if there was nothing to change.
+        """
+        multivalueModel = self.getModel()
+        count = multivalueModel.count
+        for index in self.changes:
+            if index < 0 or index >= count:
+                raise IndexError('{0}: Index {1} is out of range. Count={2}'.format(self.multivalueObj, index, count))
+
+        changes = self.changes
+        if self.currentValues is not None:
+            changes = dict((index, value) for index, value in changes.items() if self.currentValues[index] != value)
+
+        if changes == {}:
+            self.changes = {}
+            return None
+
+        newValueSet = set(changes.values())
+        overlayChanges = [(index, value) for index, value in changes.items() if index in multivalueModel.overlayHrefs]
+        newOverlayChanges = [(index, value) for index, value in changes.items() if index not in multivalueModel.overlayHrefs]
+
+        if len(changes) == count and len(newValueSet) == 1:
+            mode = 'singleValue'
+            self.ixnObj.patch(self.ixnObj.httpHeader+self.multivalueObj+'/singleValue', data={'value': newValueSet.pop()},
+                              silentMode=True)
+        elif len(newOverlayChanges) <= self.maxOverlays:
+            mode = 'overlay'
+            sendMany(self.ixnObj, 'post', [(self.ixnObj.httpHeader+self.multivalueObj+'/overlay', {'index': index+1, 'value': value})
+                                           for index, value in sorted(newOverlayChanges)])
+        else:
+            mode = 'valueList'
+            valueList = list(self.getCurrentValues())
+            for index, value in changes.items():
+                valueList[index] = value
+            self.ixnObj.patch(self.ixnObj.httpHeader+self.multivalueObj+'/valueList', data={'values': valueList},
+                              silentMode=True)
+
+        sendMany(self.ixnObj, 'patch', [(self.ixnObj.httpHeader+multivalueModel.overlayHrefs[index], {'value': value})
+                                        for index, value in sorted(overlayChanges)])
+
+        self.ixnObj.logInfo('MultivalueEditor: {0}: {1} changes as {2}'.format(self.multivalueObj, len(changes), mode))
+
+        # The pattern changed. Read it again if the editor is used again.
+        self.multivalueModel = None
+        self.currentValues = None
+        self.changes = {}
+        return mode
+
+def applyMultivalueChanges(ixnObj, changeList, maxOverlays=100):
+    """
+    Description
+       Apply sparse changes to many multivalues. The multivalue patterns are read in bulk.
+
+    Parameters
+       ixnObj: The main Connect object.
+       changeList: (list): [(multivalueObj, indexList, value), ...]
+                           indexList: A list of indexes based zero or 'all'.
+       maxOverlays: (int): See MultivalueEditor.
+
+    Return
+       A dict: {multivalueObj: singleValue|overlay|valueList|None}
+
+    Example
+       applyMultivalueChanges(mainObj, [(flapMultivalue, [0, 5], 'true'), (uptimeMultivalue, [0, 5], '10')])
+    """
+    models = MultivalueModel.fromServerBulk(ixnObj, [multivalueObj for multivalueObj, indexList, value in changeList])
+    editors = {}
+    for multivalueObj, indexList, value in changeList:
+        if multivalueObj not in editors:
+            editors[multivalueObj] = MultivalueEditor(ixnObj, multivalueObj, multivalueModel=models[multivalueObj],
+                                                      maxOverlays=maxOverlays)
+        if indexList == 'all':
+            editors[multivalueObj].setAll(value)
+        else:
+            editors[multivalueObj].setIndexes(indexList, value)
+
+    return dict((multivalueObj, editorObj.apply()) for multivalueObj, editorObj in editors.items())
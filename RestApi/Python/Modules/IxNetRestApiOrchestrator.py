@@ -0,0 +1,322 @@
+
+# PLEASE READ DISCLAIMER
+#
+#    This class demonstrates sample IxNetwork REST API usage for
+#    demo and reference purpose only.
+#    It is subject to change for updates without warning.
+#
+# DESCRIPTION
+#    Run test jobs concurrently across several API servers.
+#    Each API server session is owned by one worker thread or process that
+#    creates the session, runs jobs from the shared job queue one at a time
+#    and deletes the session when the queue is empty.
+#
+# REQUIREMENTS
+#    - Python modules: requests
+#    - Python 2 requires the futures backport for concurrent.futures
+#
+
+from __future__ import print_function
+import sys, time, traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from IxNetRestApi import Connect, IxNetRestApiException
+
+if sys.version_info[0] >= 3:
+    import queue
+else:
+    import Queue as queue
+
+def createSession(sessionParams):
+    """
+    Description
+       Create a Connect session object.
+
+    Parameter
+       sessionParams: (dict): The Connect kwargs.
+                              {'apiServerIp': '192.168.70.108', 'serverOs': 'linux', 'username': 'admin', 'password': 'admin'}
+    """
+    return Connect(**sessionParams)
+
+def deleteSession(mainObj):
+    """
+    Description
+       Stop and delete a session created by createSession.
+       Windows API server sessions are not deleted. The Windows session is always session 1.
+
+    Parameter
+       mainObj: The Connect object.
+    """
+    try:
+        if mainObj.serverOs == 'linux':
+            mainObj.linuxServerStopAndDeleteSession()
+
+        if mainObj.serverOs == 'windowsConnectionMgr':
+            mainObj.deleteSession()
+    finally:
+        # Release the log file and the log writer thread of the Connect object.
+        mainObj.closeLogger()
+
+def isSessionAlive(mainObj):
+    """
+    Description
+       Verify that the API server session still responds.
+
+    Parameter
+       mainObj: The Connect object.
+
+    Return
+       True or False
+    """
+    try:
+        mainObj.get(mainObj.sessionUrl, silentMode=True)
+        return True
+    except Exception:
+        return False
+
+def getSessionName(sessionParams):
+    """
+    Description
+       A name for the session used in the job results: <apiServerIp>:<serverOs>
+    """
+    return '{0}:{1}'.format(sessionParams.get('apiServerIp'), sessionParams.get('serverOs', 'windows'))
+
+def runSessionWorker(sessionIndex, sessionParams, jobQueue, deleteSessionAfterJobs=True, maxJobRetries=1):
+    """
+    Description
+       Create a session and run jobs from the jobQueue until it is empty.
+       This is module level so that it could be sent to a worker process.
+
+    Parameters
+       sessionIndex: (int): The index of the session in the orchestrator session list.
+       sessionParams: (dict): The Connect kwargs.
+       jobQueue: (Queue): Jobs: (jobIndex, jobName, jobFunction, jobKwargs, attempt)
+       deleteSessionAfterJobs: (bool): Delete the session when the jobQueue is empty.
+       maxJobRetries: (int): The amount of times a job that killed its session is run again on another session.
+
+    Notes
+       When a job fails and the session no longer responds, the failed attempt is recorded and this
+       worker stops. The job is put back in the jobQueue to run on another session until its
+       retries are used up.
+
+    Return
+       {'session': name, 'sessionIndex':, 'error': None|str, 'setupTime':, 'jobResults': [...]}
+    """
+    sessionResult = {'session': getSessionName(sessionParams), 'sessionIndex': sessionIndex,
+                     'error': None, 'setupTime': None, 'jobResults': []}
+    startTime = time.time()
+    try:
+        mainObj = createSession(sessionParams)
+    except Exception as errMsg:
+        # The remaining jobs run on the other sessions.
+        sessionResult['error'] = 'Session create failed: {0}'.format(errMsg)
+        return sessionResult
+
+    sessionResult['setupTime'] = time.time() - startTime
+    sessionAlive = True
+
+    try:
+        while True:
+            try:
+                job = jobQueue.get(block=False)
+            except queue.Empty:
+                break
+
+            jobIndex, jobName, jobFunction, jobKwargs, attempt = job
+            jobResult = {'jobIndex': jobIndex, 'name': jobName, 'session': sessionResult['session'],
+                         'passed': False, 'result': None, 'error': None, 'attempt': attempt}
+            startTime = time.time()
+            try:
+                jobResult['result'] = jobFunction(mainObj, **jobKwargs)
+                jobResult['passed'] = True
+            except Exception as errMsg:
+                jobResult['error'] = '{0}\n{1}'.format(errMsg, traceback.format_exc())
+                if not isSessionAlive(mainObj):
+                    sessionResult['error'] = 'Session lost while running job {0}: {1}'.format(jobName, errMsg)
+                    sessionAlive = False
+
+            jobResult['duration'] = time.time() - startTime
+            sessionResult['jobResults'].append(jobResult)
+
+            if not sessionAlive:
+                # The session died. Run the job on another session if it has retries left.
+                if attempt < maxJobRetries:
+                    jobQueue.put((jobIndex, jobName, jobFunction, jobKwargs, attempt+1))
+                break
+    finally:
+        if deleteSessionAfterJobs and sessionAlive:
+            try:
+                deleteSession(mainObj)
+            except Exception as errMsg:
+                sessionResult['error'] = 'Session delete failed: {0}'.format(errMsg)
+        elif not sessionAlive:
+            mainObj.closeLogger()
+
+    return sessionResult
+
+
+class SessionOrchestrator(object):
+    def __init__(self, sessionParamsList, useProcesses=False, deleteSessionAfterJobs=True, maxJobRetries=1):
+        """
+        Description
+           Run test jobs concurrently on a pool of API server sessions.
+           One worker per session creates the session, takes the next job from a shared queue
+           whenever it is idle and deletes the session at the end.  Faster API servers
+           take more jobs.
+
+        Parameters
+           sessionParamsList: (list): The Connect kwargs for each session. The same API server could be
+                                      listed more than once to run several sessions on a Linux API server.
+           useProcesses: (bool): True: Run each session in its own process.
+                                       The job functions and their kwargs must be picklable, so
+                                       the job functions must be defined at the module level.
+                                 False: Run each session in a thread.
+           deleteSessionAfterJobs: (bool): Delete the Linux and Windows Connection Mgr sessions after the jobs.
+           maxJobRetries: (int): Run a job that killed its session again on another session this many times.
+
+        Notes
+           A job is a function that takes the Connect object as the first parameter:
+              def bgpTest(mainObj, configFile):
+                  ...
+                  return statsDict
+
+           The job return value is stored in the job result.
+           An exception raised by the job fails only that job.
+           If a session fails to start, its jobs run on the other sessions.
+           If a session dies during a job, the job runs again on another session up to maxJobRetries times.
+           A job that still fails is reported with the error of its last attempt.
+
+        Example
+           orchestrator = SessionOrchestrator([{'apiServerIp': '192.168.70.108', 'serverOs': 'linux'},
+                                               {'apiServerIp': '192.168.70.109', 'serverOs': 'linux'},
+                                               {'apiServerIp': '192.168.70.3', 'serverIpPort': '11009', 'serverOs': 'windows'}])
+           for configFile in configFileList:
+               orchestrator.addJob(bgpTest, name=configFile, configFile=configFile)
+
+           jobResults = orchestrator.run()
+           orchestrator.showSummary()
+        """
+        self.sessionParamsList = sessionParamsList
+        self.useProcesses = useProcesses
+        self.deleteSessionAfterJobs = deleteSessionAfterJobs
+        self.maxJobRetries = maxJobRetries
+        self.jobList = []
+        self.sessionResults = []
+        self.jobResults = []
+
+    def addJob(self, jobFunction, name=None, **jobKwargs):
+        """
+        Description
+           Add a job to run on the next available session.
+
+        Parameters
+           jobFunction: (function): jobFunction(mainObj, **jobKwargs)
+           name: (str): The job name in the results. Defaults to the function name and job index.
+           jobKwargs: The jobFunction kwargs.
+
+        Return
+           The job index.
+        """
+        jobIndex = len(self.jobList)
+        if name is None:
+            name = '{0}-{1}'.format(jobFunction.__name__, jobIndex)
+
+        self.jobList.append((jobIndex, name, jobFunction, jobKwargs))
+        return jobIndex
+
+    def run(self):
+        """
+        Description
+           Start all the sessions in parallel and run all the added jobs.
+
+        Return
+           A list of job results in the order the jobs were added:
+              {'jobIndex':, 'name':, 'session':, 'passed': True|False, 'result':, 'error':, 'duration':, 'attempt':}
+        """
+        if self.sessionParamsList == []:
+            raise IxNetRestApiException('SessionOrchestrator: No sessions provided')
+
+        if self.useProcesses:
+            import multiprocessing
+            manager = multiprocessing.Manager()
+            jobQueue = manager.Queue()
+            executor = ProcessPoolExecutor(max_workers=len(self.sessionParamsList))
+        else:
+            jobQueue = queue.Queue()
+            executor = ThreadPoolExecutor(max_workers=len(self.sessionParamsList))
+
+        for jobIndex, jobName, jobFunction, jobKwargs in self.jobList:
+            jobQueue.put((jobIndex, jobName, jobFunction, jobKwargs, 0))
+
+        try:
+            futureList = [executor.submit(runSessionWorker, sessionIndex, sessionParams, jobQueue, self.deleteSessionAfterJobs,
+                                          self.maxJobRetries)
+                          for sessionIndex, sessionParams in enumerate(self.sessionParamsList)]
+            self.sessionResults = [future.result() for future in futureList]
+        finally:
+            executor.shutdown(wait=True)
+
+        jobResults = {}
+        for sessionResult in self.sessionResults:
+            for jobResult in sessionResult['jobResults']:
+                # Keep the last attempt of the jobs that were run again after their session died.
+                previousResult = jobResults.get(jobResult['jobIndex'])
+                if previousResult is None or jobResult['attempt'] > previousResult['attempt']:
+                    jobResults[jobResult['jobIndex']] = jobResult
+
+        # Jobs left in the queue when every session failed to start.
+        for jobIndex, jobName, jobFunction, jobKwargs in self.jobList:
+            if jobIndex not in jobResults:
+                jobResults[jobIndex] = {'jobIndex': jobIndex, 'name': jobName, 'session': None, 'passed': False,
+                                        'result': None, 'error': 'No session available to run the job', 'duration': 0,
+                                        'attempt': 0}
+
+        self.jobResults = [jobResults[jobIndex] for jobIndex in sorted(jobResults)]
+        self.jobList = []
+        return self.jobResults
+
+    def getSummary(self):
+        """
+        Description
+           Aggregate the results of the last run.
+
+        Return
+           {'totalJobs':, 'passed':, 'failed':,
+            'sessions': {sessionName: {'error':, 'setupTime':, 'jobs':, 'passed':, 'failed':, 'jobTime':}}}
+        """
+        summary = {'totalJobs': len(self.jobResults),
+                   'passed': len([jobResult for jobResult in self.jobResults if jobResult['passed']]),
+                   'sessions': {}}
+        summary['failed'] = summary['totalJobs'] - summary['passed']
+
+        for sessionResult in self.sessionResults:
+            jobResults = sessionResult['jobResults']
+            passed = len([jobResult for jobResult in jobResults if jobResult['passed']])
+            sessionName = '{0}#{1}'.format(sessionResult['session'], sessionResult['sessionIndex'])
+            summary['sessions'][sessionName] = {'error': sessionResult['error'],
+                                                'setupTime': sessionResult['setupTime'],
+                                                'jobs': len(jobResults),
+                                                'passed': passed,
+                                                'failed': len(jobResults) - passed,
+                                                'jobTime': sum([jobResult['duration'] for jobResult in jobResults])}
+        return summary
+
+    def showSummary(self):
+        """
+        Description
+           Print the results of the last run.
+        """
+        summary = self.getSummary()
+        print('\nTotal jobs: {0}  Passed: {1}  Failed: {2}'.format(summary['totalJobs'], summary['passed'], summary['failed']))
+        for sessionName, sessionSummary in sorted(summary['sessions'].items()):
+            print('\n   Session: {0}'.format(sessionName))
+            if sessionSummary['error']:
+                print('      Error: {0}'.format(sessionSummary['error']))
+            if sessionSummary['setupTime'] is not None:
+                print('      SetupTime: {0:.2f}s'.format(sessionSummary['setupTime']))
+            print('      Jobs: {0}  Passed: {1}  Failed: {2}  JobTime: {3:.2f}s'.format(
+                sessionSummary['jobs'], sessionSummary['passed'], sessionSummary['failed'], sessionSummary['jobTime']))
+
+        for jobResult in self.jobResults:
+            if jobResult['passed'] == False:
+                print('\n   Failed job: {0} on {1}\n{2}'.format(jobResult['name'], jobResult['session'], jobResult['error']))
+        print()
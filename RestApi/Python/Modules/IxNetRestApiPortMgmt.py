@@ -1,4 +1,4 @@
-import time
+import sys
 from IxNetRestApi import IxNetRestApiException
 
 class PortMgmt(object):
@@ -13,7 +13,7 @@ class PortMgmt(object):
         # For Python Robot Framework support
         self.ixnObj = mainObject
 
-    def connectToVChassis(self, chassisIp):
+    def connectToVChassis(self, chassisIp, timeout=30):
         # Connects to the virtual chassis
 
         url = self.ixnObj.sessionUrl+'/operations/connecttochassis'
@@ -26,24 +26,20 @@ class PortMgmt(object):
             return 1
         else:
             self.ixnObj.logInfo('connectToVChassis: Successfully connected to chassis: %s' % chassisIp)
-            while response.json()["state"] == "IN_PROGRESS" or response.json()["state"] == "down":
-                if timeout == 0:
-                    break
-                time.sleep(1)
-                response = request.get(self.ixnObj.sessionUrl)
-                state = response.json()["state"]
-                self.ixnObj.logInfo("\t\t%s" % state)
-                timeout = timeout - 1
+            self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'], timeout=timeout, ignoreException=True)
             return 0
 
     def connectIxChassis(self, chassisIp, timeout=30, **kwargs):
         """
         Description
-           Connect to an Ixia chassis.
+           Connect to one or more Ixia chassis.
+           All the chassis are added first so that the API server connects to them concurrently,
+           then they are all waited on together. The wait time is the slowest chassis instead
+           of the sum of all the chassis.
 
         Parameter
            chassisIp: <str>|<list>: A string or a list of chassis IP addresses.
-           timeout: <int>: Default=30 seconds. The amount of time to wait for the 
+           timeout: <int>: Default=30 seconds. The amount of time to wait for all the 
                            chassis to be in the ready state.
 
            kwargs: Any chassis attributes and values. For example, if two chassis' are dasisy chained, include:
@@ -69,26 +65,32 @@ class PortMgmt(object):
                 chassisIdObj = response.json()[0]['links'][0]['href']
             else:
                 chassisIdObj = response.json()['links'][0]['href']
- 
-            self.ixnObj.logInfo('\n', timestamp=False)
-            # Chassis states: down, polling, ready
-            for timer in range(1,timeout+1):
-                response = self.ixnObj.get(self.ixnObj.httpHeader + chassisIdObj, silentMode=True)
-                currentStatus = response.json()['state']
-                self.ixnObj.logInfo('connectIxChassis {0}: Status: {1}. Wait {2}/{3} seconds'.format(
-                    chassisIpAddress, currentStatus, timer, timeout), timestamp=False)
-                if currentStatus != 'ready' and timer < timeout:
-                    time.sleep(1)
-                if currentStatus != 'ready' and timer == timeout:
-                    raise IxNetRestApiException('connectIxChassis: Connecting to chassis {0} failed'.format(chassisIpAddress))
-                if currentStatus == 'ready' and timer < timeout:
-                    chassisObjList.append(chassisIdObj)
-                    break
+
+            chassisObjList.append(chassisIdObj)
+
+        self.ixnObj.logInfo('\n', timestamp=False)
+        # Chassis states: down, polling, ready
+        chassisStates = {}
+        def areAllChassisReady():
+            # One GET returns the state of all the chassis.
+            response = self.ixnObj.get(url, silentMode=True)
+            for chassis in response.json():
+                chassisStates[chassis['links'][0]['href']] = chassis['state']
+
+            for chassisIpAddress, chassisIdObj in zip(chassisIp, chassisObjList):
+                self.ixnObj.logInfo('connectIxChassis {0}: Status: {1}'.format(chassisIpAddress, chassisStates.get(chassisIdObj)),
+                                    timestamp=False)
+
+            return all([chassisStates.get(chassisIdObj) == 'ready' for chassisIdObj in chassisObjList])
+
+        if self.ixnObj.waitFor(areAllChassisReady, timeout=timeout, description='Chassis ready', ignoreException=True) is None:
+            failedChassisList = [chassisIpAddress for chassisIpAddress, chassisIdObj in zip(chassisIp, chassisObjList)
+                                 if chassisStates.get(chassisIdObj) != 'ready']
+            raise IxNetRestApiException('connectIxChassis: Connecting to chassis {0} failed'.format(failedChassisList))
 
         # http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/availableHardware/chassis/1
         return chassisObjList
 
-    
     def disconnectIxChassis(self, chassisIp):
         """
         Description
@@ -133,7 +135,7 @@ class PortMgmt(object):
         vportObjectList = self.ixnObj.get(self.ixnObj.sessionUrl+'/vport')
         portListIndex = 0
         for vportObj in vportObjectList.json():
-            print('\n', vportObj)
+            self.ixnObj.logDebug('\n{0}'.format(vportObj))
             connectedTo = vportObj['connectedTo']
             vportHref = vportObj['links'][0]['href']
             if connectedTo == 'null':
@@ -336,6 +338,88 @@ class PortMgmt(object):
             if 'Port Released' in connectionStatus:
                 raise IxNetRestApiException(connectionStatus)
 
+    def getPortStatus(self, portList=None):
+        """
+        Description
+           Get the assignment status of each port with one GET of all the vports.
+
+        Parameter
+           portList: <list>: Optional: [[ixChassisIp, '1', '1'], [ixChassisIp, '1', '2']]
+                             Defaults to all the assigned ports.
+
+        Return
+           A dict keyed by the port 'chassisIp:card:port':
+              {'192.168.70.11:1:1': {'vport': '/api/v1/sessions/1/ixnetwork/vport/1',
+                                     'name': '1/1', 'state': 'up', 'connectionStatus': '192.168.70.11;01;01 ...'}}
+
+           A port in the portList that is not assigned to a vport has vport=None and state='unassigned'.
+        """
+        response = self.ixnObj.get(self.ixnObj.sessionUrl+'/vport', silentMode=True)
+        portStatus = {}
+        for vport in response.json():
+            if vport['assignedTo'] == '':
+                continue
+
+            portStatus[vport['assignedTo']] = {'vport': vport['links'][0]['href'], 'name': vport['name'],
+                                               'state': vport['state'], 'connectionStatus': vport['connectionStatus']}
+
+        if portList is None:
+            return portStatus
+
+        return dict([(key, portStatus.get(key, {'vport': None, 'name': None, 'state': 'unassigned', 'connectionStatus': ''}))
+                     for key in self.getPortStatusKeys(portList)])
+
+    def getPortStatusKeys(self, portList):
+        """
+        Description
+           The getPortStatus keys of the ports: 'chassisIp:card:port'.
+           The assignedTo card and port numbers are not zero padded.
+
+        Parameter
+           portList: <list>: [[ixChassisIp, '1', '1'], [ixChassisIp, '1', '2']]
+        """
+        return ['{0}:{1}:{2}'.format(chassisIp, int(card), int(port)) for chassisIp, card, port in portList]
+
+    def getPortVportIndex(self):
+        """
+        Description
+           Get the vport of every assigned port with one GET of all the vports.
+           Use it to look up many vports instead of searching the vports for each port.
+
+        Return
+           A dict: {'192.168.70.11:1:1': '/api/v1/sessions/1/ixnetwork/vport/1', ...}
+        """
+        return dict([(port, status['vport']) for port, status in self.getPortStatus().items()])
+
+    def configVportNames(self, portStatus=None):
+        """
+        Description
+           Name the assigned vports Port<card>_<port>.
+           Only the vports that don't have the name yet are modified. The PATCHes are sent concurrently.
+
+        Parameter
+           portStatus: <dict>: Optional: The getPortStatus() of all the ports if it was already read.
+        """
+        if portStatus is None:
+            portStatus = self.getPortStatus()
+
+        requestList = []
+        for port, status in portStatus.items():
+            chassisIp, card, portNumber = port.split(':')
+            name = 'Port'+card+'_'+portNumber
+            if status['name'] != name:
+                requestList.append((self.ixnObj.httpHeader+status['vport'], {'name': name}))
+
+        if requestList == []:
+            return
+
+        self.ixnObj.logInfo('configVportNames: Naming {0} vports'.format(len(requestList)))
+        if len(requestList) > 1 and sys.version_info[0] >= 3:
+            self.ixnObj.getAsyncConnect().patchMany(requestList)
+        else:
+            for url, data in requestList:
+                self.ixnObj.patch(url, data=data, silentMode=True)
+
     def assignPorts(self, portList, forceTakePortOwnership=True, createVports=False,
                     rawTraffic=False, configPortName=True, timeout=120):
         """
@@ -418,28 +502,21 @@ class PortMgmt(object):
             raise IxNetRestApiException('assignPort Error: Port failed to boot up after 120 seconds')
 
         else:
-            response = self.ixnObj.get(self.ixnObj.sessionUrl+'/vport')
-            for vport in response.json():
-                chassisIp = vport['assignedTo'].split(':')[0]
-                slot = vport['assignedTo'].split(':')[1]
-                port = vport['assignedTo'].split(':')[2]
-                currentPort = [chassisIp, int(slot), int(port)]
-                for chassis,card,port in portList:
-                    currentPortList = [chassis, int(card), int(port)]
-                    if set(currentPort) & set(currentPortList):
-                        if 'License Failed' in vport['connectionStatus']:
-                            raise IxNetRestApiException('Port License failed.')
-                        if vport['connectionStatus'] == 'connectedLinkDown':
-                            raise IxNetRestApiException('Port link connection is down: {0}'.format(vport['assignedTo']))
-
-        if configPortName:
-            # Name the vports
-            for vportObj in self.getAllVportList():
-                port = self.getPhysicalPortFromVport([vportObj])[0]
-                chassisIp = port.split(':')[0]
-                card = port.split(':')[1]
-                port = port.split(':')[2]
-                self.ixnObj.patch(self.ixnObj.httpHeader+vportObj, data={'name': 'Port'+card+'_'+port})
+            # One GET of all the vports for the status check and the vport names.
+            portStatus = self.getPortStatus()
+            errorList = []
+            for port in self.getPortStatusKeys(portList):
+                connectionStatus = portStatus.get(port, {'connectionStatus': ''})['connectionStatus']
+                if 'License Failed' in connectionStatus:
+                    errorList.append('Port License failed: {0}'.format(port))
+                if connectionStatus == 'connectedLinkDown':
+                    errorList.append('Port link connection is down: {0}'.format(port))
+
+            if errorList:
+                raise IxNetRestApiException('\n'.join(errorList))
+
+            if configPortName:
+                self.configVportNames(portStatus)
 
         if rawTraffic:
             vportProtocolList = []
@@ -449,6 +526,66 @@ class PortMgmt(object):
         else:
             return vportList
 
+    def connectChassisAndAssignPorts(self, portList, forceTakePortOwnership=True, createVports=False,
+                                     rawTraffic=False, configPortName=True, chassisTimeout=60, timeout=120,
+                                     raiseException=True, **kwargs):
+        """
+        Description
+           Bring up a testbed that spans multiple chassis.
+           Connect to all the chassis in the portList concurrently, assign all the ports
+           with one assignports operation and report the status of each port.
+
+        Parameters
+           portList: <list>: [[ixChassisIp1, '1', '1'], [ixChassisIp2, '1', '1'], ...]
+           forceTakePortOwnership: <bool>: True = Forcefully take ownership of portList.
+           createVports: <bool>: See assignPorts.
+           rawTraffic: <bool>: See assignPorts.
+           configPortName: <bool>: See assignPorts.
+           chassisTimeout: <int>: The time to wait for all the chassis to be ready.
+           timeout: <int>: The time to wait for the assignports operation.
+           raiseException: <bool>: True: Raise an exception if the assignment failed or if a port is not up
+                                         or failed the license check.
+                                   False: Only report the failed ports in the port status.
+           kwargs: Chassis attributes passed to connectIxChassis.
+
+        Return
+           {'vportList': <the assignPorts return value or None if the assignment failed>,
+            'portStatus': <getPortStatus(portList)>,
+            'failedPorts': ['192.168.70.11:1:1', ...],
+            'error': None|str}
+
+        Example
+           result = portObj.connectChassisAndAssignPorts([['192.168.70.11', '1', '1'], ['192.168.70.12', '1', '1']])
+        """
+        chassisIpList = []
+        for port in portList:
+            if port[0] not in chassisIpList:
+                chassisIpList.append(port[0])
+
+        self.connectIxChassis(chassisIpList, timeout=chassisTimeout, **kwargs)
+
+        result = {'vportList': None, 'portStatus': {}, 'failedPorts': [], 'error': None}
+        try:
+            result['vportList'] = self.assignPorts(portList, forceTakePortOwnership=forceTakePortOwnership,
+                                                   createVports=createVports, rawTraffic=rawTraffic,
+                                                   configPortName=configPortName, timeout=timeout)
+        except IxNetRestApiException as errMsg:
+            result['error'] = str(errMsg)
+
+        result['portStatus'] = self.getPortStatus(portList)
+        for port, status in sorted(result['portStatus'].items()):
+            self.ixnObj.logInfo('connectChassisAndAssignPorts: {0}: state={1} connectionStatus={2}'.format(
+                port, status['state'], status['connectionStatus']), timestamp=False)
+
+            if status['state'] != 'up' or 'License Failed' in status['connectionStatus']:
+                result['failedPorts'].append(port)
+
+        if raiseException and (result['error'] or result['failedPorts']):
+            raise IxNetRestApiException('connectChassisAndAssignPorts: {0}. Failed ports: {1}'.format(
+                result['error'] or 'Ports are not up', result['failedPorts']))
+
+        return result
+
     def unassignPorts(self, deleteVirtualPorts=False):
         """
         Description
@@ -562,7 +699,7 @@ class PortMgmt(object):
                 continue
             response = self.ixnObj.get(self.ixnObj.httpHeader+vport[0])
             connectedStatus = response.json()['connectionStatus']
-            print('\nisPortConnected:', port)
+            self.ixnObj.logInfo('\nisPortConnected: {0}'.format(port), timestamp=False)
             if connectedStatus == 'Port Released':
                 self.ixnObj.logInfo('\tFalse: %s' % connectedStatus)
                 returnValues.append('released')
@@ -642,28 +779,30 @@ class PortMgmt(object):
         """
         response = self.ixnObj.get(self.ixnObj.sessionUrl+'/vport')
         vportList = [metaDatas["links"][0]['href'] for metaDatas in response.json()]
-        for eachVport in vportList:
-            for counter in range(1,timeout+1):
-                stateResponse = self.ixnObj.get(self.ixnObj.httpHeader+eachVport+'?includes=state,connectionStatus', silentMode=True)
-                assignedToResponse = self.ixnObj.get(self.ixnObj.httpHeader+eachVport+'?includes=assignedTo', silentMode=True)
+        currentStates = {}
 
-                if 'Port Released' in stateResponse.json()['connectionStatus']:
-                    raise IxNetRestApiException(stateResponse.json()['connectionStatus'])
+        def isPortUp(eachVport):
+            stateResponse = self.ixnObj.get(self.ixnObj.httpHeader+eachVport+'?includes=state,connectionStatus,assignedTo', silentMode=True)
 
-                if stateResponse.json()['state'] == 'unassigned':
-                    self.ixnObj.logWarning('\nThe vport {0} is not assigned to a physical port. Skipping this vport verification.'.format(eachVport))
-                    break
+            if 'Port Released' in stateResponse.json()['connectionStatus']:
+                raise IxNetRestApiException(stateResponse.json()['connectionStatus'])
 
-                self.ixnObj.logInfo('Port: %s' % assignedToResponse.json()['assignedTo'])
-                self.ixnObj.logInfo('\tVerifyPortState: %s\n\tWaiting %s/%s seconds' % (stateResponse.json()['state'], counter, timeout), timestamp=False)
-                if counter < timeout and stateResponse.json()['state'] in ['down', 'busy']:
-                    time.sleep(1)
-                    continue
-                if counter < timeout and stateResponse.json()['state'] in ['up', 'connectedLinkUp']:
-                    break
-                if counter == timeout and stateResponse.json()['state'] == 'down':
-                    # Failed
-                    raise IxNetRestApiException('Port failed to come up')
+            currentStates[eachVport] = stateResponse.json()['state']
+            if stateResponse.json()['state'] == 'unassigned':
+                self.ixnObj.logWarning('\nThe vport {0} is not assigned to a physical port. Skipping this vport verification.'.format(eachVport))
+                return True
+
+            self.ixnObj.logInfo('Port: %s' % stateResponse.json()['assignedTo'])
+            self.ixnObj.logInfo('\tVerifyPortState: %s' % stateResponse.json()['state'], timestamp=False)
+            return stateResponse.json()['state'] in ['up', 'connectedLinkUp']
+
+        # All the ports come up in parallel. Wait for them together.
+        conditionList = [(eachVport, lambda eachVport=eachVport: isPortUp(eachVport)) for eachVport in vportList]
+        self.ixnObj.waitForAll(conditionList, timeout=timeout, ignoreException=True)
+
+        if 'down' in currentStates.values():
+            # Failed
+            raise IxNetRestApiException('Port failed to come up')
 
     def getVportFromPortList(self, portList):
         """
@@ -677,29 +816,17 @@ class PortMgmt(object):
            A list of vports.
            [] if vportList is empty.
         """
+        # One GET of all the vports instead of a query for each port.
+        portVportIndex = self.getPortVportIndex()
         vportList = []
-        for eachPort in portList:
-            chassisIp = eachPort[0]
-            card = eachPort[1]
-            portNum = eachPort[2]
-            port = chassisIp+':'+card+':'+portNum
-            # {'href': '/api/v1/sessions/1/ixnetwork/',
-            # 'vport': [{'id': 2, 'href': '/api/v1/sessions/1/ixnetwork/vport/2', 'assignedTo': '10.10.10.8:1:2'}]}
-            queryData = {"from": "/",
-                         "nodes": [{"node": "vport", "properties": ["assignedTo"],
-                                    "where": [{"property": "assignedTo", "regex": port}]
-                                }]}
-            
-            queryResponse = self.ixnObj.query(data=queryData, silentMode=False)
-            vport = queryResponse.json()['result'][0]['vport']
-            if vport == []:
+        for port in self.getPortStatusKeys(portList):
+            if port not in portVportIndex:
                 raise IxNetRestApiException('getVportFromPortList error: The port has no vport and not assigned. Check for port typo: {0}'.format(port))
 
-            if vport:
-                # Appending vportList: ['/api/v1/sessions/1/ixnetwork/vport/1', '/api/v1/sessions/1/ixnetwork/vport/2']
-                vportList.append(vport[0]['href'])
+            # Appending vportList: ['/api/v1/sessions/1/ixnetwork/vport/1', '/api/v1/sessions/1/ixnetwork/vport/2']
+            vportList.append(portVportIndex[port])
         return vportList
-                                
+
     def modifyPortMediaType(self, portList='all', mediaType='fiber'):
         """
         Description
@@ -41,7 +41,7 @@
 #    x = getEndpointObjByDeviceGroupName('DG-2', 'bgpIpv4Peer')
 #
 
-import re, time
+import re, sys
 from IxNetRestApi import IxNetRestApiException
 from IxNetRestApiPortMgmt import PortMgmt
 from IxNetRestApiStatistics import Statistics
@@ -68,6 +68,7 @@ class Protocol(object):
         self.configuredProtocols = []
         self.portMgmtObj = PortMgmt(self.ixnObj)
         self.statObj = Statistics(self.ixnObj)
+        self.topologyIndex = None
 
     def setMainObject(self, mainObject):
         """
@@ -89,6 +90,30 @@ class Protocol(object):
         """
         return self
 
+    def useTopologyIndex(self, enable=True):
+        """
+        Description
+           Look up NGPF object handles in the client-side TopologyIndex instead of querying
+           the API server each time.  The index is built with one deep query on the first lookup
+           and the modified Topology Groups are re-queried after each configuration change.
+
+           These functions use the index when enabled:
+              getNgpfObjectHandleByName, getNgpfObjectHandleByRouterId,
+              getDeviceGroupByRouterId, getProtocolListByPortNgpf,
+              getNgpfGatewayIpMacAddress, getDeviceGroupSrcIpGatewayIp, getDeviceGroupObjAndIpObjBySrcIp,
+              getNetworkGroupObjByIp, getIpAddrIndexNumber
+
+           The IP address lookups use a separate IP index that is built with one query and
+           one bulk multivalue call. It is rebuilt after any Topology or multivalue change.
+
+        Parameter
+           enable: <bool>: True to use the index. False to query the API server for each lookup.
+        """
+        if enable:
+            self.topologyIndex = self.ixnObj.getTopologyIndex()
+        else:
+            self.topologyIndex = None
+
     def createTopologyNgpf(self, portList, topologyName=None):
         """
         Description
@@ -1877,15 +1902,11 @@ class Protocol(object):
             'BGP Peer Per Port'
             'OSPFv2-RTR Per Port'
         """
-        totalSessionsDetectedUp = 0
-        totalSessionsDetectedDown = 0
-        totalPortsUpFlag = 0
-
-        for counter in range(1,timeout+1):
-            stats = self.ixnObj.getStatsPage(viewName=protocolViewName, displayStats=False)
-            totalPorts = len(stats.keys()) ;# Length stats.keys() represents total ports.
+        def isSessionsUp():
+            stats = self.statObj.getStatsPage(viewName=protocolViewName, displayStats=False)
             self.ixnObj.logInfo('\nProtocolName: {0}'.format(protocolViewName))
 
+            totalPortsUp = 0
             for session in stats.keys():
                 sessionsUp = int(stats[session]['Sessions Up'])
                 totalSessions = int(stats[session]['Sessions Total'])
@@ -1895,21 +1916,19 @@ class Protocol(object):
                 self.ixnObj.logInfo('\n\tPortName: {0}\n\t   TotalSessionsUp: {1}\n\t   ExpectedTotalSessionsup: {2}'.format(
                     stats[session]['Port'], sessionsUp, totalExpectedSessionsUp))
 
-                if counter < timeout and sessionsUp != totalExpectedSessionsUp:
+                if sessionsUp != totalExpectedSessionsUp:
                     self.ixnObj.logInfo('\t   Session is still down')
+                else:
+                    totalPortsUp += 1
 
-                if counter < timeout and sessionsUp == totalExpectedSessionsUp:
-                    totalPortsUpFlag += 1
-                    if totalPortsUpFlag == totalPorts:
-                        self.ixnObj.logInfo('\n\tAll sessions are up!')
-                        return
+            # Length stats.keys() represents total ports.
+            return totalPortsUp == len(stats.keys())
 
-            if counter == timeout and sessionsUp != totalExpectedSessionsUp:
-                raise IxNetRestApiException('\nSessions failed to come up')
+        if self.ixnObj.waitFor(isSessionsUp, timeout=timeout, description=protocolViewName+' sessions up',
+                               ignoreException=True) is None:
+            raise IxNetRestApiException('\nSessions failed to come up')
 
-            self.ixnObj.logInfo('\n\tWait {0}/{1} seconds'.format(counter, timeout))
-            print()
-            time.sleep(1)
+        self.ixnObj.logInfo('\n\tAll sessions are up!')
 
     def verifyProtocolSessionsUp2(self, protocolViewName='Protocols Summary', timeout=60):
         """
@@ -1938,22 +1957,17 @@ class Protocol(object):
             'OSPFv2-RTR Per Port'
             'Protocols Summary'
         """
-        totalSessionsDetectedUp = 0
-        totalSessionsDetectedDown = 0
-        totalPortsUpFlag = 0
+        lastStats = {}
 
-        for counter in range(1,timeout+1):
+        def isSessionsUp():
             stats = self.statObj.getStatsData(viewName=protocolViewName, displayStats=False, silentMode=True)
             self.ixnObj.logInfo('\n%-16s %-14s %-16s %-23s %-22s' % ('Name', 'SessionsUp', 'SessionsDown',
                                                                      'ExpectedSessionsUp', 'SessionsNotStarted' ),
                                 timestamp=False)
             self.ixnObj.logInfo('-'*91, timestamp=False)
-            totalPorts = len(stats.keys()) ;# Length stats.keys() represents total ports or total protocols.
 
             sessionDownFlag = 0
             sessionNotStartedFlag = 0
-            sessionFailedFlag = 0
-
             for session in stats.keys():
                 if 'Protocol Type' in stats[session]:
                     label = stats[session]['Protocol Type']
@@ -1970,40 +1984,27 @@ class Protocol(object):
                 self.ixnObj.logInfo('%-16s %-14s %-16s %-23s %-22s' % (label, sessionsUp, sessionsDown,
                                                                        expectedSessionsUp, sessionsNotStarted),
                                     timestamp=False)
+                if sessionsNotStarted != 0:
+                    sessionNotStartedFlag = 1
 
-                if counter < timeout:
-                    if sessionsNotStarted != 0:
-                        sessionNotStartedFlag = 1
-
-                    if sessionsDown != 0:
-                        sessionDownFlag = 1
-
-                if counter == timeout:
-                    if sessionsNotStarted != 0:
-                        raise IxNetRestApiException('Sessions did not start up')
-
-                    if sessionsDown != 0:
-                        raise IxNetRestApiException('Sessions failed to come up')
+                if sessionsDown != 0:
+                    sessionDownFlag = 1
 
+            lastStats['sessionNotStartedFlag'] = sessionNotStartedFlag
+            lastStats['sessionDownFlag'] = sessionDownFlag
             if sessionNotStartedFlag == 1:
-                if counter < timeout:
-                    sessionNotStartedFlag = 0
-                    self.ixnObj.logInfo('Protocol sessions are not started yet. Waiting {0}/{1} seconds'.format(
-                        counter, timeout))
-                    time.sleep(1)
-                    continue
+                self.ixnObj.logInfo('Protocol sessions are not started yet')
 
-                if counter == timeout:
-                    raise IxNetRestApiException('Sessions are not started')
+            return sessionNotStartedFlag == 0 and sessionDownFlag == 0
 
-            if sessionDownFlag == 1:
-                print('\nWaiting {0}/{1} seconds'.format(counter, timeout))
-                time.sleep(1)
-                continue
+        if self.ixnObj.waitFor(isSessionsUp, timeout=timeout, description=protocolViewName+' sessions up',
+                               ignoreException=True) is None:
+            if lastStats.get('sessionNotStartedFlag') == 1:
+                raise IxNetRestApiException('Sessions did not start up')
+
+            raise IxNetRestApiException('Sessions failed to come up')
 
-            if counter < timeout and sessionDownFlag == 0:
-                print('\nProtocol sessions are all up')
-                break
+        self.ixnObj.logInfo('\nProtocol sessions are all up', timestamp=False)
 
     def startAllOspfv2(self):
         """
@@ -2075,6 +2076,15 @@ class Protocol(object):
         queryResponse = self.ixnObj.query(data=queryData)
 
         deviceGroupTimeout = 90
+        conditionList = []
+
+        def isDeviceGroupStarted(deviceGroupObj, label):
+            response = self.ixnObj.get(self.ixnObj.httpHeader+deviceGroupObj, silentMode=True)
+            deviceGroupStatus = response.json()['status']
+            self.ixnObj.logInfo('\t%s%s' % (label, deviceGroupObj), timestamp=False)
+            self.ixnObj.logInfo('\t\tStatus: %s' % deviceGroupStatus, timestamp=False)
+            return deviceGroupStatus == 'started'
+
         for topology in queryResponse.json()['result'][0]['topology']:
             for deviceGroup in topology['deviceGroup']:
                 deviceGroupObj = deviceGroup['href']
@@ -2083,34 +2093,18 @@ class Protocol(object):
                 enabledMultivalue = response.json()['enabled']
                 enabled = self.ixnObj.getMultivalueValues(enabledMultivalue, silentMode=False)
                 if enabled[0] == 'true':
-                    for counter in range(1,deviceGroupTimeout+1):
-                        response = self.ixnObj.get(self.ixnObj.httpHeader+deviceGroupObj, silentMode=False)
-                        deviceGroupStatus = response.json()['status']
-                        self.ixnObj.logInfo('\t%s' % deviceGroupObj, timestamp=False)
-                        self.ixnObj.logInfo('\t\tStatus: %s' % deviceGroupStatus, timestamp=False)
-                        if counter < deviceGroupTimeout and deviceGroupStatus != 'started':
-                            self.ixnObj.logInfo('\t\tWaiting %d/%d seconds ...' % (counter, deviceGroupTimeout), timestamp=False)
-                            time.sleep(1)
-                        if counter < deviceGroupTimeout and deviceGroupStatus == 'started':
-                            break
-                        if counter == deviceGroupTimeout and deviceGroupStatus != 'started':
-                            raise IxNetRestApiException('\nDevice Group failed to start up')
-                    
+                    conditionList.append(('Device Group started: %s' % deviceGroupObj,
+                                          lambda deviceGroupObj=deviceGroupObj: isDeviceGroupStarted(deviceGroupObj, '')))
+
                     # Inner Device Group
                     if deviceGroup['deviceGroup'] != []:
                         innerDeviceGroupObj = deviceGroup['deviceGroup'][0]['href']
-                        for counter in range(1,deviceGroupTimeout):
-                            response = self.ixnObj.get(self.ixnObj.httpHeader+innerDeviceGroupObj, silentMode=True)
-                            innerDeviceGroupStatus = response.json()['status']
-                            self.ixnObj.logInfo('\tInnerDeviceGroup: %s' % innerDeviceGroupObj, timestamp=False)
-                            self.ixnObj.logInfo('\t   Status: %s' % innerDeviceGroupStatus, timestamp=False)
-                            if counter < deviceGroupTimeout and innerDeviceGroupStatus != 'started':
-                                self.ixnObj.logInfo('\tWait %d/%d' % (counter, deviceGroupTimeout), timestamp=False)
-                                time.sleep(1)
-                            if counter < deviceGroupTimeout and innerDeviceGroupStatus == 'started':
-                                break
-                            if counter == deviceGroupTimeout and innerDeviceGroupStatus != 'started':
-                                raise IxNetRestApiException('\nInner Device Group failed to start up')
+                        conditionList.append(('Inner Device Group started: %s' % innerDeviceGroupObj,
+                                              lambda deviceGroupObj=innerDeviceGroupObj: isDeviceGroupStarted(deviceGroupObj, 'InnerDeviceGroup: ')))
+
+        # The Device Groups start in parallel. Wait for all of them together.
+        if None in self.ixnObj.waitForAll(conditionList, timeout=deviceGroupTimeout, ignoreException=True):
+            raise IxNetRestApiException('\nDevice Group failed to start up')
         print()
 
     def startAllProtocols(self):
@@ -2170,6 +2164,70 @@ class Protocol(object):
         response = self.ixnObj.post(url, data={'arg1': [protocolObj]})
         self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
 
+    def getProtocolOperationUrl(self, protocolObj, action):
+        """
+        Description
+            Get the operation URL that starts or stops the objects of the same type.
+
+        Parameters
+            protocolObj: <str>: /api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1/ethernet/1/ipv4/1/bgpIpv4Peer/1
+            action: <str>: start|stop
+
+        Return
+            http://{apiServerIp:port}/api/v1/sessions/1/ixnetwork/topology/deviceGroup/ethernet/ipv4/bgpIpv4Peer/operations/start
+        """
+        match = re.search('/ixnetwork(/.*)', protocolObj)
+        if not match:
+            raise IxNetRestApiException('getProtocolOperationUrl: Not an ixnetwork object: {0}'.format(protocolObj))
+
+        # Remove the object IDs: /topology/1/deviceGroup/1 -> /topology/deviceGroup
+        objectPath = re.sub('/[0-9]+(?=/|$)', '', match.group(1))
+        return self.ixnObj.sessionUrl+objectPath+'/operations/'+action
+
+    def startStopProtocolObjects(self, protocolObjList, action='start', maxObjectsPerRequest=None, timeout=120):
+        """
+        Description
+            Start or stop any mix of NGPF objects: Topologies, Device Groups, IP and protocol objects.
+            The objects are grouped by their operation URL and each group is sent with one POST
+            that has all its objects in arg1. The POSTs of the different groups are sent concurrently
+            and all the operations are waited on together.
+
+        Parameters
+            protocolObjList: <list>: A list of object handles.
+                 Ex: ['/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1/ethernet/1/ipv4/1/bgpIpv4Peer/1',
+                      '/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1/ethernet/1/ipv4/1/ospfv2/1', ...]
+            action: <str>: start|stop
+            maxObjectsPerRequest: <int>: Split a group in concurrent POSTs of up to this many objects.
+                                         None = One POST for each group.
+            timeout: <int>: The time allowed for all the operations to complete.
+
+        Return
+            A dict: {operationUrl: [protocolObj, ...]}
+        """
+        operationGroups = {}
+        # Remove duplicates and preserve the order
+        for protocolObj in dict.fromkeys(protocolObjList):
+            operationGroups.setdefault(self.getProtocolOperationUrl(protocolObj, action), []).append(protocolObj)
+
+        requestList = []
+        for url, objList in operationGroups.items():
+            self.ixnObj.logInfo('startStopProtocolObjects: {0}: {1} objects: {2}'.format(action, len(objList), url))
+            chunkSize = maxObjectsPerRequest or len(objList)
+            for index in range(0, len(objList), chunkSize):
+                requestList.append((url, {'arg1': objList[index:index+chunkSize]}))
+
+        if requestList == []:
+            return operationGroups
+
+        if len(requestList) > 1 and sys.version_info[0] >= 3:
+            responseList = self.ixnObj.getAsyncConnect().postMany(requestList)
+        else:
+            responseList = [self.ixnObj.post(url, data=data) for url, data in requestList]
+
+        self.ixnObj.waitForOperations([(response, url+'/'+response.json()['id'])
+                                       for (url, data), response in zip(requestList, responseList)], timeout=timeout)
+        return operationGroups
+
     def startTopology(self, topologyObjList='all'):
         """
         Description
@@ -2193,9 +2251,7 @@ class Protocol(object):
 
             topologyObjList = [topology['href'] for topology in topologyList]
 
-        url = self.ixnObj.sessionUrl+'/topology/operations/start'
-        response = self.ixnObj.post(url, data={'arg1': topologyObjList})
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(topologyObjList, action='start')
         self.verifyDeviceGroupStatus()
 
     def stopTopology(self, topologyObjList='all'):
@@ -2221,8 +2277,7 @@ class Protocol(object):
 
             topologyObjList = [topology['href'] for topology in topologyList]
 
-        self.ixnObj.post(self.ixnObj.sessionUrl+'/topology/operations/stop', data={'arg1': topologyObjList})
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(topologyObjList, action='stop')
 
     def startStopDeviceGroup(self, deviceGroupObjList='all', action='start'):
         """
@@ -2252,10 +2307,7 @@ class Protocol(object):
                 for dgHref in  dg['deviceGroup']:
                     deviceGroupObjList.append(dgHref['href'])
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/operations/%s' % action
-        response = oself.ixnObj.post(url, data={'arg1': deviceGroupObjList})
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
-        time.sleep(3)
+        self.startStopProtocolObjects(deviceGroupObjList, action=action)
 
     def verifyProtocolSessionsNgpf(self, protocolObjList=None, timeout=90):
         """
@@ -2283,63 +2335,69 @@ class Protocol(object):
             RESPONSE:  [u'up', u'up', u'up', u'up', u'up', u'up', u'up', u'up']
             GET:  http://10.219.117.103:11009/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1/ethernet/1/ipv4/1/bgpIpv4Peer/1
         """
-        timerStop = timeout
         if protocolObjList is None:
             protocolObjList = self.configuredProtocols
 
-        for eachProtocol in protocolObjList:
+        lastStatus = {}
+
+        def isProtocolUp(eachProtocol):
             # notStarted, up or down
             protocolName =  eachProtocol.split('/')[-2]
-            for timer in range(1,timerStop+1):
-                sessionStatus = self.getSessionStatus(eachProtocol)
-                # ['up']
-                response = self.ixnObj.get(self.ixnObj.httpHeader+eachProtocol, silentMode=True)
-                # Started
-                protocolSessionStatus = response.json()['status']
-
-                self.ixnObj.logInfo('\nVerifyProtocolSessions: %s\n' % eachProtocol, timestamp=False)
-                self.ixnObj.logInfo('\tprotocolSessionStatus: %s' % protocolSessionStatus, timestamp=False)
-                self.ixnObj.logInfo('\tsessionStatusResponse: %s' % sessionStatus, timestamp=False)
-                if timer < timerStop:
-                    if protocolSessionStatus != 'started':
-                        self.ixnObj.logInfo('\tWait %s/%s seconds' % (timer, timerStop), timestamp=False)
-                        time.sleep(1)
-                        continue
-
-                    # Started
-                    if 'up' not in sessionStatus:
-                        self.ixnObj.logInfo('\tProtocol session is down: Wait %s/%s seconds' % (timer, timerStop), timestamp=False)
-                        time.sleep(1)
-                        continue
-
-                    if 'up' in sessionStatus:
-                        self.ixnObj.logInfo('Protocol sessions are all up: {0}'.format(protocolName))
-                        break
-
-                if timer == timerStop:
-                    if 'notStarted' in protocolSessionStatus:
-                        raise IxNetRestApiException('\tverifyProtocolSessions: {0} session failed to start'.format(protocolName))
-                        
-                    if protocolSessionStatus == 'started' and 'down' in sessionStatus:
-                        # Show ARP failures
-                        if protocolName == 'ipv4':
-                            ipInterfaceIndexList = []
-                            index = 0
-                            for eachSessionStatus in sessionStatus:
-                                self.ixnObj.logInfo('eachSessionStatus index: {0} {1}'.format(eachSessionStatus, index), timestamp=False)
-                                if eachSessionStatus == 'down':
-                                    ipInterfaceIndexList.append(index)
-                                index += 1
+            sessionStatus = self.getSessionStatus(eachProtocol)
+            # ['up']
+            response = self.ixnObj.get(self.ixnObj.httpHeader+eachProtocol, silentMode=True)
+            # Started
+            protocolSessionStatus = response.json()['status']
+            lastStatus[eachProtocol] = (protocolSessionStatus, sessionStatus, response)
+
+            self.ixnObj.logInfo('\nVerifyProtocolSessions: %s\n' % eachProtocol, timestamp=False)
+            self.ixnObj.logInfo('\tprotocolSessionStatus: %s' % protocolSessionStatus, timestamp=False)
+            self.ixnObj.logInfo('\tsessionStatusResponse: %s' % sessionStatus, timestamp=False)
+            if protocolSessionStatus != 'started':
+                return False
+
+            # Started
+            if 'up' not in sessionStatus:
+                self.ixnObj.logInfo('\tProtocol session is down', timestamp=False)
+                return False
+
+            self.ixnObj.logInfo('Protocol sessions are all up: {0}'.format(protocolName))
+            return True
+
+        # All the protocols come up in parallel and share the timeout.
+        conditionList = [(eachProtocol, lambda eachProtocol=eachProtocol: isProtocolUp(eachProtocol))
+                         for eachProtocol in protocolObjList]
+        resultList = self.ixnObj.waitForAll(conditionList, timeout=timeout, ignoreException=True)
+
+        for eachProtocol, isUp in zip(protocolObjList, resultList):
+            if isUp:
+                continue
 
-                            ipMultivalue = response.json()['address']
-                            ipAddressList = self.ixnObj.getMultivalueValues(ipMultivalue, silentMode=True)
-                            self.ixnObj.logWarning('ARP failed on IP interface:')
-                            for eachIpIndex in ipInterfaceIndexList:
-                                self.ixnObj.logInfo('\t{0}'.format(ipAddressList[eachIpIndex]), timestamp=False)
-                        else:
-                            self.ixnObj.logWarning('\tverifyProtocolSessions: {0} session failed'.format(protocolName))
+            protocolName =  eachProtocol.split('/')[-2]
+            protocolSessionStatus, sessionStatus, response = lastStatus[eachProtocol]
+            if 'notStarted' in protocolSessionStatus:
+                raise IxNetRestApiException('\tverifyProtocolSessions: {0} session failed to start'.format(protocolName))
+
+            if protocolSessionStatus == 'started' and 'down' in sessionStatus:
+                # Show ARP failures
+                if protocolName == 'ipv4':
+                    ipInterfaceIndexList = []
+                    index = 0
+                    for eachSessionStatus in sessionStatus:
+                        self.ixnObj.logInfo('eachSessionStatus index: {0} {1}'.format(eachSessionStatus, index), timestamp=False)
+                        if eachSessionStatus == 'down':
+                            ipInterfaceIndexList.append(index)
+                        index += 1
+
+                    ipMultivalue = response.json()['address']
+                    ipAddressList = self.ixnObj.getMultivalueValues(ipMultivalue, silentMode=True)
+                    self.ixnObj.logWarning('ARP failed on IP interface:')
+                    for eachIpIndex in ipInterfaceIndexList:
+                        self.ixnObj.logInfo('\t{0}'.format(ipAddressList[eachIpIndex]), timestamp=False)
+                else:
+                    self.ixnObj.logWarning('\tverifyProtocolSessions: {0} session failed'.format(protocolName))
 
-                        raise IxNetRestApiException('Verify protocol sessions failed: {0}'.format(protocolName))
+                raise IxNetRestApiException('Verify protocol sessions failed: {0}'.format(protocolName))
 
     def verifyAllProtocolSessionsInternal(self, protocol, timeout=120, silentMode=True):
         """
@@ -2354,7 +2412,6 @@ class Protocol(object):
            silentMode: <bool>: True to not display less on the terminal.  False for debugging purpose.
         """
         sessionDownList = ['down', 'notStarted']
-        startCounter = 1
         response = self.ixnObj.get(self.ixnObj.httpHeader+protocol, silentMode=silentMode)
         protocolActiveMultivalue = response.json()['active']
         response = self.ixnObj.getMultivalueValues(protocolActiveMultivalue, silentMode=silentMode)
@@ -2363,7 +2420,7 @@ class Protocol(object):
         if response[0] == 'false':
             return
 
-        for timer in range(startCounter, timeout+1):
+        def isSessionsUp():
             currentStatus = self.getSessionStatus(protocol)
             self.ixnObj.logInfo('\n%s' % protocol, timestamp=False)
             self.ixnObj.logInfo('\tTotal sessions: %d' % len(currentStatus), timestamp=False)
@@ -2372,97 +2429,188 @@ class Protocol(object):
                 if eachStatus != 'up':
                     totalDownSessions += 1
             self.ixnObj.logInfo('\tTotal sessions Down: %d' % totalDownSessions, timestamp=False)
-            #self.ixnObj.logInfo('\tCurrentStatus: %s' % currentStatus, timestamp=False)
+            return [element for element in sessionDownList if element in currentStatus] == []
+
+        if self.ixnObj.waitFor(isSessionsUp, timeout=timeout, description='Protocol sessions up: %s' % protocol,
+                               ignoreException=True) is None:
+            raise IxNetRestApiException('\nError: Protocols failed')
+
+        self.ixnObj.logInfo('Protocol sessions are all up')
+
+    def getConfiguredProtocolSessions(self, protocolList=None):
+        """
+        Description
+            Discover all the configured protocol objects with one deep query.
+            The protocols in disabled Device Groups and the protocols without any active
+            device are left out.
+
+        Parameter
+            protocolList: <list>: The protocol node names. Defaults to all the L2 and L3 protocols:
+                                  isisL3, lacp, mpls, bgpIpv4Peer, ospfv2, ...
+
+        Return
+            A dict: {protocolObj: {'protocol': 'bgpIpv4Peer', 'deviceGroup': deviceGroupObj, 'active': [True, False, ...]}}
+        """
+        from IxNetRestApiTopologyIndex import ngpfL2ProtocolList, ngpfL3ProtocolList
+
+        if protocolList is None:
+            protocolList = ngpfL2ProtocolList + ngpfL3ProtocolList
+
+        nodes = [{'node': 'topology', 'properties': [], 'where': []},
+                 {'node': 'deviceGroup', 'properties': ['enabled'], 'where': []},
+                 {'node': 'ethernet', 'properties': [], 'where': []},
+                 {'node': 'ipv4', 'properties': [], 'where': []},
+                 {'node': 'ipv6', 'properties': [], 'where': []}]
+        nodes += [{'node': protocol, 'properties': ['active'], 'where': []} for protocol in protocolList]
+        queryResponse = self.ixnObj.query(data={'from': '/', 'nodes': nodes}, silentMode=True)
+
+        deviceGroupList = []
+        protocolObjList = []
+        def findObjects(queryResult, deviceGroupObj):
+            for node, value in queryResult.items():
+                if type(value) is not list:
+                    continue
+
+                for child in value:
+                    if type(child) is not dict or 'href' not in child:
+                        continue
+
+                    if node == 'deviceGroup':
+                        deviceGroupList.append((child['href'], child['enabled'], deviceGroupObj))
+                        findObjects(child, child['href'])
+                        continue
+
+                    if node in protocolList:
+                        protocolObjList.append((child['href'], node, child['active'], deviceGroupObj))
+
+                    findObjects(child, deviceGroupObj)
+
+        findObjects(queryResponse.json()['result'][0], None)
 
-            if timer < timeout and [element for element in sessionDownList if element in currentStatus] == []:
-                self.ixnObj.logInfo('Protocol sessions are all up')
-                startCounter = timer
-                break
+        # Resolve the Device Group enabled and the protocol active multivalues in one bulk call.
+        multivalueValues = self.ixnObj.getMultivalueValuesBulk([enabled for deviceGroupObj, enabled, parent in deviceGroupList] +
+                                                               [active for protocolObj, protocol, active, deviceGroupObj in protocolObjList])
 
-            if timer < timeout and [element for element in sessionDownList if element in currentStatus] != []:
-                self.ixnObj.logInfo('\tWait %d/%d seconds' % (timer, timeout), timestamp=False)
-                time.sleep(1)
+        disabledDeviceGroupList = set()
+        for deviceGroupObj, enabled, parentDeviceGroupObj in deviceGroupList:
+            # The parents are listed before the nested Device Groups.
+            if multivalueValues[enabled][0] == 'false' or parentDeviceGroupObj in disabledDeviceGroupList:
+                self.ixnObj.logInfo('DeviceGroup is disabled: {0}'.format(deviceGroupObj), timestamp=False)
+                disabledDeviceGroupList.add(deviceGroupObj)
+
+        protocolSessions = {}
+        for protocolObj, protocol, active, deviceGroupObj in protocolObjList:
+            activeList = [value == 'true' for value in multivalueValues[active]]
+            if deviceGroupObj in disabledDeviceGroupList or True not in activeList:
                 continue
 
-            if timer == timeout and [element for element in sessionDownList if element in currentStatus] != []:
-                raise IxNetRestApiException('\nError: Protocols failed')
+            protocolSessions[protocolObj] = {'protocol': protocol, 'deviceGroup': deviceGroupObj, 'active': activeList}
+        return protocolSessions
 
-    def verifyAllProtocolSessionsNgpf(self, timeout=120, silentMode=False):
+    def getProtocolSessionCounts(self, protocolSessions):
         """
         Description
-            Loop through each Topology Group and its enabled Device Groups and verify
-            all the created and activated protocols for session up.
-            Applies to Ethernet, IPv4 and IPv6.
+            Get the session status of all the protocols in one query and count the sessions of each protocol.
 
-        Parameters
-           timeout: <int>: The timeout value for declaring as failed. Default = 120 seconds.
-           silentMode: <bool>: True to not display less on the terminal.  False for debugging purpose.            
-        """
-        l2ProtocolList = ['isisL3', 'lacp', 'mpls']
-        l3ProtocolList = ['ancp', 'bfdv4Interface', 'bgpIpv4Peer', 'bgpIpv6Peer', 'dhcpv4relayAgent', 'dhcpv6relayAgent',
-                          'geneve', 'greoipv4', 'greoipv6', 'igmpHost', 'igmpQuerier',
-                          'lac', 'ldpBasicRouter', 'ldpBasicRouterV6', 'ldpConnectedInterface', 'ldpv6ConnectedInterface',
-                          'ldpTargetedRouter', 'ldpTargetedRouterV6', 'lns', 'mldHost', 'mldQuerier', 'ptp', 'ipv6sr',
-                          'openFlowController', 'openFlowSwitch', 'ospfv2', 'ospfv3', 'ovsdbcontroller', 'ovsdbserver',
-                          'pcc', 'pce', 'pcepBackupPCEs', 'pimV4Interface', 'pimV6Interface', 'ptp', 'rsvpteIf',
-                          'rsvpteLsps', 'tag', 'vxlan']
+        Parameter
+            protocolSessions: <dict>: The getConfiguredProtocolSessions() return value.
 
-        queryData = {'from': '/',
-                        'nodes': [{'node': 'topology', 'properties': [], 'where': []},
-                                  {'node': 'deviceGroup', 'properties': ['href'], 'where': []}]
-                    }
-        queryResponse = self.ixnObj.query(data=queryData)
-        try:
-            topologyGroupList = queryResponse.json()['result'][0]['topology']
-        except IndexError:
-            raise IxNetRestApiException('\nNo Device Group objects  found')
+        Return
+            {'protocols': {protocolObj: {'protocol':, 'up':, 'down':, 'notStarted':, 'total':}},
+             'summary': {'bgpIpv4Peer': {'up':, 'down':, 'notStarted':, 'total':}, ...}}
+
+            Only the sessions of the active devices are counted. Any other status, for example
+            'unknown', is counted as down.
+        """
+        protocolList = sorted(set([protocolSession['protocol'] for protocolSession in protocolSessions.values()]))
+        nodes = [{'node': node, 'properties': [], 'where': []} for node in ['topology', 'deviceGroup', 'ethernet', 'ipv4', 'ipv6']]
+        nodes += [{'node': protocol, 'properties': ['sessionStatus'], 'where': []} for protocol in protocolList]
+        queryResponse = self.ixnObj.query(data={'from': '/', 'nodes': nodes}, silentMode=True)
+
+        sessionStatus = {}
+        pending = [queryResponse.json()['result'][0]]
+        while pending:
+            queryResult = pending.pop()
+            for node, value in queryResult.items():
+                if type(value) is not list:
+                    continue
 
-        deviceGroupObjList = []
-        for topology in topologyGroupList:
-            for deviceGroup in topology['deviceGroup']:
-                deviceGroup = deviceGroup['href']
-                response = self.ixnObj.get(self.ixnObj.httpHeader+deviceGroup)
-                # Verify if the Device Group is enabled. If not, don't go further.
-                enabledMultivalue = response.json()['enabled']
-                response = self.ixnObj.getMultivalueValues(enabledMultivalue, silentMode=silentMode)
+                for child in value:
+                    if type(child) is not dict or 'href' not in child:
+                        continue
 
-                self.ixnObj.logInfo('DeviceGroup is enabled: %s'% response)
-                if response[0] == 'false':
-                    continue
+                    if 'sessionStatus' in child:
+                        sessionStatus[child['href']] = child['sessionStatus']
+                    pending.append(child)
 
-                response = self.ixnObj.get(self.ixnObj.httpHeader+deviceGroup+'/ethernet', silentMode=silentMode)
-                match = re.match('/api/v[0-9]+/sessions/[0-9]+/ixnetwork(.*)', deviceGroup)
-                queryData = {'from': match.group(1),
-                             'nodes': [{'node': 'ethernet', 'properties': [], 'where': []}]
-                            }
-                queryResponse = self.ixnObj.query(data=queryData)
-                ethernetIds = queryResponse.json()['result'][0]['ethernet']
-                ethernetList = [ethernet['href'] for ethernet in ethernetIds]
+        counts = {'protocols': {}, 'summary': {}}
+        for protocolObj, protocolSession in protocolSessions.items():
+            statusList = sessionStatus.get(protocolObj, [])
+            activeList = protocolSession['active']
+            if len(activeList) == len(statusList):
+                statusList = [status for status, active in zip(statusList, activeList) if active]
 
-                for ethernet in ethernetList:
-                    # Verify Layer2 first
-                    for protocol in l2ProtocolList:
-                        response = self.ixnObj.get(self.ixnObj.httpHeader+ethernet+'/'+protocol, silentMode=True, ignoreError=True)
-                        if response.json() == [] or 'errors' in response.json():
-                            continue
-                        currentProtocolList = ['%s/%s/%s' % (ethernet, protocol, str(i["id"])) for i in response.json()]
-                        for currentProtocol in currentProtocolList:
-                            if 'isis' in currentProtocol:
-                                response = self.ixnObj.get(self.ixnObj.httpHeader+deviceGroup+'/isisL3Router', silentMode=silentMode)
-                            self.verifyAllProtocolSessionsInternal(currentProtocol)
+            protocolCount = {'protocol': protocolSession['protocol'], 'total': len(statusList),
+                             'up': statusList.count('up'), 'notStarted': statusList.count('notStarted')}
+            protocolCount['down'] = protocolCount['total'] - protocolCount['up'] - protocolCount['notStarted']
+            counts['protocols'][protocolObj] = protocolCount
 
-                    response = self.ixnObj.get(self.ixnObj.httpHeader+ethernet+'/ipv4', silentMode=silentMode)
-                    ipv4List = ['%s/%s/%s' % (ethernet, 'ipv4', str(i["id"])) for i in response.json()]
-                    response = self.ixnObj.get(self.ixnObj.httpHeader+ethernet+'/ipv6', silentMode=silentMode)
-                    ipv6List = ['%s/%s/%s' % (ethernet, 'ipv6', str(i["id"])) for i in response.json()]
-                    for layer3Ip in ipv4List+ipv6List:
-                        for protocol in l3ProtocolList:
-                            response = self.ixnObj.get(self.ixnObj.httpHeader+layer3Ip+'/'+protocol, silentMode=True, ignoreError=True)
-                            if response.json() == [] or 'errors' in response.json():
-                                continue
-                            currentProtocolList = ['%s/%s/%s' % (layer3Ip, protocol, str(i["id"])) for i in response.json()]
-                            for currentProtocol in currentProtocolList:
-                                self.verifyAllProtocolSessionsInternal(currentProtocol, silentMode=silentMode)
+            summary = counts['summary'].setdefault(protocolSession['protocol'], {'up': 0, 'down': 0, 'notStarted': 0, 'total': 0})
+            for key in summary:
+                summary[key] += protocolCount[key]
+
+        return counts
+
+    def verifyAllProtocolSessionsNgpf(self, timeout=120, silentMode=False):
+        """
+        Description
+            Verify all the created and activated protocols in the enabled Device Groups of
+            each Topology Group for session up.
+            The protocols are discovered with one query and the session status of all of them
+            is polled with one query on each interval.
+
+        Parameters
+           timeout: <int>: The timeout value for declaring as failed. Default = 120 seconds.
+           silentMode: <bool>: True: Only show the session counts when the verification is done.
+                               False: Show the session counts on each interval.
+
+        Return
+           The last getProtocolSessionCounts() value:
+              {'protocols': {protocolObj: {'protocol':, 'up':, 'down':, 'notStarted':, 'total':}},
+               'summary': {protocolName: {'up':, 'down':, 'notStarted':, 'total':}}}
+        """
+        protocolSessions = self.getConfiguredProtocolSessions()
+        if protocolSessions == {}:
+            self.ixnObj.logInfo('verifyAllProtocolSessionsNgpf: No active protocol configured')
+            return {'protocols': {}, 'summary': {}}
+
+        lastCounts = {}
+        def showCounts(counts):
+            for protocol, summary in sorted(counts['summary'].items()):
+                self.ixnObj.logInfo('\t{0:25} Total: {1:<6} Up: {2:<6} Down: {3:<6} NotStarted: {4}'.format(
+                    protocol, summary['total'], summary['up'], summary['down'], summary['notStarted']), timestamp=False)
+
+        def areAllSessionsUp():
+            lastCounts.update(self.getProtocolSessionCounts(protocolSessions))
+            if silentMode == False:
+                showCounts(lastCounts)
+
+            return all([protocolCount['total'] > 0 and protocolCount['up'] == protocolCount['total']
+                        for protocolCount in lastCounts['protocols'].values()])
+
+        isUp = self.ixnObj.waitFor(areAllSessionsUp, timeout=timeout, description='All protocol sessions up',
+                                   ignoreException=True)
+        if silentMode:
+            showCounts(lastCounts)
+
+        if isUp is None:
+            failedList = ['{0}: {1}/{2} up'.format(protocolObj, protocolCount['up'], protocolCount['total'])
+                          for protocolObj, protocolCount in sorted(lastCounts['protocols'].items())
+                          if protocolCount['total'] == 0 or protocolCount['up'] != protocolCount['total']]
+            raise IxNetRestApiException('\nError: Protocols failed:\n\t{0}'.format('\n\t'.join(failedList)))
+
+        self.ixnObj.logInfo('Protocol sessions are all up')
+        return lastCounts
 
     def getIpObjectsByTopologyObject(self, topologyObj, ipType='ipv4'):
         """
@@ -2644,42 +2792,32 @@ class Protocol(object):
            protocolObj: <str>: /api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1
            timeout: <int>: The timeout value. Default=30 seconds.
         """
-        for counter in range(1,timeout+1):
+        def getDownSessionCount():
             # sessionStatus is a list of status for each 'session' (host)
             sessionStatus = self.getSessionStatus(protocolObj)
+            count = len([session for session in sessionStatus if session in ['notStarted', 'down']])
             self.ixnObj.logInfo('\nVerifyNgpfProtocolStarted: %s' % protocolObj, timestamp=False)
+            self.ixnObj.logInfo('\t{0} out of {1} sessions are still down'.format(count, len(sessionStatus)), timestamp=False)
+            return count, len(sessionStatus)
 
-            if counter < timeout:
-                count = 0
-                for session in sessionStatus:
-                    if session in ['notStarted', 'down']:
-                        count += 1
-                self.ixnObj.logInfo('\t{0} out of {1} sessions are still down'.format(count, len(sessionStatus)), timestamp=False)
-                self.ixnObj.logInfo('\tWait %d/%d seconds' % (counter, timeout), timestamp=False)
-                time.sleep(1)
-
-            if counter == timeout:
-                count = 0
-                for session in sessionStatus:
-                    if session in ['notStarted', 'down']:
-                        count += 1
-                
-                if count != 0:
-                    errMsg = '{0} out of {1} sessions failed to start'.format(count, len(sessionStatus))
-                    self.ixnObj.logError(errMsg)
-                    if ignoreFailure == False:
-                        raise IxNetRestApiException(errMsg)
-                    else:
-                        return 1
+        lastCount = []
+
+        def isProtocolStarted():
+            count, total = getDownSessionCount()
+            lastCount[:] = [count, total]
+            return count == 0
 
-            if counter < timeout:
-                flag = 0
-                for session in sessionStatus:
-                    if session in ['notStarted', 'down']:
-                        flag = 1
-                if flag == 0:
-                    self.ixnObj.logInfo('\tTotal of {0} sessions started'.format(len(sessionStatus)), timestamp=False)
-                    return 0
+        if self.ixnObj.waitFor(isProtocolStarted, timeout=timeout, description='NGPF protocol started',
+                               ignoreException=True):
+            self.ixnObj.logInfo('\tTotal of {0} sessions started'.format(lastCount[1]), timestamp=False)
+            return 0
+
+        errMsg = '{0} out of {1} sessions failed to start'.format(lastCount[0], lastCount[1])
+        self.ixnObj.logError(errMsg)
+        if ignoreFailure == False:
+            raise IxNetRestApiException(errMsg)
+        else:
+            return 1
 
     def deviceGroupProtocolStackNgpf(self, deviceGroupObj, ipType, arpTimeout=3, silentMode=True):
         """
@@ -2720,18 +2858,14 @@ class Protocol(object):
                 # result == 0 means passed. 1 means failed.
                 result = self.verifyNgpfProtocolStarted(ipProtocol, ignoreFailure=True)
 
-                for counter in range(1,arpTimeout+1):
-                    sessionStatus = self.getSessionStatus(ipProtocol)
-                    if counter < arpTimeout and 'down' in sessionStatus:
-                        self.ixnObj.logInfo('\tARP is not resolved yet. Wait {0}/{1}'.format(counter, arpTimeout), timestamp=False)
-                        time.sleep(1)
-                        continue
-                    if counter < arpTimeout and 'down' not in sessionStatus:
-                        break
-                    if counter == arpTimeout and 'down' in sessionStatus:
-                        #raise IxNetRestApiException('\nARP is not getting resolved')
-                        # Let it flow down to get the unresolved ARPs
-                        pass
+                def isArpResolved():
+                    if 'down' in self.getSessionStatus(ipProtocol):
+                        self.ixnObj.logInfo('\tARP is not resolved yet', timestamp=False)
+                        return False
+                    return True
+
+                # On timeout, let it flow down to get the unresolved ARPs
+                self.ixnObj.waitFor(isArpResolved, timeout=arpTimeout, description='ARP resolved', ignoreException=True)
 
                 protocolResponse = self.ixnObj.get(self.ixnObj.httpHeader+ipProtocol+'?includes=resolvedGatewayMac,address,gatewayIp', ignoreError=True, silentMode=silentMode)
 
@@ -2809,21 +2943,19 @@ class Protocol(object):
                 if response[0] == 'false':
                     continue
 
-                timeout = 30
-                for counter in range(1,timeout+1):
+                def getDeviceGroupStarted():
                     response = self.ixnObj.get(self.ixnObj.httpHeader+deviceGroupObj, silentMode=silentMode)
                     deviceGroupStatus = response.json()['status']
                     if deviceGroupStatus == 'notStarted':
                         raise IxNetRestApiException('\nDevice Group is not started: {0}.'.format(deviceGroupObj))
 
-                    if counter < timeout and deviceGroupStatus == 'starting':
-                        self.ixnObj.logInfo('\tWait %d/%d' % (counter, timeout), timestamp=False)
-                        time.sleep(1)
-                        continue
-                    if counter < timeout and deviceGroupStatus in ['started', 'mixed']:
-                        break
-                    if counter == timeout and deviceGroupStatus not in ['started', 'mixed']:
-                        raise IxNetRestApiException('\nDevice Group failed to come up: {0}.'.format(deviceGroupObj))
+                    if deviceGroupStatus in ['started', 'mixed']:
+                        return deviceGroupStatus
+
+                deviceGroupStatus = self.ixnObj.waitFor(getDeviceGroupStarted, timeout=30, description='Device Group started',
+                                                        ignoreException=True)
+                if deviceGroupStatus is None:
+                    raise IxNetRestApiException('\nDevice Group failed to come up: {0}.'.format(deviceGroupObj))
 
                 if deviceGroupStatus in ['started', 'mixed']:
                     startFlag = 1
@@ -2867,6 +2999,23 @@ class Protocol(object):
             - removePacket[Unresolved]
             - The Gateway IP's Mac Address.
         """
+        if self.topologyIndex is not None:
+            entryList = [entry for entry in self.topologyIndex.getIpAddressEntries(gatewayIp, addressType='gatewayIp')
+                         if entry['node'] == 'ipv4']
+            if entryList == []:
+                return 0
+
+            entry = entryList[0]
+            self.ixnObj.logInfo('Found gateway: %s ; Index:%s' % (gatewayIp, entry['index']-1))
+            response = self.ixnObj.get(self.ixnObj.httpHeader+entry['ipObj']+'?includes=resolvedGatewayMac')
+            gatewayMacAddress = response.json()['resolvedGatewayMac'][entry['index']-1]
+            self.ixnObj.logInfo('gatewayIpMacAddress: %s' % gatewayMacAddress)
+            if 'Unresolved' in gatewayMacAddress:
+                self.ixnObj.logWarning('Gateway Mac Address is unresolved: {0}'.format(gatewayIp))
+                return 0
+
+            return gatewayMacAddress
+
         queryData = {'from': '/',
                     'nodes': [{'node': 'topology',    'properties': [], 'where': []},
                               {'node': 'deviceGroup', 'properties': [], 'where': []},
@@ -2920,6 +3069,16 @@ class Protocol(object):
             0: Failed. No srcIpAddress found in any Device Group.
             Gateway IP address
         """
+        if self.topologyIndex is not None:
+            entry = self.topologyIndex.getIpAddressEntry(srcIpAddress)
+            if entry is None:
+                return 0
+
+            self.ixnObj.logInfo('Found srcIpAddress: %s. Getting Gatway IP address ...' % srcIpAddress)
+            gatewayIp = self.topologyIndex.getIpObjectValues(entry['ipObj'], 'gatewayIp')[entry['index']-1]
+            self.ixnObj.logInfo('Gateway IP address: %s' % gatewayIp)
+            return gatewayIp
+
         queryData = {'from': '/',
                     'nodes': [{'node': 'topology',    'properties': [], 'where': []},
                               {'node': 'deviceGroup', 'properties': [], 'where': []},
@@ -2963,6 +3122,14 @@ class Protocol(object):
             None: If no srcIpAddress is found.
             deviceGroup Object and IPv4|IPv6 object
         """
+        if self.topologyIndex is not None:
+            entry = self.topologyIndex.getIpAddressEntry(srcIpAddress)
+            if entry is None:
+                return None
+
+            self.ixnObj.logInfo('Found srcIpAddress: %s' % srcIpAddress)
+            return entry['deviceGroup'], entry['ipObj']
+
         queryData = {'from': '/',
                     'nodes': [{'node': 'topology',    'properties': [], 'where': []},
                               {'node': 'deviceGroup', 'properties': [], 'where': []},
@@ -3041,6 +3208,13 @@ class Protocol(object):
             None: No ipAddress found in any NetworkGroup.
             network group Object: The Network Group object.
         """
+        if self.topologyIndex is not None:
+            entry = self.topologyIndex.getIpAddressEntry(networkGroupIpAddress, addressType='networkAddress')
+            if entry is None:
+                return None
+
+            return entry['networkGroup']
+
         queryData = {'from': '/',
                     'nodes': [{'node': 'topology',    'properties': [], 'where': []},
                               {'node': 'deviceGroup', 'properties': [], 'where': []},
@@ -3076,6 +3250,16 @@ class Protocol(object):
         Return
             None or the IP address index number (based one)
         """
+        if self.topologyIndex is not None:
+            # The TopologyIndex maps all the IP addresses to their device index.
+            entry = self.topologyIndex.getIpAddressEntry(ipAddress)
+            if entry is None:
+                return None
+
+            self.ixnObj.logDebug('{0} {1}'.format(entry['index']-1, ipAddress))
+            # Return index number using based one. Not based zero.
+            return entry['index']
+
         topologyList = self.ixnObj.get(self.ixnObj.sessionUrl + '/topology')
         for topology in topologyList.json():
             topologyObj = topology['links'][0]['href']
@@ -3099,7 +3283,7 @@ class Protocol(object):
                         for index, ip in enumerate(ipValueList):
                             if ipAddress in ipValueList:
                                 index = ipValueList.index(ipAddress)
-                                print(index, ipAddress)
+                                self.ixnObj.logDebug('{0} {1}'.format(index, ipAddress))
                                 # Return index number using based one. Not based zero.
                                 return index + 1
 
@@ -3348,96 +3532,75 @@ class Protocol(object):
         if protocol == 'isis': protocol = 'isisL3RouteProperty'
         if protocol == 'ldp':  protocol = 'ldpFECProperty'
 
-        # 1: Get all the Device Group objects with the user specified router IDs.
+        from IxNetRestApiMultivalue import applyMultivalueChanges
+
+        # 1: Get all the Device Groups with their router IDs and the ipv4PrefixPools with the protocol in one query.
         queryData = {'from': '/',
                     'nodes': [{'node': 'topology',    'properties': [], 'where': []},
                               {'node': 'deviceGroup', 'properties': ['multiplier'], 'where': []},
-                              {'node': 'routerData',  'properties': ['routerId', 'count'], 'where': []}
+                              {'node': 'routerData',  'properties': ['routerId'], 'where': []},
+                              {'node': 'networkGroup',  'properties': [], 'where': []},
+                              {'node': 'ipv4PrefixPools', 'properties': ['networkAddress', 'count'], 'where': []},
+                              {'node': protocol,  'properties': ['active'], 'where': []}
                           ]}
-        deviceGroupObjList = []
-        allRouterIdList = []
         queryResponse = self.ixnObj.query(data=queryData, silentMode=False)
+
+        deviceGroupList = []
+        multivalueList = []
         for topology in queryResponse.json()['result'][0]['topology']:
             for deviceGroup in topology['deviceGroup']:
-                deviceGroupObj = deviceGroup['href']
-                deviceGroupMultiplier = deviceGroup['multiplier']
+                if deviceGroup.get('routerData', []) == []:
+                    continue
+
+                prefixPoolList = [ipv4Prefix for networkGroup in deviceGroup.get('networkGroup', [])
+                                  for ipv4Prefix in networkGroup.get('ipv4PrefixPools', []) if ipv4Prefix.get(protocol, []) != []]
                 routerIdMultivalue = deviceGroup['routerData'][0]['routerId']
-                routerIdList = self.ixnObj.getMultivalueValues(routerIdMultivalue, silentMode=True)
-                deviceGroupObjList.append((deviceGroupObj, deviceGroupMultiplier, routerIdList, routerIdMultivalue))
+                deviceGroupList.append((deviceGroup, routerIdMultivalue, prefixPoolList))
+                multivalueList.append(routerIdMultivalue)
+                multivalueList += [ipv4Prefix['networkAddress'] for ipv4Prefix in prefixPoolList]
 
-                for rId in routerIdList:
-                    if rId not in allRouterIdList:
-                        allRouterIdList.append(rId)
+        multivalueValues = self.ixnObj.getMultivalueValuesBulk(multivalueList)
 
         # 2: For each Device Group, look for the protocol to enable|disable
         #    Enable|disable based on the specified routerId list
-        for deviceGroup in deviceGroupObjList:
-            deviceGroupObj = deviceGroup[0]
-            deviceGroupMultiplier = deviceGroup[1]
-            deviceGroupRouterIdList = deviceGroup[2]
-            routerIdMultivalue = deviceGroup[3]
-
-            self.ixnObj.logInfo('Searching Device Group: %s' % deviceGroupObj)
-            queryData = {'from': deviceGroupObj,
-                        'nodes': [{'node': 'networkGroup',  'properties': [], 'where': []},
-                                  {'node': 'ipv4PrefixPools', 'properties': ['networkAddress', 'count'], 'where': []},
-                                  {'node': protocol,  'properties': ['active'], 'where': []}
-                                ]}
-            queryResponse = self.ixnObj.query(data=queryData, silentMode=False)
+        changeList = []
+        for deviceGroup, routerIdMultivalue, prefixPoolList in deviceGroupList:
+            self.ixnObj.logInfo('Searching Device Group: %s' % deviceGroup['href'])
+            deviceGroupRouterIdList = multivalueValues[routerIdMultivalue]
 
             # Note: A device group could have multiple network groups.
             #       Loop through all configured network groups for the ipv4PrefixPools with the user specified protocol.
-            for networkGroup in queryResponse.json()['result'][0]['networkGroup']:
-                networkGroupObj = networkGroup['href']
-                for ipv4Prefix in networkGroup['ipv4PrefixPools']:
-                    if ipv4Prefix[protocol] != []:
-                        ipv4PrefixPoolMultivalue = ipv4Prefix['networkAddress']
-                        ipv4PrefixPool = self.ixnObj.getMultivalueValues(ipv4PrefixPoolMultivalue, silentMode=True)
-                        protocolMultivalue = ipv4Prefix[protocol][0]['active']
-                        protocolActiveList = self.ixnObj.getMultivalueValues(protocolMultivalue, silentMode=True)
-                        totalCountForEachRouterId = ipv4Prefix['count'] // deviceGroupMultiplier
-                        totalRouteRangeCount = ipv4Prefix['count']
-
-                        # Create a dictionary containing routerID starting/ending indexes.
-                        routerIdIndexes = {}
-                        startingIndex = 0
-                        endingIndex = totalCountForEachRouterId
-                        for routerId in deviceGroupRouterIdList:
-                            routerIdIndexes[routerId, 'startingIndex'] = {}
-                            routerIdIndexes[routerId, 'endingIndex'] = {}
-                            routerIdIndexes[routerId, 'startingIndex'] = startingIndex
-                            routerIdIndexes[routerId, 'endingIndex'] = endingIndex
-                            startingIndex += totalCountForEachRouterId
-                            endingIndex += totalCountForEachRouterId
-
-                        for key,value in routerIdIndexes.items():
-                            print('', key, value)
-
-                        self.ixnObj.logInfo('Current active list: %s' % protocolActiveList)
-                        startingIndex = 0
-                        endingIndex = totalCountForEachRouterId
-                        for eachRouterId in deviceGroupRouterIdList:
-                            print(eachRouterId)
-                            for item in routeRangeAddressList:
-                                currentUserDefinedRouterIdList = item[0]
-                                currentUserDefinedRouteRangeList = item[1]
-
-                                if 'all' not in currentUserDefinedRouterIdList:
-                                    if eachRouterId not in currentUserDefinedRouterIdList:
-                                        continue
-
-                                if 'all' in currentUserDefinedRouteRangeList:
-                                    for index in range(routerIdIndexes[eachRouterId,'startingIndex'], routerIdIndexes[eachRouterId,'endingIndex']):
-                                        protocolActiveList[index] = activate
-
-                                if 'all' not in currentUserDefinedRouteRangeList:
-                                    for index in range(startingIndex, totalRouteRangeCount):
-                                        currentIpv4PrefixPoolsIndex = ipv4PrefixPool[index]
-                                        if ipv4PrefixPool[index] in currentUserDefinedRouteRangeList:
-                                            protocolActiveList[index] = activate
-
-                                self.ixnObj.logInfo('Modifying: %s' % networkGroupObj)
-                                self.ixnObj.configMultivalue(protocolMultivalue, multivalueType='valueList', data={'values': protocolActiveList})
+            for ipv4Prefix in prefixPoolList:
+                ipv4PrefixPool = multivalueValues[ipv4Prefix['networkAddress']]
+                protocolMultivalue = ipv4Prefix[protocol][0]['active']
+                totalCountForEachRouterId = ipv4Prefix['count'] // deviceGroup['multiplier']
+
+                # The route ranges of each router ID are consecutive: [startingIndex, endingIndex)
+                indexSet = set()
+                for routerIdIndex, eachRouterId in enumerate(deviceGroupRouterIdList):
+                    startingIndex = routerIdIndex * totalCountForEachRouterId
+                    endingIndex = startingIndex + totalCountForEachRouterId
+
+                    for item in routeRangeAddressList:
+                        currentUserDefinedRouterIdList = item[0]
+                        currentUserDefinedRouteRangeList = item[1]
+
+                        if 'all' not in currentUserDefinedRouterIdList and eachRouterId not in currentUserDefinedRouterIdList:
+                            continue
+
+                        if 'all' in currentUserDefinedRouteRangeList:
+                            indexSet.update(range(startingIndex, endingIndex))
+                        else:
+                            routeRangeSet = set(currentUserDefinedRouteRangeList)
+                            indexSet.update([index for index in range(startingIndex, endingIndex)
+                                             if ipv4PrefixPool[index] in routeRangeSet])
+
+                if indexSet:
+                    self.ixnObj.logInfo('Modifying: {0}: {1} route ranges'.format(ipv4Prefix['href'], len(indexSet)))
+                    changeList.append((protocolMultivalue, sorted(indexSet), activate))
+
+        # 3: Send the changes of all the route ranges together. Unchanged route ranges are not sent.
+        applyMultivalueChanges(self.ixnObj, changeList)
 
     def modifyProtocolRoutes(self, **kwargs):
         """
@@ -3458,9 +3621,9 @@ class Protocol(object):
                                prefixLength = 24)
         """
         response = self.ixnObj.get(self.ixnObj.sessionUrl+networkGroupPrefixPoolObj)
-        print(response.json())
+        self.ixnObj.logDebug(str(response.json()))
         prefixPoolAddressMultivalue = response.json()['networkAddress']
-        print('modifyProtocolRoutes:', prefixPoolAddressMultivalue)
+        self.ixnObj.logDebug('modifyProtocolRoutes: {0}'.format(prefixPoolAddressMultivalue))
         #self.ixnObj.patch(self.ixnObj.httpHeader+/networkGroupObj, data=data)
 
         if 'networkGroupObj' not in kwargs:
@@ -3584,6 +3747,34 @@ class Protocol(object):
                             ]}
         """
         self.ixnObj.logInfo('{0}...'.format('\ngetProtocolListByPortNgpf'), timestamp=False)
+        if self.topologyIndex is not None:
+            topologyObj = self.topologyIndex.getTopologyByPort(port=port, portName=portName)
+            if topologyObj is None:
+                if port != None:
+                    raise IxNetRestApiException('\nError: No port found: {0}'.format(port))
+                raise IxNetRestApiException('\nError: No portName found: {0}'.format(portName))
+
+            enabledProtocolList = {'topology': topologyObj, 'deviceGroup': []}
+            for deviceGroupObj in self.topologyIndex.getChildren(topologyObj, 'deviceGroup'):
+                deviceGroupObjects = [deviceGroupObj]
+                for ethernetObj in self.topologyIndex.getChildren(deviceGroupObj, 'ethernet'):
+                    deviceGroupObjects.append(ethernetObj)
+                    ipv4List = self.topologyIndex.getChildren(ethernetObj, 'ipv4')
+                    ipv6List = self.topologyIndex.getChildren(ethernetObj, 'ipv6')
+                    deviceGroupObjects += ipv4List[:1] + ipv6List[:1]
+                    for layer3Ip in ipv4List+ipv6List:
+                        protocolNodeList = []
+                        for protocolObj in self.topologyIndex.getChildren(layer3Ip):
+                            protocolNode = self.topologyIndex.getObject(protocolObj)['node']
+                            if protocolNode not in protocolNodeList:
+                                protocolNodeList.append(protocolNode)
+                                deviceGroupObjects.append(protocolObj)
+
+                enabledProtocolList['deviceGroup'].append(deviceGroupObjects)
+
+            self.ixnObj.logInfo('\ngetProtocolListByPortNgpf: {0}'.format(str(enabledProtocolList)), timestamp=False)
+            return enabledProtocolList
+
         if port:
             chassisIp = str(port[0])
             cardNum = str(port[1])
@@ -3827,7 +4018,7 @@ class Protocol(object):
         for topology in topologyList:
             response = self.ixnObj.get(topology, silentMode=False)
             topologyObj = response.json()['links'][0]['href']
-            print('topoObj:', topologyObj)
+            self.ixnObj.logDebug('topoObj: {0}'.format(topologyObj))
             response = self.ixnObj.get(topology+'/deviceGroup', silentMode=False)
             deviceGroupList = ['%s/%s/%s' % (topology, 'deviceGroup', str(i["id"])) for i in response.json()]
 
@@ -3870,7 +4061,7 @@ class Protocol(object):
                         # Dynamically get all Ethernet child endpoints
                         response = self.ixnObj.get(ethernet+'?links=true', silentMode=False)
                         for ethernetChild in response.json()['links']:
-                            print('Ethernet child:', ethernetChild['href'])
+                            self.ixnObj.logDebug('Ethernet child: {0}'.format(ethernetChild['href']))
                             currentChildName = ethernetChild['href'].split('/')[-1]
                             if currentChildName == endpointObj:
                                 response = self.ixnObj.get(self.ixnObj.httpHeader+ethernetChild['href'])
@@ -3890,7 +4081,7 @@ class Protocol(object):
 
                                 for child in response.json():
                                     for l3Child in child['links']:
-                                        print('L3Child:', l3Child['href'])
+                                        self.ixnObj.logDebug('L3Child: {0}'.format(l3Child['href']))
                                         currentL3ChildName = l3Child['href'].split('/')[-1]
                                         if currentL3ChildName == endpointObj:
                                             response = self.ixnObj.get(self.ixnObj.httpHeader+l3Child['href'], silentMode=True)
@@ -4093,7 +4284,7 @@ class Protocol(object):
                     ipv6List = ['%s/%s/%s' % (ethernet, 'ipv6', str(i["id"])) for i in response.json()]
                     for layer3Ip in ipv4List+ipv6List:
                         url = layer3Ip+'/'+ngpfEndpointName
-                        print('\nProtocol URL:', url)
+                        self.ixnObj.logDebug('\nProtocol URL: {0}'.format(url))
                         response = self.ixnObj.get(url)
                         if response.json() == []:
                             continue
@@ -4172,81 +4363,35 @@ class Protocol(object):
         Syntax
            POST = /api/v1/sessions/<int>/ixnetwork/topology/<int>/deviceGroup/<int>/ethernet/<int>/ipv4/<int>/bgpIpv4Peer/<int>
         """
-        if flapList != 'all' and type(flapList) != list:
-            ipRouteListToFlap = flapList.split(' ')
-
-        response = self.ixnObj.get(self.ixnObj.httpHeader+bgpObjHandle)
-
-        # Get the IP object from the bgpObjHandle
-        match = re.match('(/api.*)/bgp', bgpObjHandle)
-        ipObj = match.group(1)
+        from IxNetRestApiMultivalue import applyMultivalueChanges, getValueIndexMap
 
-        ipAddressList = self.getIpAddresses(ipObj)
-        count = len(ipAddressList)
-
-        # Recreate an index list based on user defined ip address to enable/disable
-        indexToFlapList = []
-        if flapList != 'all':
-            for ipAddress in flapList:
-                # A custom list of indexes to enable/disable flapping based on the IP address index number.
-                indexToFlapList.append(ipAddressList.index(ipAddress))
+        if flapList != 'all' and type(flapList) != list:
+            flapList = flapList.split(' ')
 
-        # Copy the same index list for uptime and downtime
-        indexUptimeList = indexToFlapList
-        indexDowntimeList = indexToFlapList
         response = self.ixnObj.get(self.ixnObj.httpHeader+bgpObjHandle)
         enableFlappingMultivalue = response.json()['flap']
         upTimeMultivalue = response.json()['uptimeInSec']
         downTimeMultivalue = response.json()['downtimeInSec']
 
-        flappingResponse = self.ixnObj.getMultivalueValues(enableFlappingMultivalue)
-        uptimeResponse = self.ixnObj.getMultivalueValues(upTimeMultivalue)
-        downtimeResponse = self.ixnObj.getMultivalueValues(downTimeMultivalue)
-
-        # Flapping IP addresses
-        flapOverlayList = []
-        uptimeOverlayList = []
-        downtimeOverlayList = []
-        # Build a valueList of either "true" or "false"
-        if flapList == 'all':
-            for counter in range(0,count):
-                if enable == True:
-                    flapOverlayList.append("true")
-                if enable == False:
-                    flapOverlayList.append("false")
-                uptimeOverlayList.append(str(uptime))
-                downtimeOverlayList.append(str(downtime))
-
+        # Recreate an index list based on user defined ip address to enable/disable
+        indexToFlapList = 'all'
         if flapList != 'all':
-            # ['true', 'true', 'true']
-            currentFlappingValueList = flappingResponse
-            # ['10', '10', '10']
-            currentUptimeValueList   = uptimeResponse
-            # ['20', '20', '20']
-            currentDowntimeValueList = downtimeResponse
-
-            indexCounter = 0
-            for (eachFlapValue, eachUptimeValue, eachDowntimeValue) in zip(currentFlappingValueList, currentUptimeValueList,
-                                                                           currentDowntimeValueList):
-                # Leave the setting alone on this index position. User did not care to change this value.
-                if indexCounter not in indexToFlapList:
-                    flapOverlayList.append(eachFlapValue)
-                    uptimeOverlayList.append(eachUptimeValue)
-                    downtimeOverlayList.append(eachDowntimeValue)
-                else:
-                    # Change the value on this index position.
-                    if enable == True:
-                        flapOverlayList.append("true")
-                    else:
-                        flapOverlayList.append("false")
+            # Get the IP object from the bgpObjHandle
+            match = re.match('(/api.*)/bgp', bgpObjHandle)
+            ipObj = match.group(1)
+            ipIndexMap = getValueIndexMap(self.getIpAddresses(ipObj))
+
+            notFoundList = [ipAddress for ipAddress in flapList if ipAddress not in ipIndexMap]
+            if notFoundList:
+                raise IxNetRestApiException('flapBgpPeerNgpf: IP addresses not found: {0}'.format(notFoundList))
 
-                    uptimeOverlayList.append(str(uptime))
-                    downtimeOverlayList.append(str(downtime))
-                indexCounter += 1
+            # A custom list of indexes to enable/disable flapping based on the IP address index number.
+            indexToFlapList = [ipIndexMap[ipAddress] for ipAddress in flapList]
 
-        self.ixnObj.patch(self.ixnObj.httpHeader + enableFlappingMultivalue+'/valueList', data={'values': flapOverlayList})
-        self.ixnObj.patch(self.ixnObj.httpHeader + upTimeMultivalue+'/valueList', data={'values': uptimeOverlayList})
-        self.ixnObj.patch(self.ixnObj.httpHeader + downTimeMultivalue+'/valueList', data={'values': downtimeOverlayList})
+        # Only the selected indexes are changed. As overlays if there are a few of them.
+        applyMultivalueChanges(self.ixnObj, [(enableFlappingMultivalue, indexToFlapList, enable),
+                                             (upTimeMultivalue, indexToFlapList, uptime),
+                                             (downTimeMultivalue, indexToFlapList, downtime)])
 
     def flapBgpRoutesNgpf(self, prefixPoolObj, enable=True, ipRouteListToFlap='all', uptime=0, downtime=0, ip='ipv4'):
         """
@@ -4275,25 +4420,11 @@ class Protocol(object):
                   For IPv6: http://{apiServerIp:port}/api/v1/sessions/<int>/ixnetwork/topology/<int>/deviceGroup/<int>/networkGroup/<int>/ipv4PrefixPools/<int>/bgpV6IPRouteProperty
         """
 
+        from IxNetRestApiMultivalue import applyMultivalueChanges, getValueIndexMap
+
         if ipRouteListToFlap != 'all' and type(ipRouteListToFlap) != list:
             ipRouteListToFlap = ipRouteListToFlap.split(' ')
 
-        # Get a list of configured IP route addresses
-        response = self.ixnObj.get(self.ixnObj.httpHeader+prefixPoolObj)
-        networkAddressList = response.json()['lastNetworkAddress']
-        count = len(networkAddressList)
-
-        # Recreate an index list based on user defined ip route to enable/disable
-        indexToFlapList = []
-        if ipRouteListToFlap != 'all':
-            for ipRouteAddress in ipRouteListToFlap:
-                # A custom list of indexes to enable/disable flapping based on the IP address index number.
-                indexToFlapList.append(networkAddressList.index(ipRouteAddress))
-
-        # Copy the same index list for uptime and downtime
-        indexUptimeList = indexToFlapList
-        indexDowntimeList = indexToFlapList
-
         if ip == 'ipv4':
             response = self.ixnObj.get(self.ixnObj.httpHeader+prefixPoolObj+'/bgpIPRouteProperty')
         if ip == 'ipv6':
@@ -4302,51 +4433,25 @@ class Protocol(object):
         enableFlappingMultivalue = response.json()[0]['enableFlapping']
         upTimeMultivalue = response.json()[0]['uptime']
         downTimeMultivalue = response.json()[0]['downtime']
-        flappingResponse = self.ixnObj.getMultivalueValues(enableFlappingMultivalue)
-        uptimeResponse = self.ixnObj.getMultivalueValues(upTimeMultivalue)
-        downtimeResponse = self.ixnObj.getMultivalueValues(downTimeMultivalue)
-
-        # Flapping IP addresses
-        flapOverlayList = []
-        uptimeOverlayList = []
-        downtimeOverlayList = []
-        # Build a valueList of either "true" or "false"
-        if ipRouteListToFlap == 'all':
-            for counter in range(0,count):
-                if enable == True:
-                    flapOverlayList.append("true")
-                if enable == False:
-                    flapOverlayList.append("false")
-                uptimeOverlayList.append(str(uptime))
-                downtimeOverlayList.append(str(downtime))
 
+        # Recreate an index list based on user defined ip route to enable/disable
+        indexToFlapList = 'all'
         if ipRouteListToFlap != 'all':
-            currentFlappingValueList = flappingResponse[0]
-            currentUptimeValueList   = uptimeResponse[0]
-            currentDowntimeValueList = downtimeResponse[0]
-
-            indexCounter = 0
-            for (eachFlapValue, eachUptimeValue, eachDowntimeValue) in zip(currentFlappingValueList,
-                                                                           currentUptimeValueList, currentDowntimeValueList):
-                # Leave the setting alone on this index position. User did not care to change this value.
-                if indexCounter not in indexToFlapList:
-                    flapOverlayList.append(eachFlapValue)
-                    uptimeOverlayList.append(eachUptimeValue)
-                    downtimeOverlayList.append(eachDowntimeValue)
-                else:
-                    # Change the value on this index position.
-                    if enable == True:
-                        flapOverlayList.append("true")
-                    else:
-                        flapOverlayList.append("false")
-                    uptimeOverlayList.append(str(uptime))
-                    downtimeOverlayList.append(str(downtime))
-                indexCounter += 1
+            # Get a list of configured IP route addresses
+            response = self.ixnObj.get(self.ixnObj.httpHeader+prefixPoolObj)
+            networkAddressIndexMap = getValueIndexMap(response.json()['lastNetworkAddress'])
 
-        # /topology/[1]/deviceGroup
-        self.ixnObj.patch(self.ixnObj.httpHeader + enableFlappingMultivalue+'/valueList', data={'values': flapOverlayList})
-        self.ixnObj.patch(self.ixnObj.httpHeader + upTimeMultivalue+'/valueList', data={'values': uptimeOverlayList})
-        self.ixnObj.patch(self.ixnObj.httpHeader + downTimeMultivalue+'/valueList', data={'values': downtimeOverlayList})
+            notFoundList = [ipRouteAddress for ipRouteAddress in ipRouteListToFlap if ipRouteAddress not in networkAddressIndexMap]
+            if notFoundList:
+                raise IxNetRestApiException('flapBgpRoutesNgpf: IP routes not found: {0}'.format(notFoundList))
+
+            # A custom list of indexes to enable/disable flapping based on the IP address index number.
+            indexToFlapList = [networkAddressIndexMap[ipRouteAddress] for ipRouteAddress in ipRouteListToFlap]
+
+        # Only the selected indexes are changed. As overlays if there are a few of them.
+        applyMultivalueChanges(self.ixnObj, [(enableFlappingMultivalue, indexToFlapList, enable),
+                                             (upTimeMultivalue, indexToFlapList, uptime),
+                                             (downTimeMultivalue, indexToFlapList, downtime)])
 
     def enableProtocolRouteRange(self, routerId, protocol, enable=False):
         """
@@ -4361,8 +4466,8 @@ class Protocol(object):
         response = self.ixnObj.get(self.ixnObj.httpHeader+deviceGroupObj+'/routerData')
         routerIdMultivalue = response.json()[0]['routerId']
         routerIdList = self.ixnObj.getMultivalueValues(routerIdMultivalue)
-        print(routerIdList)
-        print(deviceGroupObj)
+        self.ixnObj.logDebug(str(routerIdList))
+        self.ixnObj.logDebug(str(deviceGroupObj))
 
 
     def startStopIpv4Ngpf(self, ipv4ObjList, action='start'):
@@ -4379,11 +4484,8 @@ class Protocol(object):
         if type(ipv4ObjList) != list:
             raise IxNetRestApiException('startStopIpv4Ngpf error: The parameter ipv4ObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ethernet/ipv4/operations/'+action
-        data = {'arg1': ipv4ObjList}
         self.ixnObj.logInfo('startStopIpv4Ngpf: {0}'.format(action))
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(ipv4ObjList, action=action)
 
     def startStopBgpNgpf(self, bgpObjList, action='start'):
         """
@@ -4399,11 +4501,8 @@ class Protocol(object):
         if type(bgpObjList) != list:
             raise IxNetRestApiException('startStopBgpNgpf error: The parameter bgpObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ethernet/ipv4/bgpIpv4Peer/operations/'+action
-        data = {'arg1': bgpObjList}
         self.ixnObj.logInfo('startStopBgpNgpf: {0}'.format(action))
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(bgpObjList, action=action)
 
     def startStopOspfNgpf(self, ospfObjList, action='start'):
         """
@@ -4419,11 +4518,8 @@ class Protocol(object):
         if type(ospfObjList) != list:
             raise IxNetRestApiException('startStopOspfNgpf error: The parameter ospfObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ethernet/ipv4/ospfv2/operations/'+action
-        data = {'arg1': ospfObjList}
         self.ixnObj.logInfo('startStopOspfNgpf: {0}'.format(action))
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(ospfObjList, action=action)
 
     def startStopIgmpHostNgpf(self, igmpHostObjList, action='start'):
         """
@@ -4439,11 +4535,8 @@ class Protocol(object):
         if type(igmpHostObjList) != list:
             raise IxNetRestApiException('igmpHostObjNgpf error: The parameter igmpHostObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ethernet/ipv4/igmpHost/operations/'+action
-        data = {'arg1': igmpHostObjList}
         self.ixnObj.logInfo('startStopIgmpHostNgpf: {0}'.format(action))
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(igmpHostObjList, action=action)
 
     def startStopPimV4InterfaceNgpf(self, pimV4ObjList, action='start'):
         """
@@ -4459,12 +4552,8 @@ class Protocol(object):
         if type(pimV4ObjList) != list:
             raise IxNetRestApiException('startStopPimV4InterfaceNgpf error: The parameter pimv4ObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ethernet/ipv4/pimV4Interface/operations/'+action
-        data = {'arg1': pimV4ObjList}
         self.ixnObj.logInfo('startStopPimV4InterfaceNgpf: {0}'.format(action))
-        self.ixnObj.logInfo('\t%s' % pimV4ObjList)
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(pimV4ObjList, action=action)
 
     def startStopMldHostNgpf(self, mldHostObjList, action='start'):
         """
@@ -4480,12 +4569,8 @@ class Protocol(object):
         if type(mldHostObjList) != list:
             raise IxNetRestApiException('startStopMldHostNgpf error: The parameter mldHostObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ethernet/ipv6/mldHost/operations/'+action
-        data = {'arg1': mldHostObjList}
         self.ixnObj.logInfo('startStopMldHostNgpf: {0}'.format(action))
-        self.ixnObj.logInfo('\t%s' % mldHostObjList)
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(mldHostObjList, action=action)
 
     def startStopIsisL3Ngpf(self, isisObjList, action='start'):
         """
@@ -4501,12 +4586,8 @@ class Protocol(object):
         if type(isisObjList) != list:
             raise IxNetRestApiException('startStopIsisL3Ngpf error: The parameter isisObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ethernet/isisL3/operations/'+action
-        data = {'arg1': isisObjList}
         self.ixnObj.logInfo('startStopIsisL3Ngpf: {0}'.format(action))
-        self.ixnObj.logInfo('\t%s' % isisObjList)
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(isisObjList, action=action)
 
     def startStopLdpBasicRouterNgpf(self, ldpObjList, action='start'):
         """
@@ -4522,12 +4603,8 @@ class Protocol(object):
         if type(ldpObjList) != list:
             raise IxNetRestApiException('startStopLdpBasicRouterNgpf error: The parameter ldpObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ldpBasicRouter/operations/'+action
-        data = {'arg1': ldpObjList}
         self.ixnObj.logInfo('startStopLdpBasicRouterNgpf: {0}'.format(action))
-        self.ixnObj.logInfo('\t%s' % ldpObjList)
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(ldpObjList, action=action)
 
     def enableDisableIgmpGroupRangeNgpf(self, protocolSessionUrl, groupRangeList, action='disable'):
         """
@@ -4551,6 +4628,8 @@ class Protocol(object):
             action: disable or enable
 
         """
+        from IxNetRestApiMultivalue import MultivalueEditor, getValueIndexMap
+
         if action == 'disable':
             enableDisable = 'false'
         else:
@@ -4566,28 +4645,29 @@ class Protocol(object):
         activeMultivalue = response.json()['active']
 
         # Getting the list of Group Range IP addresses.
-        response = self.ixnObj.get(self.ixnObj.httpHeader+groupRangeAddressMultivalue)
-
         # groupRangeValues are multicast group ranges:
         # [u'225.0.0.1', u'225.0.0.2', u'225.0.0.3', u'225.0.0.4', u'225.0.0.5']
-        groupRangeValues = response.json()['values']
-        print('\nConfigured groupRangeValues:', groupRangeValues)
+        groupRangeValues = self.ixnObj.getMultivalueValues(groupRangeAddressMultivalue, silentMode=True)
+        self.ixnObj.logInfo('\nConfigured groupRangeValues: {0}'.format(groupRangeValues), timestamp=False)
+
+        groupRangeIndexMap = getValueIndexMap(groupRangeValues)
+        notFoundList = [groupRangeIp for groupRangeIp in groupRangeList if groupRangeIp not in groupRangeIndexMap]
+        if notFoundList:
+            raise IxNetRestApiException('enableDisableIgmpGroupRangeNgpf: Multicast group range ip addresses not found: {0}'.format(notFoundList))
 
-        listOfIndexesToDisable = []
         # Loop through user list of specified group ranges to disable.
-        for groupRangeIp in groupRangeList:
-            index = groupRangeValues.index(groupRangeIp)
-            listOfIndexesToDisable.append(index)
+        listOfIndexesToDisable = [groupRangeIndexMap[groupRangeIp] for groupRangeIp in groupRangeList]
 
         if listOfIndexesToDisable == []:
             raise IxNetRestApiException('disableIgmpGroupRangeNgpf Error: No multicast group range ip address found on your list')
 
         for index in listOfIndexesToDisable:
-            currentOverlayUrl = self.ixnObj.httpHeader+activeMultivalue+'/overlay'
-            # http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/multivalue/5/overlay
-            # NOTE:  Index IS NOT zero based.
             self.ixnObj.logInfo('enableDisableIgmpGroupRangeNgpf: %s: %s' % (action, groupRangeValues[index]))
-            response = self.ixnObj.post(currentOverlayUrl, data={'index': index+1, 'value': enableDisable})
+
+        # The indexes are sent as overlays on the active multivalue. As a valueList if there are many of them.
+        editorObj = MultivalueEditor(self.ixnObj, activeMultivalue)
+        editorObj.setIndexes(listOfIndexesToDisable, enableDisable)
+        editorObj.apply()
 
     def enableDisableMldGroupNgpf(self, protocolSessionUrl, groupRangeList, action='disable'):
         """
@@ -4611,6 +4691,8 @@ class Protocol(object):
                                 Example: ['ff03::1', 'ff03::2']
             action: disable or enable
         """
+        from IxNetRestApiMultivalue import MultivalueEditor, getValueIndexMap
+
         if action == 'disable':
             enableDisable = 'false'
         else:
@@ -4626,28 +4708,29 @@ class Protocol(object):
         activeMultivalue = response.json()['active']
 
         # Getting the list of Group Range IP addresses.
-        response = self.ixnObj.get(self.ixnObj.httpHeader+groupRangeAddressMultivalue)
-
         # groupRangeValues are multicast group ranges:
         # ['ff03::1', 'ff03::2']
-        groupRangeValues = response.json()['values']
+        groupRangeValues = self.ixnObj.getMultivalueValues(groupRangeAddressMultivalue, silentMode=True)
         self.ixnObj.logInfo('Configured groupRangeValues: %s' % groupRangeValues)
 
-        listOfIndexesToDisable = []
+        groupRangeIndexMap = getValueIndexMap(groupRangeValues)
+        notFoundList = [groupRangeIp for groupRangeIp in groupRangeList if groupRangeIp not in groupRangeIndexMap]
+        if notFoundList:
+            raise IxNetRestApiException('enableDisableMldGroupNgpf: Multicast group range ip addresses not found: {0}'.format(notFoundList))
+
         # Loop through user list of specified group ranges to disable.
-        for groupRangeIp in groupRangeList:
-            index = groupRangeValues.index(groupRangeIp)
-            listOfIndexesToDisable.append(index)
+        listOfIndexesToDisable = [groupRangeIndexMap[groupRangeIp] for groupRangeIp in groupRangeList]
 
         if listOfIndexesToDisable == []:
             raise IxNetRestApiException('disableMldGroupNgpf Error: No multicast group range ip address found on your list')
 
         for index in listOfIndexesToDisable:
-            currentOverlayUrl = self.ixnObj.httpHeader+activeMultivalue+'/overlay'
-            # http://192.168.70.127:11009/api/v1/sessions/1/ixnetwork/multivalue/5/overlay
-            # NOTE:  Index IS NOT zero based.
             self.ixnObj.logInfo('enableDisableMldGroupNgpf: %s: %s' % (action, groupRangeValues[index]))
-            response = self.ixnObj.post(currentOverlayUrl, data={'index': index+1, 'value': enableDisable})
+
+        # The indexes are sent as overlays on the active multivalue. As a valueList if there are many of them.
+        editorObj = MultivalueEditor(self.ixnObj, activeMultivalue)
+        editorObj.setIndexes(listOfIndexesToDisable, enableDisable)
+        editorObj.apply()
 
     def sendIgmpJoinLeaveNgpf(self, routerId=None, igmpHostUrl=None, multicastIpAddress=None, action='join'):
         """
@@ -4969,24 +5052,20 @@ class Protocol(object):
                         ipv4SessionStatus = self.getSessionStatus(ipv4Obj)
                         
                         self.ixnObj.logInfo('\tIPv4:{0} Status: {1}'.format(ipv4['id'], ipv4['status']), timestamp=False)
-                        macResponse = self.ixnObj.get(self.ixnObj.httpHeader+ethernet['mac'], silentMode=True)
-                        macAddress = self.getMultivalueValues(macResponse.json()['links'][0]['href'], silentMode=True)
-
-                        vlanResponse = self.ixnObj.get(self.ixnObj.httpHeader+vlan['vlanId'], silentMode=True)
-                        vlanId = self.getMultivalueValues(vlanResponse.json()['links'][0]['href'], silentMode=True)
-
-                        priorityResponse = self.ixnObj.get(self.ixnObj.httpHeader+vlan['priority'], silentMode=True)
-                        vlanPriority = self.getMultivalueValues(priorityResponse.json()['links'][0]['href'],
-                                                                       silentMode=True)
-
-                        ipResponse = self.ixnObj.get(self.ixnObj.httpHeader+ipv4['address'], silentMode=True)
-                        ipAddress = self.getMultivalueValues(ipResponse.json()['links'][0]['href'], silentMode=True)
 
-                        gatewayResponse = self.ixnObj.get(self.ixnObj.httpHeader+ipv4['gatewayIp'], silentMode=True)
-                        gateway = self.getMultivalueValues(gatewayResponse.json()['links'][0]['href'], silentMode=True)
+                        # Resolve all the multivalues of this stack in one bulk call
+                        multivalueList = [ethernet['mac'], vlan['vlanId'], vlan['priority'],
+                                          ipv4['address'], ipv4['gatewayIp'], ipv4['prefix']]
+                        if None not in ethernet['ipv6']:
+                            multivalueList += [ipv6['address'], ipv6['gatewayIp'], ipv6['prefix']]
+                        multivalueValues = self.ixnObj.getMultivalueValuesBulk(multivalueList)
 
-                        prefixResponse = self.ixnObj.get(self.ixnObj.httpHeader+ipv4['prefix'], silentMode=True)
-                        prefix = self.getMultivalueValues(prefixResponse.json()['links'][0]['href'], silentMode=True)
+                        macAddress = multivalueValues[ethernet['mac']]
+                        vlanId = multivalueValues[vlan['vlanId']]
+                        vlanPriority = multivalueValues[vlan['priority']]
+                        ipAddress = multivalueValues[ipv4['address']]
+                        gateway = multivalueValues[ipv4['gatewayIp']]
+                        prefix = multivalueValues[ipv4['prefix']]
 
                         index = 1
                         self.ixnObj.logInfo('\t    {0:8} {1:14} {2:7} {3:9} {4:12} {5:16} {6:12} {7:7} {8:7}'.format('Index', 'MacAddress', 'VlanId', 'VlanPri', 'EthSession',
@@ -5006,19 +5085,17 @@ class Protocol(object):
 
                         # IPv6
                         if None not in ethernet['ipv6']:
-                            ipResponse = self.ixnObj.get(self.ixnObj.httpHeader+ipv6['address'], silentMode=True)
-                            gatewayResponse = self.ixnObj.get(self.ixnObj.httpHeader+ipv6['gatewayIp'], silentMode=True)
-                            prefixResponse = self.ixnObj.get(self.ixnObj.httpHeader+ipv6['prefix'], silentMode=True)
                             self.ixnObj.logInfo('\tIPv6:{0} Status: {1}'.format(ipv6['id'], ipv6['status']), timestamp=False)
                             self.ixnObj.logInfo('\t    {0:8} {1:14} {2:7} {3:9} {4:12} {5:19} {6:18} {7:7} {8:7}'.format('Index', 'MacAddress', 'VlanId', 'VlanPri', 'EthSession',
                                                                                                             'IPv6Address', 'Gateway', 'Prefix', 'Ipv6Session'), timestamp=False)
                             self.ixnObj.logInfo('\t   %s' % '-'*113)
-                            for mac,vlanId,vlanPriority,ethSession,ip,gateway,prefix,ipv4Session in zip(macResponse.json()['values'],
-                                                                            vlanResponse.json()['values'],
-                                                                            priorityResponse.json()['values'],
+                            for mac,vlanId,vlanPriority,ethSession,ip,gateway,prefix,ipv4Session in zip(multivalueValues[ethernet['mac']],
+                                                                            multivalueValues[vlan['vlanId']],
+                                                                            multivalueValues[vlan['priority']],
                                                                             ethernet['sessionStatus'],
-                                                                            ipResponse.json()['values'], gatewayResponse.json()['values'],
-                                                                            prefixResponse.json()['values'], ipv6['sessionStatus']):
+                                                                            multivalueValues[ipv6['address']],
+                                                                            multivalueValues[ipv6['gatewayIp']],
+                                                                            multivalueValues[ipv6['prefix']], ipv6['sessionStatus']):
                                 self.ixnObj.logInfo('\t    {0:^5} {1:18} {2:^6} {3:^9} {4:13} {5:<15} {6:<13} {7:8} {8:7}'.format(index, mac, vlanId, vlanPriority,
                                                                                                         ethSession, ip, gateway, prefix, ipv4Session), timestamp=False)
                                 index += 1
@@ -5031,28 +5108,15 @@ class Protocol(object):
 
                                 self.ixnObj.logInfo('\tBGPIpv4Peer:{0}  Name:{1}'.format(bgpIpv4Peer['id'], bgpIpv4Peer['name'],
                                                                                          bgpIpv4Peer['status']), timestamp=False)
-                                dutIpResponse = self.ixnObj.get(self.ixnObj.httpHeader+bgpIpv4Peer['dutIp'], silentMode=True)
-                                dutIp = self.getMultivalueValues(dutIpResponse.json()['links'][0]['href'], silentMode=True)
-
-                                typeResponse = self.ixnObj.get(self.ixnObj.httpHeader+bgpIpv4Peer['type'], silentMode=True)
-                                typeMultivalue = typeResponse.json()['links'][0]['href']
-                                bgpType = self.getMultivalueValues(typeMultivalue, silentMode=True)
-
-                                localAs2BytesResponse = self.ixnObj.get(self.ixnObj.httpHeader+bgpIpv4Peer['localAs2Bytes'],
-                                                                        silentMode=True)
-                                localAs2BytesMultivalue = localAs2BytesResponse.json()['links'][0]['href']
-                                localAs2Bytes = self.getMultivalueValues(localAs2BytesMultivalue, silentMode=True)
-
-                                flapResponse = self.ixnObj.get(self.ixnObj.httpHeader+bgpIpv4Peer['flap'], silentMode=True)
-                                flap = self.getMultivalueValues(flapResponse.json()['links'][0]['href'], silentMode=True)
-
-                                uptimeResponse = self.ixnObj.get(self.ixnObj.httpHeader+bgpIpv4Peer['uptimeInSec'],
-                                                                 silentMode=True)
-                                uptime = self.getMultivalueValues(uptimeResponse.json()['links'][0]['href'], silentMode=True)
-                                downtimeResponse = self.ixnObj.get(self.ixnObj.httpHeader+bgpIpv4Peer['downtimeInSec'],
-                                                                   silentMode=True)
-                                downtime = self.getMultivalueValues(downtimeResponse.json()['links'][0]['href'],
-                                                                           silentMode=True)
+                                bgpValues = self.ixnObj.getMultivalueValuesBulk([bgpIpv4Peer['dutIp'], bgpIpv4Peer['type'],
+                                                                                 bgpIpv4Peer['localAs2Bytes'], bgpIpv4Peer['flap'],
+                                                                                 bgpIpv4Peer['uptimeInSec'], bgpIpv4Peer['downtimeInSec']])
+                                dutIp = bgpValues[bgpIpv4Peer['dutIp']]
+                                bgpType = bgpValues[bgpIpv4Peer['type']]
+                                localAs2Bytes = bgpValues[bgpIpv4Peer['localAs2Bytes']]
+                                flap = bgpValues[bgpIpv4Peer['flap']]
+                                uptime = bgpValues[bgpIpv4Peer['uptimeInSec']]
+                                downtime = bgpValues[bgpIpv4Peer['downtimeInSec']]
                                 self.ixnObj.logInfo('\t    Type: {0}  localAs2Bytes: {1}'.format(bgpType[0],
                                                                                                  localAs2Bytes[0]), timestamp=False)
                                 self.ixnObj.logInfo('\t    Status: {0}'.format(bgpIpv4Peer['status']), timestamp=False)
@@ -5350,6 +5414,11 @@ class Protocol(object):
         if ngpfEndpointObject not in ngpfL2ObjectList+ngpfL3ObjectList+ngpfMainObjectList:
             raise IxNetRestApiException('\nError: No such ngpfEndpointObject: %s' % ngpfEndpointObject)
 
+        if self.topologyIndex is not None:
+            objectHandle = self.topologyIndex.getObjectByName(ngpfEndpointObject, ngpfEndpointName)
+            self.ixnObj.logInfo('getNgpfObjectHandleByName: %s' % objectHandle)
+            return objectHandle
+
         if ngpfEndpointObject in ngpfL2ObjectList + ngpfL3ObjectList:
             if ngpfEndpointObject in ngpfL2ObjectList:
                 nodesList = [{'node': 'topology', 'properties': [], 'where': []},
@@ -5440,6 +5509,11 @@ class Protocol(object):
         if ngpfEndpointObject not in ngpfL2ObjectList + ngpfL3ObjectList + ngpfMainObjectList:
             raise IxNetRestApiException('\nError: No such ngpfEndpointObject: %s' % ngpfEndpointObject)
 
+        if self.topologyIndex is not None:
+            objectHandle = self.topologyIndex.getObjectByRouterId(ngpfEndpointObject, routerId)
+            self.ixnObj.logInfo('getNgpfObject: %s' % objectHandle)
+            return objectHandle
+
         if ngpfEndpointObject in ngpfL2ObjectList + ngpfL3ObjectList:
             if ngpfEndpointObject in ngpfL2ObjectList:
                 nodesList = [{'node': 'topology', 'properties': [], 'where': []},
@@ -5477,6 +5551,21 @@ class Protocol(object):
         queryData = {'from': '/', 'nodes': nodesList}
         queryResponse = self.ixnObj.query(data=queryData)
 
+        def __getRouterIdMultivalues(keys, routerIdMultivalueList):
+            """
+            This is an internal function usage for getNgpfObjectHandleByRouterId() only.
+            Collect all the routerId multivalues so they could be resolved in one bulk call.
+            """
+            for key,value in keys.items():
+                if key == 'routerId':
+                    routerIdMultivalueList.append(value)
+                if type(value) is list:
+                    for keyValue in value:
+                        __getRouterIdMultivalues(keyValue, routerIdMultivalueList)
+            return routerIdMultivalueList
+
+        routerIdValues = self.ixnObj.getMultivalueValuesBulk(__getRouterIdMultivalues(queryResponse.json()['result'][0], []))
+
         # This is for getObject out of scope variable tracking
         class getObjectVar:
             protocolObjHandle= None
@@ -5497,7 +5586,7 @@ class Protocol(object):
 
                             if key == 'routerId':
                                 routerIdMultivalue = value
-                                routerIdList = self.getMultivalueValues(routerIdMultivalue)
+                                routerIdList = routerIdValues[routerIdMultivalue]
                                 if routerId in routerIdList:
                                     getObjectVar.foundRouterId = True
                                     return
@@ -5542,6 +5631,14 @@ class Protocol(object):
             - deviceGroup object handle: /api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1
             - Exception error if routerId is not found in any Device Group
         """
+        if runQuery and self.topologyIndex is not None:
+            deviceGroupObj = self.topologyIndex.getDeviceGroupByRouterId(routerId)
+            if deviceGroupObj is None:
+                raise IxNetRestApiException('\nError: No routerId found in any Device Group: {0}'.format(routerId))
+
+            self.ixnObj.logInfo('deviceGroupHandle for routerId: {0}\n\t{1}'.format(routerId, deviceGroupObj), timestamp=False)
+            return deviceGroupObj
+
         if runQuery:
             queryData = {'from': '/',
                         'nodes': [{'node': 'topology',    'properties': ['name'], 'where': []},
@@ -5807,10 +5904,7 @@ class Protocol(object):
         if type(ldpV6ObjList) != list:
             raise IxNetRestApiException('startStopLdpBasicRouterV6Ngpf error: The parameter ldpV6ObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl+'/topology/deviceGroup/ldpBasicRouterV6/operations/'+action
-        data = {'arg1': ldpV6ObjList }
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url+'/'+response.json()['id'])
+        self.startStopProtocolObjects(ldpV6ObjList, action=action)
 
     def startStopLdpConnectedInterfaceNgpf(self, ldpConnectedIntObjList, action='start'):
         """
@@ -5826,10 +5920,7 @@ class Protocol(object):
         if type(ldpConnectedIntObjList) != list:
             raise IxNetRestApiException('startStopLdpConnectedInterfaceNgpf error: The parameter ldpObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl + '/topology/deviceGroup/ethernet/ipv4/ldpConnectedInterface/operations/'+action
-        data = {'arg1': ldpConnectedIntObjList}
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url + '/' + response.json()['id'])
+        self.startStopProtocolObjects(ldpConnectedIntObjList, action=action)
 
     def startStopLdpV6ConnectedInterfaceNgpf(self, ldpV6ConnectedIntObjList, action='start'):
         """
@@ -5844,10 +5935,7 @@ class Protocol(object):
         if type(ldpV6ConnectedIntObjList) != list:
             raise IxNetRestApiException('startStopLdpV6ConnectedInterfaceNgpf error: The parameter ldpV6ConnectedIntObjList must be a list of objects.')
 
-        url = self.ixnObj.sessionUrl + '/topology/deviceGroup/ethernet/ipv6/ldpv6ConnectedInterface/operations/'+action
-        data = {'arg1': ldpV6ConnectedIntObjList}
-        response = self.ixnObj.post(url, data=data)
-        self.ixnObj.waitForComplete(response, url + '/' + response.json()['id'])
+        self.startStopProtocolObjects(ldpV6ConnectedIntObjList, action=action)
 
     def verifyDhcpClientBind(self, deviceGroupName=None, protocol=None, **kwargs):
         """
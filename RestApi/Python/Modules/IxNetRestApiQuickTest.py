@@ -92,19 +92,18 @@ class QuickTest(object):
         ixNetworkVersion = self.ixnObj.getIxNetworkVersion()
         match = re.match('([0-9]+)\.[^ ]+ *', ixNetworkVersion)
         if int(match.group(1)) >= 8:
-            timer = 10
-            for counter in range(1,timer+1):
+            def getCurrentActions():
                 response = self.ixnObj.get(self.ixnObj.httpHeader+quickTestHandle+'/results', silentMode=True)
-                if counter < timer and response.json()['currentActions'] == []:
-                    self.ixnObj.logInfo('getQuickTestCurrentAction is empty. Waiting %s/%s' % (counter, timer))
-                    time.sleep(1)
-                    continue
-                if counter < timer and response.json()['currentActions'] != []:
-                    break
-                if counter == timer and response.json()['currentActions'] == []:
-                    IxNetRestApiException('getQuickTestCurrentActions: Has no action')
-
-            return response.json()['currentActions'][-1]['arg2']
+                if response.json()['currentActions'] == []:
+                    self.ixnObj.logInfo('getQuickTestCurrentAction is empty. Waiting')
+                return response.json()['currentActions']
+
+            currentActions = self.ixnObj.waitFor(getCurrentActions, timeout=10, description='Quick Test current action',
+                                                 ignoreException=True)
+            if currentActions is None:
+                raise IxNetRestApiException('getQuickTestCurrentActions: Has no action')
+
+            return currentActions[-1]['arg2']
         else:
             response = self.ixnObj.get(self.ixnObj.httpHeader+quickTestHandle+'/results')
             return response.json()['progress']
@@ -113,60 +112,50 @@ class QuickTest(object):
         """
         quickTestHandle = /api/v1/sessions/1/ixnetwork/quickTest/rfc2544throughput/2
         """
-        for timer in range(1,20+1):
+        currentActions = {}
+
+        def isTestInitialized():
             currentAction = self.getQuickTestCurrentAction(quickTestHandle)
-            print('verifyQuickTestInitialization currentState: %s' % currentAction)
-            if timer < 20:
-                if currentAction == 'TestEnded' or currentAction == 'None':
-                    self.ixnObj.logInfo('\nverifyQuickTestInitialization CurrentState = %s\n\tWaiting %s/20 seconds to change state' % (currentAction, timer))
-                    time.sleep(1)
-                    continue
-                else:
-                    break
-            if timer >= 20:
-                if currentAction == 'TestEnded' or currentAction == 'None':
-                    self.ixnObj.showErrorMessage()
-                    raise IxNetRestApiException('Quick Test is stuck at TestEnded.')
+            currentActions['initialization'] = currentAction
+            self.ixnObj.logInfo('verifyQuickTestInitialization currentState: %s' % currentAction, timestamp=False)
+            return currentAction not in ['TestEnded', 'None']
+
+        if self.ixnObj.waitFor(isTestInitialized, timeout=20, description='Quick Test initialized', ignoreException=True) is None:
+            self.ixnObj.showErrorMessage()
+            raise IxNetRestApiException('Quick Test is stuck at TestEnded.')
 
         ixNetworkVersionNumber = int(self.ixnObj.getIxNetworkVersion().split('.')[0])
         applyQuickTestCounter = 60
-        for counter in range(1,applyQuickTestCounter+1):
-            quickTestApplyStates = ['InitializingTest', 'ApplyFlowGroups', 'SetupStatisticsCollection']
+
+        def isTestApplied():
             currentAction = self.getQuickTestCurrentAction(quickTestHandle)
             if currentAction == None:
                 currentAction = 'ApplyingAndInitializing'
 
-            print('\nverifyQuickTestInitialization: %s  Expecting: TransmittingFrames\n\tWaiting %s/%s seconds' % (currentAction, counter, applyQuickTestCounter))
+            currentActions['apply'] = currentAction
+            self.ixnObj.logInfo('\nverifyQuickTestInitialization: %s  Expecting: TransmittingFrames' % currentAction, timestamp=False)
             if ixNetworkVersionNumber >= 8:
-                if counter < applyQuickTestCounter and currentAction != 'TransmittingFrames':
-                    time.sleep(1)
-                    continue
-
-                if counter < applyQuickTestCounter and currentAction == 'TransmittingFrames':
-                    self.ixnObj.logInfo('\nVerifyQuickTestInitialization is done applying configuration and has started transmitting frames\n')
-                break
-
-            if ixNetworkVersionNumber < 8:
-                if counter < applyQuickTestCounter and currentAction == 'ApplyingAndInitializing':
-                    time.sleep(1)
-                    continue
-
-                if counter < applyQuickTestCounter and currentAction == 'ApplyingAndInitializing':
-                    self.ixnObj.logInfo('\nVerifyQuickTestInitialization is done applying configuration and has started transmitting frames\n')
-                break
-
-            if counter == applyQuickTestCounter:
-                if ixNetworkVersionNumber >= 8 and currentAction != 'TransmittingFrames':
-                    self.ixnObj.showErrorMessage()
-                    if currentAction == 'ApplyFlowGroups':
-                        self.ixnObj.logInfo('\nIxNetwork is stuck on Applying Flow Groups. You need to go to the session to FORCE QUIT it.\n')
-                    raise IxNetRestApiException('\nVerifyQuickTestInitialization is stuck on %s. Waited %s/%s seconds' % (
-                            currentAction, counter, applyQuickTestCounter))
-
-                if ixNetworkVersionNumber < 8 and currentAction != 'Trial':
-                    self.ixnObj.showErrorMessage()
-                    raise IxNetRestApiException('\nVerifyQuickTestInitialization is stuck on %s. Waited %s/%s seconds' % (
-                            currentAction, counter, applyQuickTestCounter))
+                return currentAction == 'TransmittingFrames'
+
+            return currentAction != 'ApplyingAndInitializing'
+
+        if self.ixnObj.waitFor(isTestApplied, timeout=applyQuickTestCounter, description='Quick Test applied',
+                               ignoreException=True):
+            self.ixnObj.logInfo('\nVerifyQuickTestInitialization is done applying configuration and has started transmitting frames\n')
+            return
+
+        currentAction = currentActions['apply']
+        if ixNetworkVersionNumber >= 8 and currentAction != 'TransmittingFrames':
+            self.ixnObj.showErrorMessage()
+            if currentAction == 'ApplyFlowGroups':
+                self.ixnObj.logInfo('\nIxNetwork is stuck on Applying Flow Groups. You need to go to the session to FORCE QUIT it.\n')
+            raise IxNetRestApiException('\nVerifyQuickTestInitialization is stuck on %s. Waited %s seconds' % (
+                    currentAction, applyQuickTestCounter))
+
+        if ixNetworkVersionNumber < 8 and currentAction != 'Trial':
+            self.ixnObj.showErrorMessage()
+            raise IxNetRestApiException('\nVerifyQuickTestInitialization is stuck on %s. Waited %s seconds' % (
+                    currentAction, applyQuickTestCounter))
 
     def startQuickTest(self, quickTestHandle):
         """
@@ -216,43 +205,49 @@ class QuickTest(object):
         Parameters
             quickTestHandle: /api/v1/sessions/{1}/ixnetwork/quickTest/rfc2544throughput/2
         """
-        isRunningBreakFlag = 0
-        trafficStartedFlag = 0
-        waitForRunningProgressCounter = 0
-        counter = 1
+        lastResults = {}
 
-        while True:
+        def getResults():
             response = self.ixnObj.get(self.ixnObj.httpHeader+quickTestHandle+'/results', silentMode=True)
-            isRunning = response.json()['isRunning']
-            if isRunning == True:
-                response = self.ixnObj.get(self.ixnObj.httpHeader+quickTestHandle+'/results', silentMode=True)
-                currentRunningProgress = response.json()['progress']
-                if bool(re.match('^Trial.*', currentRunningProgress)) == False:
-                    if waitForRunningProgressCounter < 30:
-                        self.ixnObj.logInfo('isRunning=True. Waiting for trial runs {0}/30 seconds'.format(waitForRunningProgressCounter))
-                        waitForRunningProgressCounter += 1
-                        time.sleep(1)
-                    if waitForRunningProgressCounter == 30:
-                        raise IxNetRestApiException('isRunning=True. No quick test stats showing.')
-                else:
-                    trafficStartedFlag = 1
-                    self.ixnObj.logInfo(currentRunningProgress)
-                    counter += 1
-                    time.sleep(getProgressInterval)
-                    continue
-            else:
-                if trafficStartedFlag == 1:
-                    # We only care about traffic not running in the beginning.
-                    # If traffic ran and stopped, then break out.
-                    self.ixnObj.logInfo('\nisRunning=False. Quick Test is complete')
-                    return 0
-                if isRunningBreakFlag < 20:
-                    print('isRunning=False. Wait {0}/20 seconds'.format(isRunningBreakFlag))
-                    isRunningBreakFlag += 1
-                    time.sleep(1)
-                    continue
-                if isRunningBreakFlag == 20:
-                    raise IxNetRestApiException('Quick Test failed to start:', response.json()['status'])
+            lastResults.update(response.json())
+            return response.json()
+
+        def isRunning():
+            if getResults()['isRunning'] == False:
+                self.ixnObj.logInfo('isRunning=False. Waiting for the Quick Test to start', timestamp=False)
+                return False
+            return True
+
+        if self.ixnObj.waitFor(isRunning, timeout=20, description='Quick Test running', ignoreException=True) is None:
+            raise IxNetRestApiException('Quick Test failed to start: {0}'.format(lastResults.get('status')))
+
+        def isTrialRunning():
+            results = getResults()
+            if results['isRunning'] and bool(re.match('^Trial.*', results['progress'])):
+                return True
+            self.ixnObj.logInfo('isRunning=True. Waiting for trial runs', timestamp=False)
+            return False
+
+        if self.ixnObj.waitFor(isTrialRunning, timeout=30, description='Quick Test trial running', ignoreException=True) is None:
+            raise IxNetRestApiException('isRunning=True. No quick test stats showing.')
+
+        lastProgressTime = [0]
+
+        def isTestComplete():
+            results = getResults()
+            if results['isRunning'] == False:
+                return True
+
+            # Poll often to notice the end right away. Show the progress every getProgressInterval seconds.
+            if time.time() - lastProgressTime[0] >= getProgressInterval:
+                self.ixnObj.logInfo(results['progress'])
+                lastProgressTime[0] = time.time()
+            return False
+
+        # A Quick Test could run for hours. There is no deadline.
+        self.ixnObj.waitFor(isTestComplete, timeout=float('inf'), description='Quick Test complete')
+        self.ixnObj.logInfo('\nisRunning=False. Quick Test is complete')
+        return 0
 
     def getQuickTestResultPath(self, quickTestHandle):
         """
@@ -0,0 +1,288 @@
+
+# PLEASE READ DISCLAIMER
+#
+#    This class demonstrates sample IxNetwork REST API usage for
+#    demo and reference purpose only.
+#    It is subject to change for updates without warning.
+#
+# DESCRIPTION
+#    Keep API server sessions started and ready to use.
+#    Starting a Linux API server session takes tens of seconds. The pool starts
+#    the sessions ahead of time in the background, hands out a session with a
+#    blank config on demand and resets it with newBlankConfig when it is released,
+#    instead of deleting it and starting a new one for each test.
+#
+# REQUIREMENTS
+#    - Python modules: requests
+#    - Python 2 requires the futures backport for concurrent.futures
+#
+
+import sys, time, threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from IxNetRestApi import IxNetRestApiException
+from IxNetRestApiOrchestrator import createSession, deleteSession
+
+if sys.version_info[0] >= 3:
+    import queue
+else:
+    import Queue as queue
+
+class SessionPool(object):
+    def __init__(self, sessionParams, poolSize=2, maxUses=None, startSessions=True, createRetries=3, retryInterval=5):
+        """
+        Description
+           A pool of started sessions with a blank config.
+
+        Parameters
+           sessionParams: (dict): The Connect kwargs used to create each session.
+                                  {'apiServerIp': '192.168.70.108', 'serverOs': 'linux', 'username': 'admin', 'password': 'admin'}
+           poolSize: (int): The amount of sessions to keep started.
+           maxUses: (int): Replace a session with a new one after it was used this many times.
+                           None = Reuse the sessions until they become unhealthy.
+           startSessions: (bool): True: Start creating the sessions in the background now.
+                                  False: Call start() later.
+           createRetries: (int): Retry a failed session creation this many times.
+           retryInterval: (int): The seconds to wait before the first retry. Doubled after each retry.
+
+        Notes
+           - Sessions are created, reset and replaced by background threads.
+           - A session that fails the reset or the health check is deleted and replaced.
+           - Call close() at the end to delete all the sessions.
+
+        Example
+           pool = SessionPool({'apiServerIp': '192.168.70.108', 'serverOs': 'linux'}, poolSize=3)
+
+           with pool.session() as mainObj:
+               fileMgmtObj = FileMgmt(mainObj)
+               ...
+
+           pool.close()
+        """
+        self.sessionParams = sessionParams
+        self.poolSize = poolSize
+        self.maxUses = maxUses
+        self.createRetries = createRetries
+        self.retryInterval = retryInterval
+        self.availableQueue = queue.Queue()
+        self.sessionUses = {}
+        self.pendingCount = 0
+        self.sessionErrors = []
+        self.lock = threading.Lock()
+        self.closed = False
+        self.executor = ThreadPoolExecutor(max_workers=poolSize)
+
+        if startSessions:
+            self.start()
+
+    def start(self):
+        """
+        Description
+           Create the missing sessions in the background until the pool has poolSize sessions.
+        """
+        with self.lock:
+            if self.closed:
+                return
+
+            missing = self.poolSize - len(self.sessionUses) - self.pendingCount
+            # Count them now so that concurrent calls don't create extra sessions.
+            self.pendingCount += max(0, missing)
+            for index in range(missing):
+                self.executor.submit(self._createSession)
+
+    def _submit(self, function, *args):
+        """
+        Description
+           Run a function in a background thread unless the pool is closed.
+           The executor is shut down by close() and doesn't accept new work afterwards.
+
+        Return
+           True if the function was submitted. False if the pool is closed.
+        """
+        with self.lock:
+            if self.closed:
+                return False
+
+            self.executor.submit(function, *args)
+            return True
+
+    def _createSession(self):
+        """
+        Description
+           Create one session and make it available. Runs in a background thread.
+           A failed creation is retried createRetries times with an increasing wait.
+        """
+        retryInterval = self.retryInterval
+        for attempt in range(self.createRetries + 1):
+            try:
+                mainObj = createSession(self.sessionParams)
+                break
+            except Exception as errMsg:
+                createError = 'Session create failed: {0}'.format(errMsg)
+
+            if attempt == self.createRetries or self.closed:
+                with self.lock:
+                    self.pendingCount -= 1
+                    self.sessionErrors.append(createError)
+                return
+
+            time.sleep(retryInterval)
+            retryInterval *= 2
+
+        with self.lock:
+            self.pendingCount -= 1
+            if self.closed == False:
+                self.sessionUses[mainObj] = 0
+                self.availableQueue.put(mainObj)
+                return
+
+        self._deleteSession(mainObj)
+
+    def _deleteSession(self, mainObj):
+        try:
+            deleteSession(mainObj)
+        except Exception as errMsg:
+            mainObj.logWarning('SessionPool: Deleting session failed: {0}'.format(errMsg))
+
+    def isHealthy(self, mainObj):
+        """
+        Description
+           Verify that the session is still answering.
+
+        Parameter
+           mainObj: The Connect object.
+        """
+        try:
+            response = mainObj.get(mainObj.sessionUrl, silentMode=True, ignoreError=True)
+        except Exception:
+            return False
+
+        return str(response.status_code).startswith('2')
+
+    def _replaceSession(self, mainObj):
+        """
+        Description
+           Delete a session and create a new one in the background.
+        """
+        with self.lock:
+            self.sessionUses.pop(mainObj, None)
+
+        if not self._submit(self._deleteSession, mainObj):
+            self._deleteSession(mainObj)
+            return
+
+        self.start()
+
+    def acquire(self, timeout=300):
+        """
+        Description
+           Get a started session with a blank config.
+           Waits for a session if all the sessions are in use or still starting.
+
+        Parameter
+           timeout: (int): The maximum seconds to wait for a session.
+
+        Return
+           The Connect object.
+        """
+        if self.closed:
+            raise IxNetRestApiException('SessionPool: The pool is closed')
+
+        startTime = time.time()
+        while True:
+            remaining = timeout - (time.time() - startTime)
+            with self.lock:
+                noSession = self.sessionUses == {} and self.pendingCount == 0
+
+            if noSession:
+                raise IxNetRestApiException('SessionPool: No session could be started: {0}'.format(self.sessionErrors))
+
+            try:
+                # Wake up periodically to notice that all the session creations failed.
+                mainObj = self.availableQueue.get(timeout=max(0, min(remaining, 5)))
+            except queue.Empty:
+                if time.time() - startTime >= timeout:
+                    raise IxNetRestApiException('SessionPool: No session available after {0} seconds'.format(timeout))
+                continue
+
+            if self.isHealthy(mainObj):
+                with self.lock:
+                    self.sessionUses[mainObj] += 1
+                return mainObj
+
+            mainObj.logWarning('SessionPool: Replacing unhealthy session: {0}'.format(mainObj.sessionId))
+            self._replaceSession(mainObj)
+
+    def release(self, mainObj, healthy=True):
+        """
+        Description
+           Return a session to the pool. It is reset with newBlankConfig in the background.
+
+        Parameters
+           mainObj: The Connect object from acquire().
+           healthy: (bool): False: Delete the session and create a new one instead of reusing it.
+                                   For example after the test lost the connection to the session.
+        """
+        if self.closed or healthy == False or (self.maxUses and self.sessionUses.get(mainObj, 0) >= self.maxUses):
+            self._replaceSession(mainObj)
+            return
+
+        if not self._submit(self._resetSession, mainObj):
+            # The pool was closed meanwhile.
+            self._replaceSession(mainObj)
+
+    def _resetSession(self, mainObj):
+        """
+        Description
+           Load a blank config and make the session available again. Runs in a background thread.
+        """
+        try:
+            mainObj.newBlankConfig()
+        except Exception as errMsg:
+            mainObj.logWarning('SessionPool: Replacing the session. Reset failed: {0}'.format(errMsg))
+            self._replaceSession(mainObj)
+            return
+
+        if self.closed:
+            self._replaceSession(mainObj)
+        else:
+            self.availableQueue.put(mainObj)
+
+    @contextmanager
+    def session(self, timeout=300):
+        """
+        Description
+           Acquire a session for a with statement and release it at the end.
+           The session is replaced if the block raised an IxNetRestApiException.
+
+        Example
+           with pool.session() as mainObj:
+               ...
+        """
+        mainObj = self.acquire(timeout=timeout)
+        healthy = True
+        try:
+            yield mainObj
+        except IxNetRestApiException:
+            healthy = self.isHealthy(mainObj)
+            raise
+        finally:
+            self.release(mainObj, healthy=healthy)
+
+    def close(self):
+        """
+        Description
+           Delete all the sessions. Sessions still in use are deleted when they are released.
+        """
+        with self.lock:
+            self.closed = True
+
+        # Wait for the sessions being created or reset. They are deleted because the pool is closed.
+        self.executor.shutdown(wait=True)
+
+        while True:
+            try:
+                mainObj = self.availableQueue.get(block=False)
+            except queue.Empty:
+                break
+            self._replaceSession(mainObj)
@@ -9,6 +9,12 @@ class Statistics(object):
         # For takesnapshot()
         self.fileMgmtObj = FileMgmt(self.ixnObj)
 
+        # Stat view caption -> view object. Refreshed on a cache miss.
+        self.viewObjectCache = {}
+
+        # data|page. The IxNetwork version doesn't change during the session. See getStatApi.
+        self.statApi = None
+
     def setMainObject(self, mainObject):
         """
         Description
@@ -17,7 +23,7 @@ class Statistics(object):
         self.ixnObj = mainObject
 
     def getStats(self, viewObject=None, viewName='Flow Statistics', csvFile=None, csvEnableFileTimestamp=False,
-                 displayStats=True, silentMode=True, ignoreError=False):
+                 displayStats=True, silentMode=True, ignoreError=False, resultMode='dict', rowLabel=None):
         """
         Description
            Get stats for any viewName.
@@ -26,6 +32,8 @@ class Statistics(object):
            For IxNetwork version >= 8.50, calls getStatsData. This has new APIs that is more robust and they don't
            work in versions prior to 8.50.
 
+           With resultMode numpy or pandas, calls getStatsArray instead.
+
         Parameters
             csvFile = None or <filename.csv>.
                       None will not create a CSV file.
@@ -41,9 +49,23 @@ class Statistics(object):
             viewName options (Not case sensitive):
                NOTE: Not all statistics are listed here.
                   You could get the statistic viewName directly from the IxNetwork GUI in the statistics.
+
+            resultMode: dict|columns|numpy|pandas.
+                        dict:    statDict[rowNumber][columnName] == statValue (string)
+                        columns: {columnName: [statValue, ...]} with numeric values converted. See getStatsColumns.
+                        numpy:   A NumPy structured array. See getStatsArray.
+                        pandas:  A pandas DataFrame. See getStatsArray.
+            rowLabel: For resultMode pandas only. The column to use as the DataFrame index.
+                      Example: 'Traffic Item'
         """
-        buildNumber = float(self.ixnObj.getIxNetworkVersion()[:3])
-        if buildNumber >= 8.5:
+        if resultMode == 'columns':
+            return self.getStatsColumns(viewObject=viewObject, viewName=viewName, silentMode=silentMode, ignoreError=ignoreError)
+
+        if resultMode in ['numpy', 'pandas']:
+            return self.getStatsArray(viewObject=viewObject, viewName=viewName, resultMode=resultMode, rowLabel=rowLabel,
+                                      silentMode=silentMode, ignoreError=ignoreError)
+
+        if self.getStatApi() == 'data':
             return self.getStatsData(viewObject=viewObject, viewName=viewName, csvFile=csvFile, csvEnableFileTimestamp=csvEnableFileTimestamp,
                                      displayStats=displayStats, silentMode=silentMode, ignoreError=ignoreError)
         else:
@@ -106,56 +128,13 @@ class Statistics(object):
            Get stats on row 2 for 'Tx Frames' = statDict[2]['Tx Frames']
         """
         if viewObject == None:
-            breakFlag = 0
-            counterStop = 30
-            for counter in range(1, counterStop+1):
-                viewList = self.ixnObj.get('%s/%s/%s' % (self.ixnObj.sessionUrl, 'statistics', 'view'), silentMode=silentMode)
-                views = ['%s/%s/%s/%s' % (self.ixnObj.sessionUrl, 'statistics', 'view', str(i['id'])) for i in viewList.json()]
-                if silentMode is False:
-                    self.ixnObj.logInfo('\ngetStats: Searching for viewObj for viewName: %s' % viewName)
-
-                for view in views:
-                    # GetAttribute
-                    response = self.ixnObj.get('%s' % view, silentMode=silentMode)
-                    captionMatch = re.match(viewName, response.json()['caption'], re.I)
-                    if captionMatch:
-                        # viewObj: sessionUrl + /statistics/view/11'
-                        viewObject = view
-                        breakFlag = 1
-                        break
-
-                if breakFlag == 1:
-                    break
-
-                if counter < counterStop:
-                    self.ixnObj.logInfo('\nGetting statview [{0}] is not ready. Waiting {1}/{2} seconds.'.format(
-                        viewName, counter, counterStop), timestamp=False)
-                    time.sleep(1)
-                    continue
-                    
-                if counter == counterStop:
-                    if viewObject == None and ignoreError == False:
-                        raise IxNetRestApiException("viewObj wasn't found for viewName: {0}".format(viewName))
-
-                    if viewObject == None and ignoreError == True:
-                        return None
+            viewObject = self.getViewObjectByCaption(viewName, silentMode=silentMode, ignoreError=ignoreError)
+            if viewObject == None:
+                return None
 
         if silentMode is False:
             self.ixnObj.logInfo('\n[{0}] viewObj is: {1}'.format(viewName, viewObject))
 
-        for counter in range(0,31):
-            response = self.ixnObj.get(viewObject+'/page', silentMode=silentMode)
-            totalPages = response.json()['totalPages']
-            if totalPages == 'null':
-                self.ixnObj.logInfo('\nGetting total pages is not ready yet. Waiting %d/30 seconds' % counter)
-                time.sleep(1)
-
-            if totalPages != 'null':
-                break
-
-            if counter == 30:
-                raise IxNetRestApiException('getStatsPage failed: Getting total pages')
-
         if csvFile != None:
             import csv
             csvFileName = csvFile.replace(' ', '_')
@@ -172,19 +151,12 @@ class Statistics(object):
             csvFile = open(csvFileName, 'w')
             csvWriteObj = csv.writer(csvFile)
 
-        # Get the stat column names
-        columnList = response.json()['columnCaptions']
-        if csvFile != None:
-            csvWriteObj.writerow(columnList)
-
         flowNumber = 1
         statDict = {}
-        # Get the stat values
-        for pageNumber in range(1,totalPages+1):
-            self.ixnObj.patch(viewObject+'/page', data={'currentPage': pageNumber}, silentMode=silentMode)
-
-            response = self.ixnObj.get(viewObject+'/page', silentMode=silentMode)
-            statValueList = response.json()['pageValues']
+        for columnList, statValueList in self._iterStatPages(viewObject, viewName=viewName, statApi='page', silentMode=silentMode):
+            # Write the stat column names one time only
+            if flowNumber == 1 and csvFile != None:
+                csvWriteObj.writerow(columnList)
 
             for statValue in statValueList:
                 if csvFile != None:
@@ -262,63 +234,13 @@ class Statistics(object):
            Get stats on row 2 for 'Tx Frames' = statDict[2]['Tx Frames']
         """
         if viewObject == None:
-
-            breakFlag = 0
-            counterStop = 30
-            for counter in range(1, counterStop+1):
-                viewList = self.ixnObj.get('%s/%s/%s' % (self.ixnObj.sessionUrl, 'statistics', 'view'), silentMode=silentMode)
-                views = ['%s/%s/%s/%s' % (self.ixnObj.sessionUrl, 'statistics', 'view', str(i['id'])) for i in viewList.json()]
-                if silentMode is False:
-                    self.ixnObj.logInfo('\ngetStats: Searching for viewObj for viewName: {0}'.format(
-                        viewName), timestamp=False)
-
-                for view in views:
-                    #print('\nview:', view)
-                    response = self.ixnObj.get('%s' % view, silentMode=True)
-                    captionMatch = re.match(viewName, response.json()['caption'], re.I)
-                    if captionMatch:
-                        # viewObj: sessionUrl + /statistics/view/11'
-                        viewObject = view
-                        breakFlag = 1
-                        break
-
-                if breakFlag == 1:
-                    break
-
-                if counter < counterStop:
-                    self.ixnObj.logInfo('\nGetting statview [{0}] is not ready. Waiting {1}/{2} seconds.'.format(
-                        viewName, counter, counterStop), timestamp=False)
-                    time.sleep(1)
-                    continue
-                    
-                if counter == counterStop:
-                    if viewObject == None and ignoreError == False:
-                        raise IxNetRestApiException("viewObj wasn't found for viewName: {0}".format(viewName))
-
-                    if viewObject == None and ignoreError == True:
-                        return None
+            viewObject = self.getViewObjectByCaption(viewName, silentMode=silentMode, ignoreError=ignoreError)
+            if viewObject == None:
+                return None
 
         if silentMode is False:
             self.ixnObj.logInfo('\n[{0}] viewObj is: {1}'.format(viewName, viewObject))
 
-        counterStop = 30
-        for counter in range(0, counterStop+1):
-            response = self.ixnObj.get(viewObject+'/data', silentMode=silentMode)
-            totalPages = response.json()['totalPages']
-            #self.ixnObj.logInfo('totalPages: {0}'.format(totalPages), timestamp=False)
-
-            if totalPages == 'null' and counter < counterStop:
-                self.ixnObj.logInfo('\nGetting total pages is not ready yet. Waiting {0}/{1} seconds'.format(
-                    counter, counterStop), timestamp=False)
-                time.sleep(1)
-                continue
-
-            if totalPages != 'null' and counter < counterStop:
-                break
-
-            if counter == counterStop:
-                raise IxNetRestApiException('getStats failed: Getting total pages')
-
         if csvFile != None:
             import csv
             csvFileName = csvFile.replace(' ', '_')
@@ -337,34 +259,11 @@ class Statistics(object):
 
         flowNumber = 1
         statDict = {}
-        getColumnCaptionFlag = 0
-        for pageNumber in range(1,totalPages+1):
-            self.ixnObj.patch(viewObject+'/data', data={'currentPage': pageNumber}, silentMode=silentMode)
-
-            counterStop = 30
-            for counter in range(1, counterStop+1):
-                response = self.ixnObj.get(viewObject+'/data', silentMode=silentMode)
-                if counter < counterStop:
-                    if response.json()['columnCaptions'] == [] or response.json()['pageValues'] == []:
-                        self.ixnObj.logInfo('[{0}] stat values not ready yet. Wait {1}/{2} seconds.'.format(
-                            viewName, counter, counterStop))
-                        time.sleep(1)
-                        continue
-
-                    if response.json()['columnCaptions'] != [] or response.json()['pageValues'] != []:
-                        break
-
-                if counter == counterStop:
-                    raise IxNetRestApiException('IxNetwork API server failed to provide stats')
+        for columnList, statValueList in self._iterStatPages(viewObject, viewName=viewName, statApi='data', silentMode=silentMode):
+            # Write the stat column names one time only
+            if flowNumber == 1 and csvFile != None:
+                csvWriteObj.writerow(columnList)
 
-            # Get the stat column names one time only
-            if getColumnCaptionFlag == 0:
-                getColumnCaptionFlag = 1
-                columnList = response.json()['columnCaptions']
-                if csvFile != None:
-                    csvWriteObj.writerow(columnList)
-                
-            statValueList = response.json()['pageValues']
             for statValue in statValueList:
                 if csvFile != None:
                     csvWriteObj.writerow(statValue[0])
@@ -386,6 +285,325 @@ class Statistics(object):
             csvFile.close()
         return statDict
 
+    def getViewObjectByCaption(self, viewName='Flow Statistics', silentMode=True, ignoreError=False):
+        """
+        Description
+            Get the statistic view object whose caption matches the viewName regex (not case sensitive).
+            Wait up to 30 seconds for the view to be created.
+
+        Parameters
+            viewName: <str>: The statistic view caption. Example: 'Flow Statistics'
+            ignoreError: True or False.  Returns None if viewName is not found.
+
+        Return
+            The view object: http://{apiServerIp:port}/api/v1/sessions/2/ixnetwork/statistics/view/13
+        """
+        def findViewObject(refresh=True):
+            # Look in the cache first. Refresh it on a miss because the view could be new.
+            if refresh:
+                if silentMode is False:
+                    self.ixnObj.logInfo('\ngetStats: Searching for viewObj for viewName: {0}'.format(viewName), timestamp=False)
+                self.refreshViewObjectCache(silentMode=silentMode)
+
+            for caption, view in self.viewObjectCache.items():
+                if re.match(viewName, caption, re.I):
+                    # viewObj: sessionUrl + /statistics/view/11'
+                    return view
+
+            if refresh:
+                self.ixnObj.logInfo('\nGetting statview [{0}] is not ready. Waiting.'.format(viewName), timestamp=False)
+
+        view = findViewObject(refresh=False)
+        if view:
+            return view
+
+        view = self.ixnObj.waitFor(findViewObject, timeout=30, description='Stat view: %s' % viewName, ignoreException=True)
+        if view is None and ignoreError == False:
+            raise IxNetRestApiException("viewObj wasn't found for viewName: {0}".format(viewName))
+        return view
+
+    def refreshViewObjectCache(self, silentMode=True):
+        """
+        Description
+            Rebuild the stat view caption to view object cache with one GET of all the views.
+            The cache is refreshed automatically on a miss, by removeAllTclViews and by clearStats.
+        """
+        viewList = self.ixnObj.get('%s/%s/%s' % (self.ixnObj.sessionUrl, 'statistics', 'view'), silentMode=silentMode)
+        self.viewObjectCache = {}
+        for view in viewList.json():
+            viewObject = '%s/%s/%s/%s' % (self.ixnObj.sessionUrl, 'statistics', 'view', str(view['id']))
+            caption = view.get('caption')
+            if caption is None:
+                caption = self.ixnObj.get(viewObject, silentMode=True).json()['caption']
+
+            self.viewObjectCache[caption] = viewObject
+
+        return self.viewObjectCache
+
+    def removeViewObject(self, viewObject):
+        """
+        Description
+            Remove a view that no longer exists from the view object cache.
+            The next lookup of its caption refreshes the cache.
+        """
+        for caption in [caption for caption, view in self.viewObjectCache.items() if view == viewObject]:
+            del self.viewObjectCache[caption]
+
+    def getStatApi(self):
+        """
+        Description
+            The stat view API of the IxNetwork version. Read from the API server one time only.
+
+        Return
+            data: /statistics/view/<id>/data for IxNetwork >= 8.50
+            page: The deprecated /statistics/view/<id>/page API
+        """
+        if self.statApi is None:
+            self.statApi = 'page'
+            if float(self.ixnObj.getIxNetworkVersion()[:3]) >= 8.5:
+                self.statApi = 'data'
+
+        return self.statApi
+
+    def _iterStatPages(self, viewObject, viewName='', statApi='data', silentMode=True):
+        """
+        Description
+            Internal generator used by all the stat readers.
+            Read the view one page at a time and yield (columnCaptions, pageValues) for each page.
+            Only one page is held in memory at a time.
+
+        Parameters
+            viewObject: The view object.
+            statApi: data|page. data: /statistics/view/<id>/data for IxNetwork >= 8.50.
+                                page: The deprecated /statistics/view/<id>/page API.
+        """
+        statUrl = viewObject+'/'+statApi
+        counterStop = 30
+        lastResponse = []
+
+        def isTotalPagesReady():
+            response = self.ixnObj.get(statUrl, silentMode=silentMode, ignoreError=True)
+            if response.status_code == 404:
+                # The view was removed or recreated with a new ID.
+                self.removeViewObject(viewObject)
+                raise IxNetRestApiException('getStats failed: The stat view no longer exists: {0}'.format(viewObject))
+
+            if not str(response.status_code).startswith('2'):
+                raise IxNetRestApiException('GET Exception error: {0}'.format(response.text))
+
+            lastResponse[:] = [response]
+            if lastResponse[0].json()['totalPages'] != 'null':
+                return True
+
+            self.ixnObj.logInfo('\nGetting total pages is not ready yet. Waiting', timestamp=False)
+            return False
+
+        if self.ixnObj.waitFor(isTotalPagesReady, timeout=counterStop, description='Stat view total pages',
+                               ignoreException=True) is None:
+            raise IxNetRestApiException('getStats failed: Getting total pages')
+
+        response = lastResponse[0]
+        totalPages = response.json()['totalPages']
+
+        columnList = None
+        for pageNumber in range(1, totalPages+1):
+            # The first page is usually the current page already. Don't send a PATCH for it.
+            if response.json().get('currentPage') != pageNumber:
+                self.ixnObj.patch(statUrl, data={'currentPage': pageNumber}, silentMode=silentMode)
+                response = self.ixnObj.get(statUrl, silentMode=silentMode)
+
+            if statApi == 'data' and (response.json()['columnCaptions'] == [] or response.json()['pageValues'] == []):
+                lastResponse[:] = [response]
+
+                def isStatValuesReady():
+                    self.ixnObj.logInfo('[{0}] stat values not ready yet. Waiting.'.format(viewName))
+                    lastResponse[:] = [self.ixnObj.get(statUrl, silentMode=silentMode)]
+                    return lastResponse[0].json()['columnCaptions'] != [] and lastResponse[0].json()['pageValues'] != []
+
+                if self.ixnObj.waitFor(isStatValuesReady, timeout=counterStop, description='Stat view values',
+                                       ignoreException=True) is None:
+                    raise IxNetRestApiException('IxNetwork API server failed to provide stats')
+
+                response = lastResponse[0]
+
+            # Get the stat column names one time only
+            if columnList is None:
+                columnList = response.json()['columnCaptions']
+
+            yield columnList, response.json()['pageValues']
+
+    @staticmethod
+    def convertStatValue(statValue):
+        """
+        Description
+            Convert a stat value string to int or float.
+            Values that are not numbers such as port names, timestamps or 'N/A' are returned as-is.
+        """
+        try:
+            return int(statValue)
+        except (ValueError, TypeError):
+            pass
+
+        try:
+            return float(statValue)
+        except (ValueError, TypeError):
+            return statValue
+
+    def iterStats(self, viewObject=None, viewName='Flow Statistics', perPage=False, convertValues=True,
+                  silentMode=True, ignoreError=False):
+        """
+        Description
+            A generator that reads any stat view page by page and yields the rows as they arrive
+            instead of building the whole view in memory like getStats does.
+            Use this for large views such as Flow Statistics with many flows.
+
+        Parameters
+            viewObject: The view object. If None, the viewName is used to get the view object.
+            viewName: The statistic view caption. Example: 'Flow Statistics', 'Port Statistics'
+            perPage: True: Yield a list of rows for each page.  False: Yield one row at a time.
+            convertValues: True: Convert the numeric stat values to int or float.
+                           False: Keep the stat values as strings like getStats.
+            ignoreError: True or False.  Yields nothing if viewName is not found.
+
+        Example:
+            for row in statObj.iterStats(viewName='Flow Statistics'):
+                if row['Loss %'] > 0:
+                    print(row['Traffic Item'], row['Rx Frames'])
+
+        Yield
+            A dict for each row: {columnName: statValue}.  Or a list of these dicts if perPage=True.
+        """
+        if viewObject == None:
+            viewObject = self.getViewObjectByCaption(viewName, silentMode=silentMode, ignoreError=ignoreError)
+            if viewObject == None:
+                return
+
+        for columnList, statValueList in self._iterStatPages(viewObject, viewName=viewName, statApi=self.getStatApi(),
+                                                             silentMode=silentMode):
+            rowList = []
+            for statValue in statValueList:
+                if convertValues:
+                    rowList.append(dict(zip(columnList, [self.convertStatValue(value) for value in statValue[0]])))
+                else:
+                    rowList.append(dict(zip(columnList, statValue[0])))
+
+            if perPage:
+                yield rowList
+            else:
+                for row in rowList:
+                    yield row
+
+    def getStatsColumns(self, viewObject=None, viewName='Flow Statistics', convertValues=True, silentMode=True,
+                        ignoreError=False):
+        """
+        Description
+            Get stats in columnar mode: one list of values for each column.
+            This is lighter than getStats for large views because the page values are appended to the
+            column lists directly. No dict is built for each row.
+
+        Parameters
+            viewObject: The view object. If None, the viewName is used to get the view object.
+            viewName: The statistic view caption. Example: 'Flow Statistics', 'Port Statistics'
+            convertValues: True: Convert the numeric stat values to int or float.
+            ignoreError: True or False.  Returns None if viewName is not found.
+
+        Example:
+            stats = statObj.getStatsColumns(viewName='Port Statistics')
+            totalRxFrames = sum(stats['Valid Frames Rx.'])
+
+        Return
+            {columnName: [row1Value, row2Value, ...]}.  {} if the view has no rows.
+        """
+        if viewObject == None:
+            viewObject = self.getViewObjectByCaption(viewName, silentMode=silentMode, ignoreError=ignoreError)
+            if viewObject == None:
+                return None
+
+        statColumns = {}
+        columnValueLists = None
+        for columnList, statValueList in self._iterStatPages(viewObject, viewName=viewName, statApi=self.getStatApi(),
+                                                             silentMode=silentMode):
+            if statValueList == []:
+                continue
+
+            if columnValueLists is None:
+                columnValueLists = [[] for column in columnList]
+                statColumns = dict(zip(columnList, columnValueLists))
+
+            # Transpose the page: one tuple of values for each column.
+            for valueList, pageValues in zip(columnValueLists, zip(*[statValue[0] for statValue in statValueList])):
+                if convertValues:
+                    valueList.extend([self.convertStatValue(value) for value in pageValues])
+                else:
+                    valueList.extend(pageValues)
+
+        return statColumns
+
+    def getStatsArray(self, viewObject=None, viewName='Flow Statistics', resultMode='pandas', rowLabel=None,
+                      silentMode=True, ignoreError=False):
+        """
+        Description
+            Get stats as a NumPy structured array or a pandas DataFrame for post-test analysis.
+            The view is read page by page and each column is converted to int64/float64 in one
+            vectorized pass.  Columns that are not numeric such as names and timestamps stay strings.
+
+        Requirements
+            numpy for resultMode=numpy.  pandas for resultMode=pandas.
+
+        Parameters
+            viewObject: The view object. If None, the viewName is used to get the view object.
+            viewName: The statistic view caption. Example: 'Flow Statistics'
+            resultMode: numpy|pandas
+            rowLabel: For pandas only. The column to use as the index for fast filtering by row label.
+                      Example: 'Traffic Item'
+            ignoreError: True or False.  Returns None if viewName is not found.
+
+        Example:
+            df = statObj.getStatsArray(viewName='Traffic Item Statistics', rowLabel='Traffic Item')
+            df.loc['Topo1 to Topo2']['Rx Frames']
+            df[df['Loss %'] > 0]
+
+            stats = statObj.getStatsArray(viewName='Flow Statistics', resultMode='numpy')
+            stats[stats['Loss %'] > 0]['Rx Frames']
+
+        Return
+            A pandas DataFrame or a NumPy structured array.
+        """
+        if resultMode not in ['numpy', 'pandas']:
+            raise IxNetRestApiException('getStatsArray: resultMode must be numpy or pandas: {0}'.format(resultMode))
+
+        try:
+            import numpy
+            if resultMode == 'pandas':
+                import pandas
+        except ImportError as errMsg:
+            raise IxNetRestApiException('getStatsArray: resultMode={0} requires: {1}'.format(resultMode, errMsg))
+
+        statColumns = self.getStatsColumns(viewObject=viewObject, viewName=viewName, convertValues=False,
+                                           silentMode=silentMode, ignoreError=ignoreError)
+        if not statColumns:
+            return None
+
+        columnArrays = []
+        for column, valueList in statColumns.items():
+            columnArray = numpy.array(valueList)
+            for dataType in [numpy.int64, numpy.float64]:
+                try:
+                    columnArray = columnArray.astype(dataType)
+                    break
+                except ValueError:
+                    continue
+
+            columnArrays.append(columnArray)
+
+        if resultMode == 'numpy':
+            return numpy.rec.fromarrays(columnArrays, names=list(statColumns.keys()))
+
+        dataFrame = pandas.DataFrame(dict(zip(statColumns.keys(), columnArrays)), columns=list(statColumns.keys()))
+        if rowLabel is not None:
+            dataFrame = dataFrame.set_index(rowLabel, drop=False)
+        return dataFrame
+
     def removeAllTclViews(self):
         """
         Description
@@ -394,6 +612,7 @@ class Statistics(object):
         removeAllTclViewsUrl = self.ixnObj.sessionUrl+'/operations/removealltclviews'
         response = self.ixnObj.post(removeAllTclViewsUrl)
         self.ixnObj.waitForComplete(response, removeAllTclViewsUrl+'/'+response.json()['id'])
+        self.viewObjectCache = {}
 
     def takeSnapshot(self, viewName='Flow Statistics', windowsPath=None, isLinux=False, localLinuxPath=None,
                      renameDestinationFile=None, includeTimestamp=False, mode='overwrite'):
@@ -487,17 +706,11 @@ class Statistics(object):
             "Traffic Item Statistics"
         """
         self.ixnObj.logInfo('\ngetStats: %s' % viewName)
-        viewList = self.ixnObj.get("%s/%s/%s" % (self.ixnObj.sessionUrl, "statistics", "view"))
-        views = ["%s/%s/%s/%s" % (self.ixnObj.sessionUrl, "statistics", "view", str(i["id"])) for i in viewList.json()]
-        for view in views:
-            # GetAttribute
-            response = self.ixnObj.get(view)
-            caption = response.json()["caption"]
-            if viewName == caption:
-                # viewObj: sessionUrl + "/statistics/view/11"
-                viewObj = view
-                return viewObj
-        return None
+        if viewName not in self.viewObjectCache:
+            self.refreshViewObjectCache(silentMode=False)
+
+        # viewObj: sessionUrl + "/statistics/view/11"
+        return self.viewObjectCache.get(viewName)
 
     def clearStats(self):
         """
@@ -506,3 +719,162 @@ class Statistics(object):
         """
         url = self.ixnObj.sessionUrl + '/operations/clearStats'
         response = self.ixnObj.post(url, data={'arg1': ['waitForPortStatsRefresh']})
+        self.viewObjectCache = {}
+
+
+class StatDelta(object):
+    def __init__(self, statObj, viewName='Traffic Item Statistics', rowKey='Traffic Item', counterList=None,
+                 thresholds=None):
+        """
+        Description
+           Incremental stat monitoring.  Keep the previous snapshot of a stat view for each row and
+           compute the per-interval deltas and rates of the counters on each poll.
+           Only the rows that changed since the previous poll or that crossed a threshold are returned.
+
+        Parameters
+           statObj: <obj>: The Statistics object.
+           viewName: <str>: The stat view caption.
+           rowKey: <str>: The column that identifies a row. Example: 'Traffic Item', 'Port', 'Stat Name'.
+                          Use a list of columns if one column is not unique.
+           counterList: <list>: The counter columns to compute deltas and rates for.
+                                Columns that are not in the view are ignored.
+                                Defaults to the frame counters of the traffic views.
+           thresholds: <dict>: {columnName: thresholdValue}.  A row is returned with the column name in
+                               crossedThresholds when the column value reaches the threshold.
+
+        Example:
+           deltaObj = StatDelta(statObj, viewName='Traffic Item Statistics', thresholds={'Lost Frames': 100})
+           while True:
+               for row in deltaObj.poll():
+                   print(row['key'], row['delta']['Rx Frames'], row['rate']['Rx Frames'], row['crossedThresholds'])
+               time.sleep(1)
+        """
+        self.statObj = statObj
+        self.viewName = viewName
+        self.rowKey = rowKey
+        self.counterList = counterList
+        if self.counterList is None:
+            self.counterList = ['Tx Frames', 'Rx Frames', 'Lost Frames', 'Frames Delta', 'Packet Loss Duration (ms)']
+
+        self.thresholds = thresholds
+        if self.thresholds is None:
+            self.thresholds = {}
+
+        self.columnNames = []
+        # The view object found by viewName. Looked up again if the view was recreated.
+        self.viewObject = None
+        self.reset()
+
+    def reset(self):
+        """
+        Description
+           Forget the previous snapshot.  The next poll returns all the rows with deltas of 0.
+        """
+        self.previousRows = {}
+        self.previousPollTime = None
+
+    def poll(self, viewObject=None):
+        """
+        Description
+           Read the stat view once and compare it with the previous snapshot.
+
+        Parameter
+           viewObject: The view object. Defaults to looking it up by viewName.
+
+        Return
+           A list of the changed rows:
+              [{'key':               The rowKey value,
+                'values':            {columnName: statValue} of the current snapshot,
+                'delta':             {counterName: current - previous},
+                'rate':              {counterName: delta per second},
+                'crossedThresholds': [columnName, ...]
+               }, ...]
+        """
+        if viewObject is not None:
+            return self._poll(viewObject)
+
+        if self.viewObject is None:
+            self.viewObject = self.statObj.getViewObjectByCaption(self.viewName, silentMode=True, ignoreError=True)
+            if self.viewObject is None:
+                return []
+
+        try:
+            return self._poll(self.viewObject)
+        except IxNetRestApiException:
+            # The view could have been recreated with a new ID. Look it up again one time.
+            self.viewObject = None
+            self.statObj.viewObjectCache = {}
+            self.viewObject = self.statObj.getViewObjectByCaption(self.viewName, silentMode=True, ignoreError=True)
+            if self.viewObject is None:
+                return []
+            return self._poll(self.viewObject)
+
+    def _poll(self, viewObject):
+        currentRows = {}
+        keyIndexList = None
+        for columnList, statValueList in self.statObj._iterStatPages(viewObject, viewName=self.viewName,
+                                                                     statApi=self.statObj.getStatApi()):
+            if keyIndexList is None:
+                self.columnNames = columnList
+                rowKeyList = self.rowKey if type(self.rowKey) is list else [self.rowKey]
+                keyIndexList = [columnList.index(column) for column in rowKeyList]
+
+            # Keep the raw string values. They are only converted for the rows that changed.
+            for statValue in statValueList:
+                row = tuple(statValue[0])
+                if type(self.rowKey) is list:
+                    key = tuple([self.statObj.convertStatValue(row[index]) for index in keyIndexList])
+                else:
+                    key = self.statObj.convertStatValue(row[keyIndexList[0]])
+                currentRows[key] = row
+
+        pollTime = time.time()
+        interval = None
+        if self.previousPollTime is not None:
+            interval = pollTime - self.previousPollTime
+
+        counterIndexList = [(counter, self.columnNames.index(counter)) for counter in self.counterList
+                            if counter in self.columnNames]
+        thresholdIndexList = [(column, self.columnNames.index(column), limit) for column, limit in self.thresholds.items()
+                              if column in self.columnNames]
+
+        deltaRowList = []
+        for key, rawRow in currentRows.items():
+            previousRawRow = self.previousRows.get(key)
+            if previousRawRow == rawRow:
+                continue
+
+            row = [self.statObj.convertStatValue(value) for value in rawRow]
+            previousRow = None
+            if previousRawRow is not None:
+                previousRow = [self.statObj.convertStatValue(value) for value in previousRawRow]
+
+            crossedThresholds = []
+            for column, index, limit in thresholdIndexList:
+                if not isinstance(row[index], (int, float)):
+                    continue
+
+                previousValue = None
+                if previousRow is not None:
+                    previousValue = previousRow[index]
+
+                if row[index] >= limit and (not isinstance(previousValue, (int, float)) or previousValue < limit):
+                    crossedThresholds.append(column)
+
+            delta = {}
+            rate = {}
+            for counter, index in counterIndexList:
+                delta[counter] = 0
+                if previousRow is not None and isinstance(row[index], (int, float)) and isinstance(previousRow[index], (int, float)):
+                    delta[counter] = row[index] - previousRow[index]
+
+                rate[counter] = 0
+                if interval:
+                    rate[counter] = delta[counter] / float(interval)
+
+            deltaRowList.append({'key': key, 'values': dict(zip(self.columnNames, row)), 'delta': delta,
+                                 'rate': rate, 'crossedThresholds': crossedThresholds})
+
+        self.previousRows = currentRows
+        self.previousPollTime = pollTime
+        return deltaRowList
@@ -0,0 +1,533 @@
+
+# PLEASE READ DISCLAIMER
+#
+#    This class demonstrates sample IxNetwork REST API usage for
+#    demo and reference purpose only.
+#    It is subject to change for updates without warning.
+#
+# DESCRIPTION
+#    A client-side index of the NGPF object tree.
+#    The index is built with one deep query and the lookups are dictionary hits.
+#    Connect notifies the index whenever post/patch/delete modify the configuration
+#    so the affected Topology Group is re-queried on the next lookup.
+#
+#    topologyIndex = mainObj.getTopologyIndex()
+#    topologyIndex.getObjectByName('bgpIpv4Peer', 'bgp_2')
+#    topologyIndex.getDeviceGroupByRouterId('192.0.0.3')
+#    topologyIndex.getTopologyByPort(portName='1/1')
+#    topologyIndex.getIpAddressEntry('1.1.1.1')
+#
+
+import re
+from IxNetRestApi import IxNetRestApiException
+
+ngpfMainObjectList = ['topology', 'deviceGroup', 'routerData', 'ethernet', 'ipv4', 'ipv6',
+                      'networkGroup', 'ipv4PrefixPools', 'ipv6PrefixPools']
+
+ngpfL2ProtocolList = ['isisL3', 'lacp', 'mpls']
+
+ngpfL3ProtocolList = ['ancp', 'bfdv4Interface', 'bgpIpv4Peer', 'bgpIpv6Peer', 'dhcpv4relayAgent', 'dhcpv6relayAgent',
+                      'geneve', 'greoipv4', 'greoipv6', 'igmpHost', 'igmpQuerier',
+                      'lac', 'ldpBasicRouter', 'ldpBasicRouterV6', 'ldpConnectedInterface', 'ldpv6ConnectedInterface',
+                      'ldpTargetedRouter', 'ldpTargetedRouterV6', 'lns', 'mldHost', 'mldQuerier', 'ptp', 'ipv6sr',
+                      'openFlowController', 'openFlowSwitch', 'ospfv2', 'ospfv3', 'ovsdbcontroller', 'ovsdbserver',
+                      'pcc', 'pce', 'pcepBackupPCEs', 'pimV4Interface', 'pimV6Interface', 'rsvpteIf',
+                      'rsvpteLsps', 'tag', 'vxlan']
+
+class TopologyIndex(object):
+    # Operations that replace the whole configuration.
+    reloadOperationList = ['loadconfig', 'newconfig', 'importconfig', 'importconfigfile']
+
+    def __init__(self, ixnObj=None):
+        """
+        Description
+           An in-memory index of the NGPF object tree: href, name, parent, children and router IDs.
+
+        Parameter
+           ixnObj: (Object): The main Connect object.
+
+        Notes
+           Don't instantiate this class directly. Use mainObj.getTopologyIndex() so that a single
+           index is shared and registered to be notified of configuration changes.
+        """
+        self.ixnObj = ixnObj
+        self.objects = {}
+        self.nameIndex = {}
+        self.routerIdIndex = {}
+        self.routerIdMultivalues = {}
+        # The reverse maps so that removing or re-resolving a Device Group doesn't scan all the router IDs.
+        self.deviceGroupRouterIds = {}
+        self.deviceGroupRouterIdMultivalue = {}
+        self.routerIdMultivaluePaths = {}
+        self.unresolvedRouterIdMultivalues = set()
+        self.portIndex = None
+        self.topologyPaths = {}
+        self.isBuilt = False
+        self.dirtyTopologyList = set()
+        self.ipIndex = None
+        self.ipObjValues = {}
+
+    def setMainObject(self, mainObject):
+        """
+        Description
+            For Python Robot Framework support.
+        """
+        self.ixnObj = mainObject
+
+    def getRelativePath(self, url):
+        """
+        Description
+           Get the path after /ixnetwork without the query string.
+
+        Parameter
+           url: (str): https://{apiServerIp}/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1?includes=name
+
+        Return
+           /topology/1/deviceGroup/1 or None if the URL is not an IxNetwork session URL.
+        """
+        match = re.match('.*/api/v[0-9]+/sessions/[0-9]+/ixnetwork(/[^?]*)?$', url)
+        if match is None:
+            return None
+        return match.group(1) or '/'
+
+    def build(self):
+        """
+        Description
+           Build the index of the whole NGPF tree with one deep query.
+        """
+        self.objects = {}
+        self.nameIndex = {}
+        self.routerIdIndex = {}
+        self.routerIdMultivalues = {}
+        self.deviceGroupRouterIds = {}
+        self.deviceGroupRouterIdMultivalue = {}
+        self.routerIdMultivaluePaths = {}
+        self.unresolvedRouterIdMultivalues = set()
+        self.portIndex = None
+        self.topologyPaths = {}
+        self.dirtyTopologyList = set()
+        self._indexQuery('/', ngpfMainObjectList + ngpfL2ProtocolList + ngpfL3ProtocolList)
+        self.isBuilt = True
+
+    def _indexQuery(self, fromPath, nodeList, parentHref=None):
+        """
+        Description
+           Run one query from fromPath and add all the returned objects to the index
+           under parentHref.
+        """
+        nodes = []
+        for node in nodeList:
+            if node == 'topology':
+                properties = ['name', 'vports', 'ports']
+            elif node == 'routerData':
+                properties = ['routerId']
+            else:
+                properties = ['name']
+            nodes.append({'node': node, 'properties': properties, 'where': []})
+
+        queryResponse = self.ixnObj.query(data={'from': fromPath, 'nodes': nodes}, silentMode=True)
+        self._addChildren(queryResponse.json()['result'][0], parentHref)
+        self._resolveRouterIds()
+
+    def _addChildren(self, queryResult, parentHref):
+        for node, value in queryResult.items():
+            if type(value) is not list or node == 'links':
+                continue
+
+            for child in value:
+                if type(child) is not dict or 'href' not in child:
+                    continue
+
+                href = child['href']
+                self.objects[href] = {'href': href, 'node': node, 'name': child.get('name'), 'parent': parentHref,
+                                      'children': [], 'vports': child.get('ports') or child.get('vports') or []}
+                if parentHref in self.objects:
+                    self.objects[parentHref]['children'].append(href)
+
+                if child.get('name') is not None:
+                    self.nameIndex.setdefault((node, child['name']), []).append(href)
+
+                if node == 'topology':
+                    self.topologyPaths[self.getRelativePath(href)] = href
+
+                if node == 'routerData' and 'routerId' in child:
+                    multivalue = child['routerId']
+                    self.routerIdMultivalues[multivalue] = parentHref
+                    self.deviceGroupRouterIdMultivalue[parentHref] = multivalue
+                    self.routerIdMultivaluePaths[self.getRelativePath(multivalue)] = multivalue
+                    self.unresolvedRouterIdMultivalues.add(multivalue)
+
+                self._addChildren(child, href)
+
+    def _resolveRouterIds(self):
+        """
+        Description
+           Resolve the routerId multivalues that are not resolved yet in one bulk call.
+        """
+        multivalueList = [multivalue for multivalue in self.unresolvedRouterIdMultivalues if multivalue in self.routerIdMultivalues]
+        self.unresolvedRouterIdMultivalues = set()
+        if multivalueList == []:
+            return
+
+        for multivalue, routerIdList in self.ixnObj.getMultivalueValuesBulk(multivalueList).items():
+            deviceGroup = self.routerIdMultivalues[multivalue]
+            self.deviceGroupRouterIds[deviceGroup] = set(routerIdList)
+            for routerId in routerIdList:
+                self.routerIdIndex[routerId] = deviceGroup
+
+    def _removeSubtree(self, href):
+        entry = self.objects.pop(href, None)
+        if entry is None:
+            return
+
+        if entry['node'] == 'topology':
+            self.topologyPaths.pop(self.getRelativePath(href), None)
+
+        for child in entry['children']:
+            self._removeSubtree(child)
+
+        if entry['parent'] in self.objects:
+            self.objects[entry['parent']]['children'].remove(href)
+
+        if entry['name'] is not None:
+            hrefList = self.nameIndex.get((entry['node'], entry['name']), [])
+            if href in hrefList:
+                hrefList.remove(href)
+
+        for routerId in self.deviceGroupRouterIds.pop(href, []):
+            if self.routerIdIndex.get(routerId) == href:
+                del self.routerIdIndex[routerId]
+
+        multivalue = self.deviceGroupRouterIdMultivalue.pop(href, None)
+        if multivalue is not None:
+            self.routerIdMultivalues.pop(multivalue, None)
+            self.routerIdMultivaluePaths.pop(self.getRelativePath(multivalue), None)
+            self.unresolvedRouterIdMultivalues.discard(multivalue)
+
+    def refresh(self):
+        """
+        Description
+           Rebuild what was invalidated since the last lookup.
+           Only the modified Topology Groups are re-queried.
+        """
+        if self.isBuilt == False:
+            self.build()
+            return
+
+        for topologyObj in list(self.dirtyTopologyList):
+            self._removeSubtree(topologyObj)
+            response = self.ixnObj.get(self.ixnObj.httpHeader+topologyObj, silentMode=True, ignoreError=True)
+            if str(response.status_code).startswith('2'):
+                topology = dict((key, response.json().get(key)) for key in ['name', 'vports', 'ports'])
+                self._addChildren({'topology': [dict(topology, href=topologyObj)]}, None)
+                self._indexQuery(self.getRelativePath(topologyObj), ngpfMainObjectList[1:] + ngpfL2ProtocolList + ngpfL3ProtocolList,
+                                 parentHref=topologyObj)
+
+            self.dirtyTopologyList.discard(topologyObj)
+            self.portIndex = None
+
+    def invalidate(self, method, url):
+        """
+        Description
+           Invalidate the part of the index affected by a configuration change.
+           Connect calls this after each successful POST, PATCH and DELETE.
+
+        Parameters
+           method: (str): POST|PATCH|DELETE
+           url: (str): The REST API URL that was modified.
+        """
+        path = self.getRelativePath(url)
+        if path is None:
+            return
+
+        match = re.match('.*/operations/([^/]+)', path)
+        if match:
+            if match.group(1).lower() in self.reloadOperationList:
+                self.isBuilt = False
+                self.ipIndex = None
+            return
+
+        if path.startswith('/topology') or path.startswith('/multivalue'):
+            # The IP addresses could have changed anywhere. The IP index is rebuilt on the next IP lookup.
+            # The IP index is built independently of the object index, so drop it even if that isn't built.
+            self.ipIndex = None
+
+        if self.isBuilt == False:
+            return
+
+        if path.startswith('/vport'):
+            self.portIndex = None
+            return
+
+        match = re.match('(/multivalue/[0-9]+)', path)
+        if match:
+            multivalue = self.routerIdMultivaluePaths.get(match.group(1))
+            if multivalue is not None:
+                self.dirtyTopologyList.add(self._getAncestor(self.routerIdMultivalues[multivalue], 'topology'))
+            return
+
+        match = re.match('(/topology/[0-9]+)', path)
+        if match and match.group(1) in self.topologyPaths:
+            self.dirtyTopologyList.add(self.topologyPaths[match.group(1)])
+            return
+
+        if path.startswith('/topology'):
+            # A new Topology Group
+            self.isBuilt = False
+
+    def _buildPortIndex(self):
+        response = self.ixnObj.get(self.ixnObj.sessionUrl+'/vport', silentMode=True)
+        vportDict = dict((vport['links'][0]['href'], vport) for vport in response.json())
+
+        self.portIndex = {}
+        for href, entry in self.objects.items():
+            if entry['node'] != 'topology':
+                continue
+            for vportObj in entry['vports']:
+                if vportObj not in vportDict:
+                    continue
+                self.portIndex[('portName', vportDict[vportObj]['name'])] = href
+                if vportDict[vportObj]['assignedTo']:
+                    self.portIndex[('port', vportDict[vportObj]['assignedTo'])] = href
+
+    def normalizeIpAddress(self, ipAddress):
+        """
+        Description
+           IPv6 addresses are compared in the exploded format so that 2000::1 and
+           2000:0:0:0:0:0:0:1 are the same address. Python 2 compares them as is.
+        """
+        if ':' not in ipAddress:
+            return ipAddress
+
+        try:
+            import ipaddress
+            return ipaddress.ip_address(u'{0}'.format(ipAddress)).exploded
+        except (ImportError, ValueError):
+            return ipAddress
+
+    def _buildIpIndex(self):
+        """
+        Description
+           Index all the IPv4/IPv6 addresses, gateway IPs and prefix pool network addresses
+           with one query and one bulk multivalue call.
+        """
+        nodes = [{'node': 'topology', 'properties': [], 'where': []},
+                 {'node': 'deviceGroup', 'properties': [], 'where': []},
+                 {'node': 'ethernet', 'properties': [], 'where': []},
+                 {'node': 'ipv4', 'properties': ['address', 'gatewayIp'], 'where': []},
+                 {'node': 'ipv6', 'properties': ['address', 'gatewayIp'], 'where': []},
+                 {'node': 'networkGroup', 'properties': [], 'where': []},
+                 {'node': 'ipv4PrefixPools', 'properties': ['networkAddress'], 'where': []},
+                 {'node': 'ipv6PrefixPools', 'properties': ['networkAddress'], 'where': []}]
+        queryResponse = self.ixnObj.query(data={'from': '/', 'nodes': nodes}, silentMode=True)
+
+        # (multivalue, addressType, entry)
+        multivalueList = []
+        def findIpObjects(queryResult, parents):
+            for node, value in queryResult.items():
+                if type(value) is not list or node == 'links':
+                    continue
+
+                for child in value:
+                    if type(child) is not dict or 'href' not in child:
+                        continue
+
+                    childParents = dict(parents)
+                    if node in ['topology', 'deviceGroup', 'networkGroup']:
+                        childParents[node] = child['href']
+
+                    for addressType in ['address', 'gatewayIp', 'networkAddress']:
+                        if addressType in child:
+                            entry = {'topology': childParents.get('topology'), 'deviceGroup': childParents.get('deviceGroup'),
+                                     'networkGroup': childParents.get('networkGroup'), 'ipObj': child['href'], 'node': node}
+                            multivalueList.append((child[addressType], addressType, entry))
+
+                    findIpObjects(child, childParents)
+
+        findIpObjects(queryResponse.json()['result'][0], {})
+        multivalueValues = self.ixnObj.getMultivalueValuesBulk([multivalue for multivalue, addressType, entry in multivalueList])
+
+        self.ipIndex = {}
+        self.ipObjValues = {}
+        for multivalue, addressType, entry in multivalueList:
+            self.ipObjValues[(entry['ipObj'], addressType)] = multivalueValues[multivalue]
+            for index, ipAddress in enumerate(multivalueValues[multivalue]):
+                # The index is based one like the IxNetwork GUI device index.
+                self.ipIndex.setdefault((addressType, self.normalizeIpAddress(ipAddress)), []).append(dict(entry, index=index+1))
+
+    def getIpAddressEntries(self, ipAddress, addressType='address'):
+        """
+        Description
+           Get every device that has the IP address.
+
+        Parameters
+           ipAddress: (str): The IPv4 or IPv6 address.
+           addressType: (str): address: The IPv4/IPv6 interface address.
+                               gatewayIp: The IPv4/IPv6 gateway IP.
+                               networkAddress: The IPv4/IPv6 prefix pool network address.
+
+        Return
+           A list of {'topology', 'deviceGroup', 'networkGroup', 'ipObj', 'node', 'index'}
+              ipObj: The ipv4, ipv6, ipv4PrefixPools or ipv6PrefixPools object handle.
+              node: ipv4|ipv6|ipv4PrefixPools|ipv6PrefixPools
+              index: The based one index of the address in the multivalue.
+              networkGroup: Only for the networkAddress.
+        """
+        # The IP index has its own query. It doesn't need the object index to be built.
+        if self.ipIndex is None:
+            self._buildIpIndex()
+
+        return self.ipIndex.get((addressType, self.normalizeIpAddress(ipAddress)), [])
+
+    def getIpObjectValues(self, ipObj, addressType='address'):
+        """
+        Description
+           Get the indexed address, gatewayIp or networkAddress values of an IP object.
+           For example the gateway IP of the device at an index:
+              entry = topologyIndex.getIpAddressEntry('1.1.1.1')
+              topologyIndex.getIpObjectValues(entry['ipObj'], 'gatewayIp')[entry['index']-1]
+
+        Return
+           The list of values or None if the IP object is not indexed.
+        """
+        self.getIpAddressEntries('', addressType=addressType)
+        return self.ipObjValues.get((ipObj, addressType))
+
+    def getIpAddressEntry(self, ipAddress, addressType='address'):
+        """
+        Description
+           Get the first device that has the IP address. See getIpAddressEntries.
+
+        Return
+           {'topology', 'deviceGroup', 'networkGroup', 'ipObj', 'node', 'index'} or None
+        """
+        entryList = self.getIpAddressEntries(ipAddress, addressType=addressType)
+        if entryList:
+            return entryList[0]
+        return None
+
+    def getObjectByName(self, ngpfEndpointObject, ngpfEndpointName):
+        """
+        Description
+           Get the NGPF object handle by its name.
+
+        Parameters
+           ngpfEndpointObject: (str): topology, deviceGroup, ethernet, ipv4, bgpIpv4Peer, etc.
+           ngpfEndpointName: (str): The name of the NGPF object. If there is no exact match,
+                                    the name is matched as a regex like the query API does.
+
+        Return
+           The object handle or None
+        """
+        self.refresh()
+        hrefList = self.nameIndex.get((ngpfEndpointObject, ngpfEndpointName))
+        if hrefList:
+            return hrefList[0]
+
+        for (node, name), hrefList in self.nameIndex.items():
+            if node == ngpfEndpointObject and hrefList and re.search(ngpfEndpointName, name):
+                return hrefList[0]
+        return None
+
+    def getDeviceGroupByRouterId(self, routerId):
+        """
+        Description
+           Get the Device Group object handle that has the routerId.
+
+        Return
+           The Device Group object handle or None
+        """
+        self.refresh()
+        return self.routerIdIndex.get(routerId)
+
+    def getObjectByRouterId(self, ngpfEndpointObject, routerId):
+        """
+        Description
+           Get the first ngpfEndpointObject object handle in the Device Group that has the routerId.
+
+        Return
+           The object handle or None
+        """
+        deviceGroupObj = self.getDeviceGroupByRouterId(routerId)
+        if deviceGroupObj is None:
+            return None
+
+        if ngpfEndpointObject == 'deviceGroup':
+            return deviceGroupObj
+
+        if ngpfEndpointObject == 'topology':
+            return self.getParent(deviceGroupObj, 'topology')
+
+        for href in self.getDescendants(deviceGroupObj):
+            if self.objects[href]['node'] == ngpfEndpointObject:
+                return href
+        return None
+
+    def getTopologyByPort(self, port=None, portName=None):
+        """
+        Description
+           Get the Topology Group object handle that is using the port or the vport name.
+
+        Parameters
+           port: (list): [chassisIp, cardNumber, portNumber]
+           portName: (str): The vport name.
+
+        Return
+           The Topology Group object handle or None
+        """
+        self.refresh()
+        if self.portIndex is None:
+            self._buildPortIndex()
+
+        if portName is not None:
+            return self.portIndex.get(('portName', portName))
+        return self.portIndex.get(('port', ':'.join([str(item) for item in port])))
+
+    def getChildren(self, href, ngpfEndpointObject=None):
+        """
+        Description
+           Get the child object handles, optionally filtered by the NGPF endpoint name.
+        """
+        self.refresh()
+        return [child for child in self.objects[href]['children']
+                if ngpfEndpointObject is None or self.objects[child]['node'] == ngpfEndpointObject]
+
+    def getDescendants(self, href):
+        """
+        Description
+           Get all the object handles under the href, depth first.
+        """
+        self.refresh()
+        descendantList = []
+        for child in self.objects[href]['children']:
+            descendantList.append(child)
+            descendantList += self.getDescendants(child)
+        return descendantList
+
+    def getParent(self, href, ngpfEndpointObject=None):
+        """
+        Description
+           Get the parent object handle.  If ngpfEndpointObject is provided, get the nearest
+           ancestor of that NGPF endpoint type.
+        """
+        self.refresh()
+        if ngpfEndpointObject is None:
+            return self.objects[href]['parent']
+        return self._getAncestor(href, ngpfEndpointObject)
+
+    def _getAncestor(self, href, ngpfEndpointObject):
+        parent = self.objects[href]['parent']
+        while parent is not None and self.objects[parent]['node'] != ngpfEndpointObject:
+            parent = self.objects[parent]['parent']
+        return parent
+
+    def getObject(self, href):
+        """
+        Description
+           Get the index entry of an object handle:
+           {'href', 'node', 'name', 'parent', 'children', 'vports'}
+        """
+        self.refresh()
+        if href not in self.objects:
+            raise IxNetRestApiException('TopologyIndex: No such object: {0}'.format(href))
+        return self.objects[href]
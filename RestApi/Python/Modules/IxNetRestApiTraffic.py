@@ -405,6 +405,26 @@ class Traffic(object):
         if frameRateDistribution != {}:
             self.ixnObj.patch(configElementObj+'/frameRateDistribution', data=frameRateDistribution)        
 
+    def createTrafficItems(self, trafficItemList, timeout=90):
+        """
+        Description
+            Create many Traffic Items with one JSON config import.
+            This is much faster than calling configTrafficItem(mode='create') for each Traffic Item.
+
+        Parameters
+            trafficItemList: <list>: [{'trafficItem': {}, 'endpoints': [], 'configElements': []}, ...]
+                             The kwargs are the same as configTrafficItem(mode='create').
+            timeout: <int>: The importconfig timeout in seconds.
+
+        Return
+            A list of [trafficItemObj, endpointSetObjList, configElementObjList] for each Traffic Item.
+        """
+        builder = TrafficItemBuilder(self.ixnObj)
+        for eachTrafficItem in trafficItemList:
+            builder.addTrafficItem(eachTrafficItem['trafficItem'], eachTrafficItem['endpoints'],
+                                   eachTrafficItem.get('configElements', None))
+        return builder.build(timeout=timeout)
+
     def getConfigElementObj(self, trafficItemObj=None, trafficItemName=None, endpointSetName=None):
         """
         Description
@@ -492,7 +512,7 @@ class Traffic(object):
 
             queryResponse = self.ixnObj.query(data=queryData)
             configElementObj = queryResponse.json()['result'][0]['trafficItem'][0]['configElement'][0]['href']
-            print(configElementObj)
+            self.ixnObj.logDebug(str(configElementObj))
             return configElementObj
 
     def getTransmissionType(self, configElement):
@@ -1107,7 +1127,7 @@ class Traffic(object):
     def disablePacketLossDuration(self):
         self.ixnObj.patch(self.ixnObj.sessionUrl+'/traffic/statistics/packetLossDuration', data={'enabled': 'false'})
 
-    def checkTrafficState(self, expectedState=['stopped'], timeout=60, ignoreException=False):
+    def checkTrafficState(self, expectedState=['stopped'], timeout=60, ignoreException=False, settleTime=0):
         """
         Description
             Check the traffic state for the expected state.
@@ -1128,6 +1148,10 @@ class Traffic(object):
 
             ignoreException: <bool>: If True, return 1 as failed, and don't raise an Exception.
 
+            settleTime: <int>: Seconds to wait after the expected state is reached. Defaults to 0.
+                        The stat readers wait for the stat view to be ready, but not for the counters
+                        to settle. Use stopTraffic or waitForTrafficStatsToSettle to read the final counters.
+
         Return
             1: If failed.
         """
@@ -1135,9 +1159,12 @@ class Traffic(object):
             expectedState.split(' ')
 
         self.ixnObj.logInfo('checkTrafficState: Expecting state: {0}\n'.format(expectedState))
-        for counter in range(1,timeout+1):
+        trafficState = []
+
+        def isTrafficStateExpected():
             response = self.ixnObj.get(self.ixnObj.sessionUrl+'/traffic', silentMode=True)
             currentTrafficState = response.json()['state']
+            trafficState[:] = [currentTrafficState]
             if currentTrafficState == 'unapplied':
                 self.ixnObj.logWarning('\nCheckTrafficState: Traffic is UNAPPLIED')
                 self.applyTraffic()
@@ -1145,20 +1172,18 @@ class Traffic(object):
             self.ixnObj.logInfo('\ncheckTrafficState: {trafficState}: Expecting: {expectedStates}.'.format(trafficState=currentTrafficState,
                                                                                                            expectedStates=expectedState),
                                 timestamp=False)
-            self.ixnObj.logInfo('\tWaited {counter}/{timeout} seconds'.format(counter=counter, timeout=timeout), timestamp=False)
-            
-            if counter <= timeout and currentTrafficState not in expectedState:
-                time.sleep(1)
-                continue
+            return currentTrafficState in expectedState
+
+        if self.ixnObj.waitFor(isTrafficStateExpected, timeout=timeout, description='Traffic state: %s' % expectedState,
+                               ignoreException=True):
+            if settleTime:
+                time.sleep(settleTime)
+            self.ixnObj.logInfo('checkTrafficState: Done\n')
+            return 0
 
-            if counter <= timeout and currentTrafficState in expectedState:
-                time.sleep(8)
-                self.ixnObj.logInfo('checkTrafficState: Done\n')
-                return 0
-        
         if ignoreException == False:
             raise IxNetRestApiException('checkTrafficState: Traffic state did not reach the expected state(s): {0}. It is at: {1}'.format(
-                expectedState, currentTrafficState))
+                expectedState, trafficState[0]))
         else:
             return 1
 
@@ -1385,13 +1410,16 @@ class Traffic(object):
             response = self.ixnObj.post(url, data={'arg1': enabledTrafficItemList})
             self.ixnObj.waitForComplete(response, url + '/' + response.json()['id'], timeout=120)
 
-    def stopTraffic(self, blocking=False):
+    def stopTraffic(self, blocking=False, waitForStatsToSettle=True):
         """
         Description
             Stop traffic and verify traffic has stopped.
+            Then wait for the Tx and Rx frame counters to stop changing so that the frames
+            that were still in flight are counted before the stats are read.
 
         Parameters
            blocking: <bool>: True=Synchronous mode. Server will not accept APIs until the process is complete.
+           waitForStatsToSettle: <bool>: True=Wait for the counters to settle. See waitForTrafficStatsToSettle.
 
         Syntax
             For blocking state:
@@ -1421,7 +1449,53 @@ class Traffic(object):
             self.ixnObj.waitForComplete(response, url + '/' + response.json()['id'], timeout=120)
 
         self.checkTrafficState(expectedState=['stopped'])
-        time.sleep(3)
+        if waitForStatsToSettle:
+            self.waitForTrafficStatsToSettle()
+
+    def waitForTrafficStatsToSettle(self, viewName='Traffic Item Statistics', counterList=['Tx Frames', 'Rx Frames'],
+                                    settleInterval=2, timeout=30):
+        """
+        Description
+            Wait until the counters of a stat view are the same in two reads settleInterval seconds apart.
+            After stopping traffic, the frames in flight are still counted for a moment.
+
+        Parameters
+            viewName: <str>: The stat view caption.
+            counterList: <list>: The counter columns to compare.
+            settleInterval: <int>: The seconds between two reads. Use at least the stat view refresh interval.
+            timeout: <int>: The maximum seconds to wait. A warning is logged if the counters are still changing.
+
+        Return
+            True if the counters settled. False otherwise.
+        """
+        from IxNetRestApiStatistics import Statistics
+
+        statObj = Statistics(self.ixnObj)
+        # Don't wait for the view to be created. There is nothing to settle without it.
+        viewObject = statObj.refreshViewObjectCache().get(viewName)
+        if viewObject is None:
+            return True
+
+        previousCounters = []
+
+        def isSettled():
+            statColumns = statObj.getStatsColumns(viewObject=viewObject, viewName=viewName)
+            if not statColumns:
+                # Nothing to wait for.
+                return True
+
+            counters = [statColumns.get(counter) for counter in counterList]
+            settled = previousCounters == [counters]
+            previousCounters[:] = [counters]
+            return settled
+
+        if self.ixnObj.waitFor(isSettled, timeout=timeout, description='Stats settled: %s' % viewName, ignoreException=True,
+                               initialInterval=settleInterval, maxInterval=settleInterval):
+            return True
+
+        self.ixnObj.logWarning('waitForTrafficStatsToSettle: The {0} counters are still changing after {1} seconds'.format(
+            viewName, timeout))
+        return False
 
     def showTrafficItems(self):
         """
@@ -1545,3 +1619,265 @@ class Traffic(object):
 
 
 
+
+class TrafficItemBuilder(object):
+    # configElements keys mapped to the configElement child node and attribute in the JSON config.
+    # transmissionType is not an attribute in configElement. It is the transmissionControl type.
+    configElementAttributeMap = {'transmissionType':          ('transmissionControl', 'type', str),
+                                 'type':                      ('transmissionControl', 'type', str),
+                                 'burstPacketCount':          ('transmissionControl', 'burstPacketCount', int),
+                                 'duration':                  ('transmissionControl', 'duration', int),
+                                 'frameCount':                ('transmissionControl', 'frameCount', int),
+                                 'interBurstGap':             ('transmissionControl', 'interBurstGap', int),
+                                 'interStreamGap':            ('transmissionControl', 'interStreamGap', int),
+                                 'iterationCount':            ('transmissionControl', 'iterationCount', int),
+                                 'minGapBytes':               ('transmissionControl', 'minGapBytes', int),
+                                 'repeatBurst':               ('transmissionControl', 'repeatBurst', int),
+                                 'startDelay':                ('transmissionControl', 'startDelay', int),
+                                 'enableInterBurstGap':       ('transmissionControl', 'enableInterBurstGap', str),
+                                 'enableInterStreamGap':      ('transmissionControl', 'enableInterStreamGap', str),
+                                 'interBurstGapUnits':        ('transmissionControl', 'interBurstGapUnits', str),
+                                 'startDelayUnits':           ('transmissionControl', 'startDelayUnits', str),
+                                 'frameRateType':             ('frameRate', 'type', str),
+                                 'frameRate':                 ('frameRate', 'rate', float),
+                                 'frameRateBitRateUnitsType': ('frameRate', 'bitRateUnitsType', str),
+                                 'frameSize':                 ('frameSize', 'fixedSize', int),
+                                 'frameSizeType':             ('frameSize', 'type', str),
+                                 'incrementFrom':             ('frameSize', 'incrementFrom', int),
+                                 'incrementTo':               ('frameSize', 'incrementTo', int),
+                                 'portDistribution':          ('frameRateDistribution', 'portDistribution', str),
+                                 'streamDistribution':        ('frameRateDistribution', 'streamDistribution', str)}
+
+    endpointAttributeList = ['name', 'sources', 'destinations', 'multicastDestinations', 'multicastReceivers',
+                             'scalableSources', 'scalableDestinations']
+
+    def __init__(self, ixnObj=None):
+        """
+        Description
+           Create many Traffic Items with one JSON config import instead of the POST, GET and
+           PATCH requests that configTrafficItem sends for each Traffic Item, endpointSet,
+           configElement and tracking.
+
+           Add the Traffic Items with addTrafficItem. Nothing is sent to the API server until build().
+           The parameters are the same as Traffic.configTrafficItem(mode='create').
+
+        Parameter
+           ixnObj: The main connection object.
+
+        Example
+           builder = TrafficItemBuilder(mainObj)
+           for index in range(500):
+               builder.addTrafficItem(trafficItem={'name': 'Flow %s' % index, 'trafficType': 'ipv4', 'trackBy': ['flowGroup0']},
+                                      endpoints=[{'name': 'Flow-Group-1', 'sources': [topologyObj1], 'destinations': [topologyObj2]}],
+                                      configElements=[{'transmissionType': 'fixedFrameCount', 'frameCount': 50000,
+                                                       'frameRate': 10, 'frameRateType': 'percentLineRate', 'frameSize': 128}])
+           for trafficItemObj, endpointSetObjList, configElementObjList in builder.build():
+               ...
+        """
+        self.ixnObj = ixnObj
+        self.trafficItemList = []
+
+    def setMainObject(self, mainObject):
+        # For Python Robot Framework support
+        self.ixnObj = mainObject
+
+    def addTrafficItem(self, trafficItem, endpoints, configElements=None):
+        """
+        Description
+           Add a Traffic Item to create on the next build().
+
+        Parameters
+           trafficItem: <dict>: Traffic Item kwargs including the optional trackBy list.
+           endpoints: <list>: [{'name':, 'sources': [], 'destinations': [], 'highLevelStreamElements': None}, ...]
+                              The sources and destinations could be object hrefs or JSON xpaths:
+                                 /api/v1/sessions/1/ixnetwork/topology/1 or /topology[1]
+           configElements: <list>: Config Element kwargs aligned to the endpoint list.
+                                   Provide one to apply it to all the endpoints.
+                                   Ignored if the endpoints include highLevelStreamElements.
+
+        Return
+           The amount of Traffic Items added.
+        """
+        if type(endpoints) != list:
+            raise IxNetRestApiException('addTrafficItem error: Provide endpoints in a list')
+
+        if configElements != None and type(configElements) != list:
+            raise IxNetRestApiException('addTrafficItem error: Provide configElements in a list')
+
+        self.trafficItemList.append({'trafficItem': dict(trafficItem), 'endpoints': endpoints,
+                                     'configElements': configElements})
+        return len(self.trafficItemList)
+
+    def clear(self):
+        """
+        Description
+           Remove all the Traffic Items added since the last build().
+        """
+        self.trafficItemList = []
+
+    def getXpath(self, obj):
+        """
+        Description
+           Convert an object href to the JSON config xpath.
+
+        Parameter
+           obj: <str>: /api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/2
+                       An xpath such as /topology[1]/deviceGroup[2] is returned as is.
+
+        Return
+           /topology[1]/deviceGroup[2]
+        """
+        if '[' in obj:
+            return obj
+
+        path = re.sub('.*/ixnetwork(?=/)', '', obj)
+        return re.sub('/([^/]+)/([0-9]+)', r'/\1[\2]', path)
+
+    def getConfigElementData(self, xpath, configElements):
+        """
+        Description
+           Get the JSON config of a configElement or highLevelStream.
+
+        Parameters
+           xpath: <str>: /traffic/trafficItem[1]/configElement[1]
+           configElements: <dict>: Config Element kwargs. See Traffic.configConfigElements.
+        """
+        data = {'xpath': xpath}
+        for key, value in configElements.items():
+            if key not in self.configElementAttributeMap:
+                raise IxNetRestApiException('TrafficItemBuilder: Unknown configElements attribute: %s' % key)
+
+            childNode, attribute, attributeType = self.configElementAttributeMap[key]
+            if childNode not in data:
+                data[childNode] = {'xpath': xpath+'/'+childNode}
+
+            # An explicit type overrides the descriptive transmissionType
+            if key == 'transmissionType' and 'type' in configElements:
+                continue
+
+            data[childNode][attribute] = attributeType(value)
+
+        return data
+
+    def getJsonConfig(self, trafficItemId=1):
+        """
+        Description
+           Get the JSON config of the added Traffic Items.
+
+        Parameter
+           trafficItemId: <int>: The Traffic Item ID of the first added Traffic Item.
+
+        Return
+           A list of Traffic Item xpath objects for FileMgmt.importJsonConfigObj.
+        """
+        jsonConfig = []
+        for index, eachTrafficItem in enumerate(self.trafficItemList):
+            trafficItemXpath = '/traffic/trafficItem[%s]' % (trafficItemId + index)
+            trafficItemData = {'xpath': trafficItemXpath}
+            for key, value in eachTrafficItem['trafficItem'].items():
+                if key != 'trackBy':
+                    trafficItemData[key] = value
+
+            endpointSetList = []
+            highLevelStreamList = []
+            for endpointIndex, endpoint in enumerate(eachTrafficItem['endpoints'], start=1):
+                endpointSetData = {'xpath': trafficItemXpath+'/endpointSet[%s]' % endpointIndex}
+                for key in self.endpointAttributeList:
+                    if key not in endpoint:
+                        continue
+                    if key == 'name':
+                        endpointSetData[key] = endpoint[key]
+                    else:
+                        endpointSetData[key] = [self.getXpath(obj) for obj in endpoint[key]]
+
+                endpointSetList.append(endpointSetData)
+
+                # An endpoint flow group could have two highLevelStreams if bi-directional is enabled.
+                if endpoint.get('highLevelStreamElements') not in [None, {}]:
+                    for eachHighLevelStream in endpoint['highLevelStreamElements']:
+                        streamXpath = trafficItemXpath+'/highLevelStream[%s]' % (len(highLevelStreamList) + 1)
+                        highLevelStreamList.append(self.getConfigElementData(streamXpath, eachHighLevelStream))
+
+            trafficItemData['endpointSet'] = endpointSetList
+
+            # Don't configure config elements if the highLevelStreams are configured.
+            configElements = eachTrafficItem['configElements']
+            if highLevelStreamList:
+                trafficItemData['highLevelStream'] = highLevelStreamList
+            elif configElements:
+                configElementList = []
+                for endpointIndex in range(1, len(endpointSetList) + 1):
+                    if len(configElements) == len(endpointSetList):
+                        eachConfigElement = configElements[endpointIndex - 1]
+                    else:
+                        eachConfigElement = configElements[0]
+
+                    configElementXpath = trafficItemXpath+'/configElement[%s]' % endpointIndex
+                    configElementList.append(self.getConfigElementData(configElementXpath, eachConfigElement))
+
+                trafficItemData['configElement'] = configElementList
+
+            if 'trackBy' in eachTrafficItem['trafficItem']:
+                trafficItemData['tracking'] = [{'xpath': trafficItemXpath+'/tracking',
+                                                'trackBy': eachTrafficItem['trafficItem']['trackBy']}]
+
+            jsonConfig.append(trafficItemData)
+
+        return jsonConfig
+
+    def getTrafficItemHrefList(self):
+        """
+        Description
+           Get the Traffic Items with one query.
+
+        Return
+           The query result list: [{'href':, 'endpointSet': [{'href':}], 'configElement': [{'href':}]}]
+        """
+        queryData = {'from': '/traffic',
+                     'nodes': [{'node': 'trafficItem', 'properties': [], 'where': []},
+                               {'node': 'endpointSet', 'properties': [], 'where': []},
+                               {'node': 'configElement', 'properties': [], 'where': []}]}
+        queryResponse = self.ixnObj.query(data=queryData, silentMode=True)
+        return queryResponse.json()['result'][0].get('trafficItem', [])
+
+    def build(self, timeout=90):
+        """
+        Description
+           Create all the added Traffic Items with one resourceManager importconfig operation.
+
+        Parameter
+           timeout: <int>: The importconfig timeout in seconds.
+
+        Return
+           A list of [trafficItemObj, endpointSetObjList, configElementObjList] in the order the
+           Traffic Items were added.
+        """
+        from IxNetRestApiFileMgmt import FileMgmt
+
+        if self.trafficItemList == []:
+            return []
+
+        # The new Traffic Item IDs continue after the highest existing ID.
+        existingTrafficItemList = [eachTrafficItem['href'] for eachTrafficItem in self.getTrafficItemHrefList()]
+        trafficItemIdList = [int(trafficItemObj.split('/')[-1]) for trafficItemObj in existingTrafficItemList]
+        trafficItemId = max(trafficItemIdList) + 1 if trafficItemIdList else 1
+
+        self.ixnObj.logInfo('TrafficItemBuilder: Creating %s Traffic Items' % len(self.trafficItemList))
+        jsonConfig = self.getJsonConfig(trafficItemId=trafficItemId)
+        FileMgmt(self.ixnObj).importJsonConfigObj(dataObj=jsonConfig, option='modify', silentMode=True, timeout=timeout)
+
+        trafficItemObjList = []
+        for eachTrafficItem in self.getTrafficItemHrefList():
+            if eachTrafficItem['href'] in existingTrafficItemList:
+                continue
+
+            trafficItemObjList.append([eachTrafficItem['href'],
+                                       [endpointSet['href'] for endpointSet in eachTrafficItem.get('endpointSet', [])],
+                                       [configElement['href'] for configElement in eachTrafficItem.get('configElement', [])]])
+
+        if len(trafficItemObjList) != len(self.trafficItemList):
+            raise IxNetRestApiException('TrafficItemBuilder: Expected %s new Traffic Items. Found %s' % (
+                len(self.trafficItemList), len(trafficItemObjList)))
+
+        self.clear()
+        return trafficItemObjList
@@ -0,0 +1,111 @@
+
+# PLEASE READ DISCLAIMER
+#
+#    This class demonstrates sample IxNetwork REST API usage for
+#    demo and reference purpose only.
+#    It is subject to change for updates without warning.
+#
+# DESCRIPTION
+#    The HTTP transport shared by the REST API helpers.
+#    A requests.Session with a sized connection pool, HTTP keep-alive and
+#    retries with backoff on connection resets and 5xx responses.
+#
+#    This module only depends on requests so that standalone scripts could use it too:
+#       sys.path.insert(0, <path to RestApi/Python/Modules>)
+#       from IxNetRestApiTransport import Transport
+#       restSession = Transport.getSharedSession()
+#
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+class Transport(object):
+    # Sessions shared by all the callers with the same settings.
+    sharedSessions = {}
+
+    def __init__(self, poolConnections=10, poolMaxSize=10, poolBlock=False, maxRetries=3, backoffFactor=0.3,
+                 retryStatusList=[500, 502, 503, 504], keepAlive=True):
+        """
+        Description
+           The HTTP transport settings.
+
+        Parameters
+           poolConnections: (int): The amount of hosts to keep a connection pool for.
+                                   The API server, Linux chassis and license server each count as one host.
+           poolMaxSize: (int): The maximum amount of connections kept open to each host.
+                               Size it to the amount of parallel callers. For example the
+                               AsyncConnect maxConcurrent.
+           poolBlock: (bool): True: Wait for a free connection when all the connections to a host are in use.
+                              False: Open an extra connection that is not kept after the request.
+           maxRetries: (int): Retries on connection errors and on the retryStatusList status codes.
+                              0 disables the retries.
+           backoffFactor: (float): Sleep backoffFactor * (2 ** (retry - 1)) seconds between retries.
+           retryStatusList: (list): The status codes to retry.
+                                    Only GET, PUT, DELETE, OPTIONS and HEAD are retried on a status code.
+                                    POST and PATCH are only retried if the connection failed before sending them.
+           keepAlive: (bool): True: Reuse the connections (HTTP keep-alive). This avoids a TLS handshake for
+                                    each request to the Linux API server.
+                              False: Close the connection after each request.
+        """
+        self.poolConnections = poolConnections
+        self.poolMaxSize = poolMaxSize
+        self.poolBlock = poolBlock
+        self.maxRetries = maxRetries
+        self.backoffFactor = backoffFactor
+        self.retryStatusList = retryStatusList
+        self.keepAlive = keepAlive
+
+    def getSettings(self):
+        """
+        Description
+           The transport settings as a dict that could be passed to Transport(**settings).
+        """
+        return {'poolConnections': self.poolConnections, 'poolMaxSize': self.poolMaxSize, 'poolBlock': self.poolBlock,
+                'maxRetries': self.maxRetries, 'backoffFactor': self.backoffFactor,
+                'retryStatusList': self.retryStatusList, 'keepAlive': self.keepAlive}
+
+    def createSession(self):
+        """
+        Description
+           Create a requests.Session using the transport settings.
+
+        Return
+           The requests.Session object.
+        """
+        # raise_on_status=False: Return the last response after the retries so that the callers
+        # verify the status code and show the API server error message like they always did.
+        retry = Retry(total=self.maxRetries, connect=self.maxRetries, read=self.maxRetries, status=self.maxRetries,
+                      backoff_factor=self.backoffFactor, status_forcelist=self.retryStatusList, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self.poolConnections, pool_maxsize=self.poolMaxSize,
+                              pool_block=self.poolBlock, max_retries=retry)
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if self.keepAlive == False:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    @classmethod
+    def getSharedSession(cls, **settings):
+        """
+        Description
+           Get the requests.Session shared by all the callers using the same settings.
+           Use this in helpers and standalone scripts instead of calling requests.get/post directly
+           so that the connections are kept open and reused.
+
+        Parameters
+           settings: The Transport parameters. Defaults are used for the ones not provided.
+
+        Example
+           restSession = Transport.getSharedSession(poolMaxSize=20)
+           response = restSession.get(sessionUrl+'/vport')
+        """
+        transport = cls(**settings)
+        key = str(sorted(transport.getSettings().items()))
+        if key not in cls.sharedSessions:
+            cls.sharedSessions[key] = transport.createSession()
+
+        return cls.sharedSessions[key]
@@ -79,7 +79,7 @@ import os, sys, requests, json, time, re, datetime, traceback
 
 sys.path.insert(0, '../../Modules')
 from IxNetRestApi import *
-from IxNetRestApiStatistics import Statistics
+from IxNetRestApiStatistics import Statistics, StatDelta
 from IxNetRestApiTraffic import Traffic
 
 class Variables():
@@ -95,6 +95,7 @@ class Variables():
     jsonData= {}
     statObj = None
     trafficObj = None
+    trafficStatDeltaObj = None
 
     # These two variables are reserved for connecting to a Linux API server.
     # Send email alerts
@@ -186,6 +187,9 @@ def connect():
     Variables.statObj = statObj
     Variables.trafficObj = trafficObj
 
+    # Only the Traffic Items with new stats since the last interval are returned.
+    Variables.trafficStatDeltaObj = StatDelta(statObj, viewName='Traffic Item Statistics', rowKey='Traffic Item')
+
 def writeToJson(monitoring):
     if monitoring == 'traffic':
         jsonFile = Variables.jsonFileForTraffic
@@ -222,21 +226,22 @@ def sendEmail(emailTo, bodyMessage):
 
 def monitorTraffic():
     #stats = Variables.sessionObj.getStats(viewName='Traffic Item Statistics', displayStats=False, silentMode=True)
-    stats = Variables.statObj.getStats(viewName='Traffic Item Statistics', displayStats=False, silentMode=True)
+    if Variables.frameLossDeltaThreshold != 0:
+        Variables.trafficStatDeltaObj.thresholds = {'Lost Frames': Variables.frameLossDeltaThreshold,
+                                                    'Frames Delta': Variables.frameLossDeltaThreshold}
+    deltaRowList = Variables.trafficStatDeltaObj.poll()
     now = datetime.datetime.now()
 
     if Variables.displayMaxLineOutputFlag == 0:
         if Variables.monitorTrafficColumnNames == Variables.displayMaxLineOutput:
             Variables.monitorTrafficColumnNames = 0
 
-            try:
+            if 'Lost Frames' in Variables.trafficStatDeltaObj.columnNames:
                 # This is for Advance Sequence Checking enabled
-                lostFrames = stats[1]['Lost Frames']
                 statisticTopLine = '\n{0:10} {1:17} {2:15} {3:15} {4:15} {5:15} {6:15} {7:12} {8:10}'.format(
                     'Time', 'TrafficItemName', 'TxRate', 'RxRate', 'TxFrames', 'RxFrames', 'LossDur(ms)', 'LossFrames', 'LossThreshold' )
-            except:
+            else:
                 # This is Advance Sequence Checking disabled
-                deltaLoss = stats[1]['Frames Delta']
                 statisticTopLine = '\n{0:10} {1:17} {2:15} {3:15} {4:15} {5:15} {6:15} {7:12} {8:10}'.format(
                     'Time', 'TrafficItemName', 'TxRate', 'RxRate', 'TxFrames', 'RxFrames', 'LossDur(ms)', 'LossDelta', 'LossThreshold' )
 
@@ -248,13 +253,14 @@ def monitorTraffic():
         if Variables.displayMaxLineOutputFlag == 1 and Variables.monitorTrafficColumnNames == Variables.displayMaxLineOutput:
             Variables.displayMaxLineOutputFlag = 0
 
-    for trafficItemStats,values in stats.items():
+    for deltaRow in deltaRowList:
+        values = deltaRow['values']
         if values['Traffic Item'] in Variables.trafficItemsToMonitor:
             trafficItemName = values['Traffic Item']
-            txRate = values['Tx Frame Rate']
-            rxRate = values['Rx Frame Rate']
-            txFrames = values['Tx Frames']
-            rxFrames = values['Rx Frames']
+            txRate = str(values['Tx Frame Rate'])
+            rxRate = str(values['Rx Frame Rate'])
+            txFrames = str(values['Tx Frames'])
+            rxFrames = str(values['Rx Frames'])
             #lossPct = values['Loss %']
             try:
                 framesLost = values['Lost Frames']
@@ -262,7 +268,7 @@ def monitorTraffic():
                 framesLost = values['Frames Delta']
             
             try:
-                pktLossDuration = values['Packet Loss Duration (ms)']
+                pktLossDuration = str(values['Packet Loss Duration (ms)'])
             except:
                 pktLossDuration = 'NotEnabled'
 
@@ -286,7 +292,7 @@ def monitorTraffic():
                 txFrames,
                 rxFrames,
                 pktLossDuration,
-                framesLost,
+                str(framesLost),
                 str(Variables.frameLossDeltaThreshold).strip()
                 )
             print(statistics)
@@ -298,7 +304,7 @@ def monitorTraffic():
                 #with open(trafficItemName+'.stats', 'a') as statFile:
                 #    statFile.write(statistics+'\n')
             if Variables.frameLossDeltaThreshold != 0:
-                if int(framesLost) >= Variables.frameLossDeltaThreshold:
+                if deltaRow['crossedThresholds'] or int(framesLost) >= Variables.frameLossDeltaThreshold:
                     if Variables.sendEmailAlertOnceFlag[trafficItemName] == 0:
                         Variables.sendEmailAlertOnceFlag[trafficItemName] = 1
                         bodyMessage = '\nThe Traffic Item reached the frame loss threshold: {0}'.format(
@@ -42,6 +42,9 @@ import os, sys, re, requests, json, time, traceback, platform, readline
 from requests.exceptions import ConnectionError
 from requests.packages.urllib3.connection import HTTPConnection
 
+sys.path.insert(0, (os.path.dirname(os.path.abspath(__file__).replace('Utilities', 'Modules'))))
+from IxNetRestApiTransport import Transport
+
 class IxNetRestApiException(Exception): pass
 
 class IxVmChassisBuilder(object):
@@ -50,6 +53,8 @@ class IxVmChassisBuilder(object):
         self.sessionId = None
         self.httpHeader = None
         self.jsonHeader = {"content-type": "application/json"}
+        # Keep the connections open and retry on connection resets.
+        self._session = Transport.getSharedSession()
         self.getSessionUrl(serverIp, serverPort)
 
     def get(self, restApi, data={}, stream=False, silentMode=False, ignoreError=False):
@@ -68,7 +73,7 @@ class IxVmChassisBuilder(object):
             print('HEADERS:', self.jsonHeader)
 
         try:
-            response = requests.get(restApi, headers=self.jsonHeader)
+            response = self._session.get(restApi, headers=self.jsonHeader)
 
             if silentMode is False:
                 print('STATUS CODE:', response.status_code)
@@ -106,7 +111,7 @@ class IxVmChassisBuilder(object):
             print('HEADERS:', self.jsonHeader)
 
         try:
-            response = requests.post(restApi, data=data, headers=self.jsonHeader)
+            response = self._session.post(restApi, data=data, headers=self.jsonHeader)
             # 200 or 201
             if silentMode == False:
                 print('STATUS CODE:', response.status_code)
@@ -134,7 +139,7 @@ class IxVmChassisBuilder(object):
             print('DATA:', data)
             print('HEADERS:', self.jsonHeader)
         try:
-            response = requests.patch(restApi, data=json.dumps(data), headers=self.jsonHeader)
+            response = self._session.patch(restApi, data=json.dumps(data), headers=self.jsonHeader)
             if silentMode == False:
                 print('STATUS CODE:', response.status_code)
             if not re.match('2[0-9][0-9]', str(response.status_code)):
@@ -163,7 +168,7 @@ class IxVmChassisBuilder(object):
         print('DATA:', data)
         print('HEADERS:', self.jsonHeader)
         try:
-            response = requests.delete(restApi, data=json.dumps(data), headers=self.jsonHeader)
+            response = self._session.delete(restApi, data=json.dumps(data), headers=self.jsonHeader)
             print('STATUS CODE:', response.status_code)
             if not re.match('2[0-9][0-9]', str(response.status_code)):
                 raise IxNetRestApiException('http DELETE error: {0}\n'.format(response.text))
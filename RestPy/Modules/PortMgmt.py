@@ -4,28 +4,31 @@ class Ports(object):
     def __init__(self, ixNetworkObject):
         self.ixNetObj = ixNetworkObject
 
-    def connectToChassis(self,ixChassisIpList):
+    def connectToChassis(self, ixChassisIpList, timeout=45):
         """
         Connect to one or more chassis and wait until all chassis's are connected and ready.
+        All the chassis are added first so that they connect concurrently and then they are
+        waited on together. The wait time is the slowest chassis instead of the sum of all the chassis.
 
         :param ixChassisIpList: <list>: One or more chassis IP address in a list.
+        :param timeout: <int>: The seconds to wait for all the chassis to be ready.
         """
-        counterStop = 45
-        for ixChassisIp in ixChassisIpList:
-            for counter in range(1, counterStop+1):
-                #chassisStatus = self.ixNetObj.AvailableHardware.add_Chassis(Hostname=ixChassisIp)
-                chassisStatus = self.ixNetObj.AvailableHardware.Chassis.add(Hostname=ixChassisIp)
-                if counter < counterStop and chassisStatus.State != 'ready':
-                    print('\nChassis {0} is not connected yet. Waiting {1}/{2} seconds'.format(ixChassisIp,
-                                                                                               counter, counterStop))
-                    time.sleep(1)
-
-                if counter < counterStop and chassisStatus.State == 'ready':
-                    print('\n{0}'.format(chassisStatus))
-                    break
-
-                if counter == counterStop:
-                    raise Exception('\nFailed to connect to chassis: {0}'.format(ixChassisIp[0]))
+        chassisObjList = [self.ixNetObj.AvailableHardware.Chassis.add(Hostname=ixChassisIp)
+                          for ixChassisIp in ixChassisIpList]
+
+        for counter in range(1, timeout+1):
+            # One GET returns the state of all the chassis.
+            chassisStates = dict([(chassis.Hostname, chassis.State) for chassis in self.ixNetObj.AvailableHardware.Chassis.find()])
+            notReadyList = [ixChassisIp for ixChassisIp in ixChassisIpList if chassisStates.get(ixChassisIp) != 'ready']
+            if notReadyList == []:
+                for chassisObj in chassisObjList:
+                    print('\n{0}'.format(chassisObj))
+                return
+
+            print('\nChassis {0} are not connected yet. Waiting {1}/{2} seconds'.format(notReadyList, counter, timeout))
+            time.sleep(1)
+
+        raise Exception('\nFailed to connect to chassis: {0}'.format(notReadyList))
 
     def arePortsAvailable(self, portList, raiseException=False):
         """